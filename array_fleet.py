@@ -0,0 +1,420 @@
+"""
+Module: NumPy-backed enemy fleet that stores the formation as arrays.
+
+Assets:
+- Uses ememyShip.png through the shared asset cache (see asset_cache.py)
+"""
+
+import math
+import functools
+import numpy as np
+import pygame
+from enemy_fleet import _formation_layout, STATE_HEADER
+from spatial_grid import ArrayGrid
+from formation_surface import FormationSurface
+
+def _formation_array(settings, enemy_w: int, enemy_h: int) -> np.ndarray:
+    """
+    Return formation_layout as a shared, read-only (n, 2) int64 array.
+    """
+    return _layout_array(
+        settings.screen_w, settings.screen_h, enemy_w, enemy_h,
+        settings.fleet_cols, settings.fleet_rows
+    )
+
+@functools.lru_cache(maxsize=32)
+def _layout_array(screen_w: int, screen_h: int, enemy_w: int, enemy_h: int,
+                  fleet_cols, fleet_rows) -> np.ndarray:
+    """
+    Build the array for _formation_array (cached).
+    """
+    layout = _formation_layout(
+        screen_w, screen_h, enemy_w, enemy_h, fleet_cols, fleet_rows
+    )
+    positions = np.array(layout, dtype=np.int64).reshape(-1, 2)
+    positions.flags.writeable = False
+    return positions
+
+class ArrayEnemy:
+    """
+    Lightweight stand-in for an EnemyShip at one index of an ArrayEnemyFleet.
+
+    Only created when something needs a per-enemy object (collision results,
+    pygame.sprite helpers). Exposes rect and kill() like a Sprite.
+    """
+    __slots__ = ('fleet', 'index', 'rect')
+
+    def __init__(self, fleet: 'ArrayEnemyFleet', index: int) -> None:
+        """
+        Bind the proxy to a fleet slot and snapshot its current rect.
+        """
+        self.fleet = fleet
+        self.index = index
+        self.rect  = pygame.Rect(
+            int(fleet.ix[index]), int(fleet.ys[index]),
+            fleet.enemy_w, fleet.enemy_h
+        )
+
+    @property
+    def x(self) -> float:
+        """
+        Precise horizontal coordinate of this enemy.
+        """
+        return float(self.fleet.xs[self.index])
+
+    def alive(self) -> bool:
+        """
+        Return True while the enemy is still part of the fleet.
+        """
+        return bool(self.fleet.alive[self.index])
+
+    def kill(self) -> None:
+        """
+        Remove this enemy from the fleet.
+        """
+        self.fleet.kill(self.index)
+
+class ArrayFleetGroup:
+    """
+    Group-like view over an ArrayEnemyFleet.
+
+    Supports the parts of pygame.sprite.Group that the game relies on:
+    sprites(), empty(), len() and truthiness, so it can be passed to
+    pygame.sprite.groupcollide and iterated like EnemyFleet.fleet.
+    """
+    def __init__(self, fleet: 'ArrayEnemyFleet') -> None:
+        """
+        Wrap the owning fleet.
+        """
+        self._fleet = fleet
+
+    def sprites(self) -> list:
+        """
+        Return an ArrayEnemy proxy for every living (active) enemy.
+        """
+        fleet = self._fleet
+        return [ArrayEnemy(fleet, i) for i in fleet.living().tolist()]
+
+    def empty(self) -> None:
+        """
+        Remove every enemy from the fleet.
+        """
+        self._fleet.alive[:] = False
+        self._fleet.count = 0
+
+    def __iter__(self):
+        return iter(self.sprites())
+
+    def __len__(self) -> int:
+        return self._fleet.count
+
+    def __bool__(self) -> bool:
+        return self._fleet.count > 0
+
+class ArrayEnemyFleet:
+    """
+    Enemy fleet kept as a structure of arrays instead of one Sprite per enemy.
+
+    Positions, per-enemy velocity multipliers and alive flags live in
+    contiguous NumPy arrays, and update() moves the whole formation in a
+    single vectorized step. The public surface (create_fleet, update, draw
+    and fleet) matches EnemyFleet, so AlienInvasion can use either backend.
+
+    Attributes:
+        xs (ndarray): Precise horizontal coordinates (float64).
+        ix (ndarray): Integer (drawn) horizontal coordinates (int64).
+        ys (ndarray): Vertical coordinates (int64).
+        vx (ndarray): Per-enemy multiplier applied to settings.enemy_speed.
+        alive (ndarray): Boolean alive flags.
+        count (int): Number of living enemies.
+        fleet (ArrayFleetGroup): Group-like view over the living enemies.
+        grid (ArrayGrid): Broad-phase index keyed by enemy index, in the
+                          positions the enemies had when it was built.
+    """
+    def __init__(self, game) -> None:
+        """
+        Fetch the shared enemy image and build the initial formation.
+        """
+        self.game     = game
+        self.settings = game.settings
+        self.screen   = game.screen
+        self.enemy_w  = self.settings.enemy_w
+        self.enemy_h  = self.settings.enemy_h
+        self.image    = game.assets.image(
+            self.settings.enemy_file, (self.enemy_w, self.enemy_h)
+        )
+        self.fleet    = ArrayFleetGroup(self)
+        self.grid     = ArrayGrid(self.enemy_w * 2, self.enemy_h * 2)
+        self.alive    = None
+        self.create_fleet()
+
+    def create_fleet(self) -> None:
+        """
+        Fill the position arrays from the formation layout and index them.
+
+        Arrays from the previous wave are refilled in place when the
+        formation size is unchanged.
+        """
+        positions = _formation_array(self.settings, self.enemy_w, self.enemy_h)
+        n = len(positions)
+        if self.alive is None or len(self.alive) != n:
+            self.xs    = np.empty(n, dtype=np.float64)
+            self.ix    = np.empty(n, dtype=np.int64)
+            self.ys    = np.empty(n, dtype=np.int64)
+            self.vx    = np.empty(n, dtype=np.float64)
+            self.alive = np.empty(n, dtype=bool)
+        self.xs[:]    = positions[:, 0]
+        self.ix[:]    = positions[:, 0]
+        self.ys[:]    = positions[:, 1]
+        self.vx[:]    = 1.0
+        self.alive[:] = True
+        self.count = n
+        self._build_grid()
+        self._build_composite()
+
+    def _build_composite(self, shift: float = 0.0) -> None:
+        """
+        Pre-composite the formation into one surface if settings ask for it.
+
+        Only done when every enemy moves at the same speed. While composited
+        the formation moves rigidly: every enemy is drawn and collided at its
+        start x plus one shared whole-pixel shift. A restored fleet passes
+        the shift it had already moved; only living enemies are composited.
+        """
+        self.composite = None
+        self.shift     = 0.0
+        if not self.settings.fleet_composite or not self.count:
+            return
+        if not np.all(self.vx == self.vx[0]):
+            return
+        composite = FormationSurface(self.image, self.settings.formation_max_pixels)
+        x0 = self.ix - math.floor(shift)
+        living = self.living()
+        if composite.build(zip(x0[living].tolist(), self.ys[living].tolist())):
+            self.composite = composite
+            self.shift     = shift
+            self._composite_x0    = x0
+            self._composite_alive = self.alive.copy()
+
+    def _build_grid(self) -> None:
+        """
+        Index every living enemy at its current position, in one NumPy pass.
+        """
+        living = self.living()
+        self.grid.build(
+            living, self.ix[living], self.ys[living], self.enemy_w, self.enemy_h
+        )
+        self._grid_x = self.ix.copy()
+        self._drift  = (0, 0)
+
+    def _sync_grid(self) -> None:
+        """
+        Track how far the enemies moved since the grid was built.
+
+        The formation moves as one block, so instead of re-bucketing every
+        enemy as it crosses a cell column, queries are shifted back by the
+        range of that drift (see _query). Enemies drift apart by at most a
+        pixel of rounding; if they ever spread over a whole cell the grid is
+        rebuilt.
+        """
+        drift = self.ix - self._grid_x
+        low, high = int(drift.min()), int(drift.max())
+        if high - low >= self.grid.cell_w:
+            self._build_grid()
+        else:
+            self._drift = (low, high)
+
+    def _indexed(self, keys: set) -> list:
+        """
+        Return the keys from a grid query that are living enemies, ascending.
+        """
+        alive = self.alive
+        return [key for key in sorted(keys) if alive[key]]
+
+    def _query(self, left=None, top=None, right=None, bottom=None) -> list:
+        """
+        Return candidate living enemies whose cells overlap the pixel bounds.
+
+        right and bottom are inclusive; None is unbounded.
+        """
+        low, high = self._drift
+        keys = self.grid.query_bounds(
+            None if left is None else left - high, top,
+            None if right is None else right - low, bottom
+        )
+        return self._indexed(keys)
+
+    def _query_rect(self, rect) -> list:
+        """
+        Return candidate living enemies whose cells overlap rect.
+        """
+        x, y, w, h = rect
+        low, high = self._drift
+        return self._indexed(
+            self.grid.query(x - high, y, x + max(w, 1) - 1 - low, y + max(h, 1) - 1)
+        )
+
+    def update(self) -> None:
+        """
+        Move every enemy toward the ship's side in one vectorized step.
+        """
+        direction = 1 if self.game.ship.side == 'right' else -1
+        if self.composite is not None:
+            self.shift += self.settings.enemy_speed * direction * self.vx[0]
+            self.xs = self._composite_x0 + self.shift
+            self.ix = self._composite_x0 + math.floor(self.shift)
+        else:
+            self.xs += self.vx * (self.settings.enemy_speed * direction)
+            self.ix = self.xs.astype(np.int64)
+        self._sync_grid()
+
+    def kill(self, index: int) -> None:
+        """
+        Mark the enemy at index as destroyed.
+        """
+        if self.alive[index]:
+            self.alive[index] = False
+            self.count -= 1
+
+    def _enemy_rect(self, index: int) -> tuple:
+        """
+        Return the (x, y, w, h) of the enemy at index.
+        """
+        return (int(self.ix[index]), int(self.ys[index]), self.enemy_w, self.enemy_h)
+
+    def collide_bullets(self, bullets, dokill: bool = True) -> dict:
+        """
+        Find bullet hits using the grid as a broad phase.
+
+        Returns the same mapping as pygame.sprite.groupcollide(fleet, bullets,
+        dokill, dokill): each hit enemy (as an ArrayEnemy) -> list of bullets,
+        with enemies in index order and a bullet listed under every enemy it
+        touches.
+        """
+        query = self.grid.query
+        indexed = self._indexed
+        low, high = self._drift
+        enemy_rect = self._enemy_rect
+        hit_bullets = {}
+        for bullet in bullets.sprites():
+            rect = bullet.rect
+            candidates = query(rect.x - high, rect.y, rect.right - 1 - low, rect.bottom - 1)
+            if not candidates:
+                continue
+            for index in indexed(candidates):
+                if rect.colliderect(enemy_rect(index)):
+                    hit_bullets.setdefault(index, []).append(bullet)
+        hits = {ArrayEnemy(self, index): hit_bullets[index] for index in sorted(hit_bullets)}
+        if dokill:
+            for enemy, hit in hits.items():
+                self.kill(enemy.index)
+                for bullet in hit:
+                    bullet.kill()
+        return hits
+
+    def check_ship_hit(self, ship_rect, screen_w: int) -> bool:
+        """
+        Return True if an enemy touches the ship or reaches the right edge.
+        """
+        enemy_rect = self._enemy_rect
+        for index in self._query_rect(ship_rect):
+            if ship_rect.colliderect(enemy_rect(index)):
+                return True
+        for index in self._query(left=screen_w - 1):
+            if int(self.ix[index]) + self.enemy_w >= screen_w:
+                return True
+        return False
+
+    def living(self) -> np.ndarray:
+        """
+        Return the indices of the living enemies that take part in the frame.
+        """
+        return np.flatnonzero(self.alive)
+
+    def positions(self) -> tuple:
+        """
+        Return integer (xs, ys) arrays for the living enemies.
+        """
+        living = self.living()
+        return self.ix[living], self.ys[living]
+
+    def state(self) -> tuple:
+        """
+        Return (xs, ys, alive) arrays for every slot of the current wave.
+
+        Slots keep their index for the whole wave, dead or alive.
+        """
+        return (
+            self.ix.astype(np.int32), self.ys.astype(np.int32), self.alive.copy()
+        )
+
+    def save_state(self) -> bytes:
+        """
+        Pack the position, velocity and alive arrays.
+        """
+        return (STATE_HEADER.pack(len(self.alive), self.shift) + self.xs.tobytes()
+                + self.vx.tobytes() + self.ix.astype(np.int32).tobytes()
+                + self.ys.astype(np.int32).tobytes() + self.alive.tobytes())
+
+    def load_state(self, data: bytes) -> None:
+        """
+        Refill the arrays as save_state() packed them and re-index the grid.
+        """
+        n, shift = STATE_HEADER.unpack_from(data)
+        offset = STATE_HEADER.size
+        if self.alive is None or len(self.alive) != n:
+            self.xs    = np.empty(n, dtype=np.float64)
+            self.ix    = np.empty(n, dtype=np.int64)
+            self.ys    = np.empty(n, dtype=np.int64)
+            self.vx    = np.empty(n, dtype=np.float64)
+            self.alive = np.empty(n, dtype=bool)
+        self.xs[:]    = np.frombuffer(data, np.float64, n, offset)
+        self.vx[:]    = np.frombuffer(data, np.float64, n, offset + 8 * n)
+        self.ix[:]    = np.frombuffer(data, np.int32, n, offset + 16 * n)
+        self.ys[:]    = np.frombuffer(data, np.int32, n, offset + 20 * n)
+        self.alive[:] = np.frombuffer(data, bool, n, offset + 24 * n)
+        self.count = int(np.count_nonzero(self.alive))
+        self._build_grid()
+        self._build_composite(shift)
+
+    def rects(self) -> list:
+        """
+        Return a Rect for every living enemy.
+        """
+        w, h = self.enemy_w, self.enemy_h
+        xs, ys = self.positions()
+        return [pygame.Rect(x, y, w, h) for x, y in zip(xs.tolist(), ys.tolist())]
+
+    def _draw_composite(self) -> None:
+        """
+        Patch out destroyed enemies, then blit the formation once.
+        """
+        gone = np.flatnonzero(self._composite_alive & ~self.alive)
+        for i in gone.tolist():
+            self.composite.erase(int(self._composite_x0[i]), int(self.ys[i]))
+        self._composite_alive[gone] = False
+        if not self.count:
+            return
+        direction = 1 if self.game.ship.side == 'right' else -1
+        dx = self.game.render_offset(self.settings.enemy_speed * direction * self.vx[0])
+        self.composite.draw(self.screen, math.floor(self.shift) + dx)
+
+    def draw(self) -> None:
+        """
+        Draw all living enemies with one composite blit or one blits call.
+        """
+        if self.composite is not None:
+            self._draw_composite()
+            return
+        image = self.image
+        living = self.living()
+        xs, ys = self.ix[living], self.ys[living]
+        alpha = self.game.render_alpha
+        if alpha < 1.0:
+            direction = 1 if self.game.ship.side == 'right' else -1
+            step = self.vx[living] * (self.settings.enemy_speed * direction)
+            xs = xs + np.rint((alpha - 1.0) * step).astype(np.int64)
+        self.screen.blits(
+            [(image, pos) for pos in zip(xs.tolist(), ys.tolist())],
+            False
+        )
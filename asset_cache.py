@@ -0,0 +1,203 @@
+"""
+Module: shared cache of display-converted sprite surfaces.
+
+Assets:
+- Loads any image or sound path handed to it (see settings.py for the file list)
+- Assets/build/index.json, atlas.png, pre-scaled images and pre-decoded
+  sounds when built (see build_assets.py)
+"""
+
+import json
+from pathlib import Path
+import pygame
+
+INDEX_VERSION = 1
+
+def source_stamp(path) -> list:
+    """
+    Return [size, mtime_ns] for a source file, used to detect stale builds.
+    """
+    stat = Path(path).stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+class AssetCache:
+    """
+    Load each image from disk once and hand out shared, display-converted Surfaces.
+
+    Surfaces are keyed by (path, size, rotation, opaque). The first request
+    for a key decodes the file (if it has not been decoded yet), scales and
+    rotates it, then runs convert_alpha() (or convert() for opaque images) so
+    later blits do not pay for pixel-format conversion. Every Surface
+    returned is shared, so callers must treat it as read-only.
+
+    When a build directory from build_assets.py is given and still matches
+    its source files, keys it covers are served without touching the
+    sources: sprites as subsurfaces of one atlas image loaded once, and
+    opaque images from pre-scaled files. Anything else falls back to the
+    path above. Sounds are decoded once per path in the same way, or read
+    as raw PCM from the build when it was decoded in the mixer's format.
+
+    Attributes:
+        hits (int): Requests served from the cache.
+        misses (int): Requests that had to build a new Surface.
+        disk_loads (int): Number of times an image file was read from disk.
+        built (int): Misses served from the asset build (images and sounds).
+    """
+    def __init__(self, build_dir=None) -> None:
+        """
+        Start with an empty cache and zeroed counters.
+
+        Args:
+            build_dir (Path, optional): Output directory of build_assets.py.
+        """
+        self._surfaces = {}
+        self._decoded  = {}
+        self._sounds   = {}
+        self.hits       = 0
+        self.misses     = 0
+        self.disk_loads = 0
+        self.built      = 0
+        self._build_dir = None
+        self._atlas     = None
+        self._built     = {}
+        self._built_sounds = {}
+        if build_dir:
+            self._load_index(Path(build_dir))
+
+    def _load_index(self, build_dir: Path) -> None:
+        """
+        Read the build index, ignoring it if missing or stale.
+        """
+        try:
+            index = json.loads((build_dir / 'index.json').read_text())
+        except (OSError, ValueError):
+            return
+        if index.get('version') != INDEX_VERSION:
+            return
+        root = build_dir.parent
+        try:
+            for rel, stamp in index['sources'].items():
+                if source_stamp(root / rel) != stamp:
+                    return
+        except OSError:
+            return
+        for entry in index['entries']:
+            key = (
+                str(root / entry['path']),
+                tuple(entry['size']) if entry['size'] else None,
+                entry['rotation'],
+                entry['opaque'],
+            )
+            self._built[key] = entry
+        for entry in index.get('sounds', []):
+            self._built_sounds[str(root / entry['path'])] = entry
+        self._build_dir = build_dir
+        self._atlas_file = index['atlas']
+
+    def image(self, path, size=None, rotation=0, opaque=False) -> pygame.Surface:
+        """
+        Return the shared Surface for path scaled to size and rotated by rotation.
+
+        Args:
+            path: Image file path (str or Path).
+            size (tuple, optional): (w, h) to scale to before rotating.
+            rotation (int): Degrees counter-clockwise, as pygame.transform.rotate.
+            opaque (bool): Convert without per-pixel alpha (faster full-screen blits).
+        """
+        key = (str(path), tuple(size) if size else None, rotation, opaque)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        entry = self._built.get(key)
+        if entry is not None:
+            surface = self._from_build(entry)
+            self._surfaces[key] = surface
+            self.built += 1
+            return surface
+
+        surface = self._decode(key[0])
+        if size:
+            surface = pygame.transform.scale(surface, key[1])
+        if rotation:
+            surface = pygame.transform.rotate(surface, rotation)
+        surface = surface.convert() if opaque else surface.convert_alpha()
+        self._surfaces[key] = surface
+        return surface
+
+    def _from_build(self, entry: dict) -> pygame.Surface:
+        """
+        Cut a sprite out of the atlas, or load a pre-scaled opaque image.
+        """
+        if 'file' in entry:
+            surface = pygame.image.load(str(self._build_dir / entry['file']))
+            self.disk_loads += 1
+            return surface.convert()
+        if self._atlas is None:
+            atlas = pygame.image.load(str(self._build_dir / self._atlas_file))
+            self.disk_loads += 1
+            self._atlas = atlas.convert_alpha()
+        return self._atlas.subsurface(entry['rect'])
+
+    def sound(self, path) -> pygame.mixer.Sound:
+        """
+        Return the shared, decoded Sound for path (the mixer must be initialized).
+        """
+        key = str(path)
+        sound = self._sounds.get(key)
+        if sound is not None:
+            self.hits += 1
+            return sound
+
+        self.misses += 1
+        entry = self._built_sounds.get(key)
+        if entry is not None and tuple(entry['format']) == pygame.mixer.get_init():
+            sound = pygame.mixer.Sound(
+                buffer=(self._build_dir / entry['file']).read_bytes()
+            )
+            self.built += 1
+        else:
+            sound = pygame.mixer.Sound(key)
+        self.disk_loads += 1
+        self._sounds[key] = sound
+        return sound
+
+    def entries(self) -> list:
+        """
+        Return ((path, size, rotation, opaque), Surface) for every cached key.
+        """
+        return list(self._surfaces.items())
+
+    def _decode(self, path: str) -> pygame.Surface:
+        """
+        Read an image file from disk once and keep the raw Surface.
+        """
+        raw = self._decoded.get(path)
+        if raw is None:
+            raw = pygame.image.load(path)
+            self.disk_loads += 1
+            self._decoded[path] = raw
+        return raw
+
+    def stats(self) -> dict:
+        """
+        Return the cache counters as a dict.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'disk_loads': self.disk_loads,
+            'built': self.built,
+            'entries': len(self._surfaces),
+        }
+
+    def clear(self) -> None:
+        """
+        Drop every cached Surface (e.g. after the display mode changes).
+        """
+        self._surfaces.clear()
+        self._decoded.clear()
+        self._sounds.clear()
+        self._atlas = None
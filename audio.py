@@ -0,0 +1,119 @@
+"""
+Module: sound effects played from preloaded clips on fixed channel pools.
+
+Assets:
+- Assets/sound/laser.mp3 and impactSound.mp3 (see settings.py), decoded
+  once through the asset cache or loaded as pre-decoded PCM from the
+  asset build (see build_assets.py)
+"""
+
+import pygame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import AlienInvasion
+
+class NullAudio:
+    """
+    Silent stand-in with the AudioEngine interface.
+
+    Used for headless runs (simulation, replays, benchmarks, training
+    environments), when sound is turned off, or when no mixer is available.
+
+    Attributes:
+        played (int): Always 0.
+        stolen (int): Always 0.
+    """
+    played = 0
+    stolen = 0
+
+    def play(self, name: str) -> None:
+        """
+        Do nothing.
+        """
+
+    def stop(self) -> None:
+        """
+        Do nothing.
+        """
+
+class AudioEngine:
+    """
+    Play named clips on a fixed pool of mixer channels per clip.
+
+    Every clip in settings.sound_files is decoded once at startup. Clip
+    `name` owns settings.sound_voices[name] reserved channels, so however
+    fast the player fires, no more than that many copies of it play at once
+    and one clip can never take another's channels. play() uses an idle
+    channel of the clip's pool if there is one, otherwise it steals the
+    channel that started longest ago. Channel.play() only queues the sound
+    for SDL's audio thread, so play() never blocks the game loop.
+
+    Attributes:
+        sounds (dict): Clip name -> pygame.mixer.Sound.
+        played (int): Clips started.
+        stolen (int): Clips started by cutting off an older voice.
+    """
+    def __init__(self, game: 'AlienInvasion') -> None:
+        """
+        Load every clip and reserve its channels.
+        """
+        settings     = game.settings
+        self.sounds  = {}
+        self._pools  = {}
+        self.played  = 0
+        self.stolen  = 0
+
+        total = sum(settings.sound_voices.get(name, 1) for name in settings.sound_files)
+        pygame.mixer.set_num_channels(max(total, pygame.mixer.get_num_channels()))
+        pygame.mixer.set_reserved(total)
+        first = 0
+        for name, path in settings.sound_files.items():
+            sound = game.assets.sound(path)
+            sound.set_volume(settings.sound_volume)
+            voices = settings.sound_voices.get(name, 1)
+            self.sounds[name] = sound
+            # [channels, start order of each channel, next start number]
+            self._pools[name] = [
+                [pygame.mixer.Channel(i) for i in range(first, first + voices)],
+                [0] * voices,
+                1,
+            ]
+            first += voices
+
+    def play(self, name: str) -> None:
+        """
+        Start clip name on an idle channel of its pool, or steal the oldest.
+        """
+        pool = self._pools[name]
+        channels, started, count = pool
+        slot = None
+        for i, channel in enumerate(channels):
+            if not channel.get_busy():
+                slot = i
+                break
+        if slot is None:
+            slot = started.index(min(started))
+            self.stolen += 1
+        channels[slot].play(self.sounds[name])
+        started[slot] = count
+        pool[2] = count + 1
+        self.played += 1
+
+    def stop(self) -> None:
+        """
+        Silence every channel.
+        """
+        pygame.mixer.stop()
+
+def open_audio(game: 'AlienInvasion'):
+    """
+    Return an AudioEngine, or NullAudio when headless, muted or without a mixer.
+    """
+    if game.headless or not game.settings.sound or not pygame.mixer.get_init():
+        return NullAudio()
+    try:
+        return AudioEngine(game)
+    except pygame.error as e:
+        print(f"Sound disabled: {e}")
+        return NullAudio()
@@ -0,0 +1,6 @@
+"""
+Package: headless performance benchmarks for Alien Invasion.
+
+Assets:
+- None (benchmarks build game objects through the normal constructors)
+"""
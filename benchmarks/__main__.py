@@ -0,0 +1,62 @@
+"""
+Module: command-line entry point for the benchmark suite.
+
+Run from the project root:
+    python -m benchmarks [--filter fleet] [--output results.json]
+                         [--baseline old.json] [--threshold 0.1]
+
+Exits with status 1 when any case is slower than the baseline by more than
+the threshold.
+
+Assets:
+- None
+"""
+
+import argparse
+import sys
+from benchmarks.cases import CASES
+from benchmarks.harness import measure, save_results, load_results, compare
+
+def run(name_filter: str = '', repeat: int = 5) -> dict:
+    """
+    Run every registered case whose name contains name_filter.
+
+    Cases yield (name, fn) or (name, fn, setup); see harness.measure.
+    """
+    results = {}
+    for generate in CASES:
+        for name, fn, *setup in generate():
+            if name_filter not in name:
+                continue
+            results[name] = measure(fn, repeat=repeat, setup=setup[0] if setup else None)
+            print(f"{name:<40} {results[name]['median_ms']:>10.4f} ms", flush=True)
+    return results
+
+def main(argv=None) -> int:
+    """
+    Parse arguments, run the suite, save and compare results.
+    """
+    parser = argparse.ArgumentParser(description='Alien Invasion benchmarks')
+    parser.add_argument('--filter', default='', help='only run cases containing this text')
+    parser.add_argument('--repeat', type=int, default=5, help='samples per case')
+    parser.add_argument('--output', help='write JSON results to this file')
+    parser.add_argument('--baseline', help='JSON results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='allowed slowdown vs baseline (0.10 = 10%%)')
+    args = parser.parse_args(argv)
+
+    results = run(args.filter, args.repeat)
+    if args.output:
+        save_results(args.output, results)
+    if not args.baseline:
+        return 0
+
+    regressions = compare(load_results(args.baseline), results, args.threshold)
+    for case, base_ms, new_ms, ratio in regressions:
+        print(f"REGRESSION {case}: {base_ms:.4f} ms -> {new_ms:.4f} ms ({ratio:.2f}x)")
+    if not regressions:
+        print(f"no regressions beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,295 @@
+"""
+Module: benchmark cases for the update, collision and draw paths.
+
+Assets:
+- None (builds headless games through benchmarks.harness)
+"""
+
+import random
+import pygame
+from benchmarks.harness import build_game
+from benchmarks.collision import spray_bullets
+from leaderboard import ScoreStore
+import snapshot
+
+BACKENDS      = ('sprite', 'array')
+SCREEN_SIZES  = ((800, 600), (1200, 800), (1920, 1080), (3840, 2160))
+ENEMY_COUNTS  = (30, 300, 1000, 10000)
+COLLIDE_SIZES = ((10, 30), (100, 300), (100, 3000), (1000, 3000))
+FLEET_COLS    = 5
+SCORE_ROWS    = (1000, 100000)
+FLEET_SWING   = 256  # updates between turns of an oscillating fleet
+WAVE_SIZES    = (2000, 20000, 200000)
+PARTICLE_COUNTS = (1000, 10000, 50000)
+
+CASES = []
+
+def case(func):
+    """
+    Register a generator of (name, callable) benchmark cases.
+    """
+    CASES.append(func)
+    return func
+
+def _fleet_game(backend: str, enemies: int, **overrides):
+    """
+    Build a headless game whose fleet holds about `enemies` ships.
+    """
+    return build_game(
+        fleet_backend=backend,
+        fleet_cols=FLEET_COLS,
+        fleet_rows=max(1, enemies // FLEET_COLS),
+        **overrides
+    )
+
+def _pinned(game):
+    """
+    Return a setup that puts game back into its current state (see snapshot.py).
+    """
+    data = snapshot.save(game)
+    return lambda: snapshot.restore(game, data)
+
+def _swinging(game):
+    """
+    Return (update, setup) for a fleet that never drifts out of place.
+
+    update() moves the fleet, turning it around every FLEET_SWING calls so
+    it swings back and forth; setup() restores the starting state. However
+    many calls a sample makes, the fleet stays within FLEET_SWING updates
+    of where it started.
+    """
+    restore = _pinned(game)
+    ship, fleet = game.ship, game.enemy_fleet
+    calls = [0]
+
+    def update():
+        calls[0] += 1
+        if calls[0] % FLEET_SWING == 0:
+            ship.side = 'left' if ship.side == 'right' else 'right'
+        fleet.update()
+
+    def setup():
+        restore()
+        calls[0] = 0
+    return update, setup
+
+@case
+def create_fleet():
+    """
+    EnemyFleet.create_fleet at several screen sizes.
+    """
+    for backend in BACKENDS:
+        for w, h in SCREEN_SIZES:
+            game = build_game(fleet_backend=backend, screen_w=w, screen_h=h)
+            fleet = game.enemy_fleet
+
+            def rebuild(fleet=fleet):
+                fleet.fleet.empty()
+                fleet.create_fleet()
+            yield f"create_fleet[{backend},{w}x{h}]", rebuild
+
+@case
+def fleet_update_draw():
+    """
+    EnemyFleet.update and draw as the enemy count grows.
+
+    Every sample starts from the freshly created formation, and updates
+    swing the fleet back and forth, so the work measured does not depend on
+    how many calls the machine fits in a sample.
+    """
+    for backend in BACKENDS:
+        for enemies in ENEMY_COUNTS:
+            game = _fleet_game(backend, enemies)
+            game.game_active = True
+            update, setup = _swinging(game)
+            yield f"fleet_update[{backend},{enemies}]", update, setup
+            yield f"fleet_draw[{backend},{enemies}]", game.enemy_fleet.draw, setup
+            composited = _fleet_game(backend, enemies, fleet_composite=True)
+            composited.game_active = True
+            yield (
+                f"fleet_draw_composite[{backend},{enemies}]",
+                composited.enemy_fleet.draw, _pinned(composited)
+            )
+
+@case
+def massive_wave():
+    """
+    Massive-wave update, draw and collisions as the world grows.
+
+    Cost should stay flat: only the enemies near the viewport are active.
+    Every sample starts with the wave's front line at the right edge of the
+    screen (so the viewport is full of enemies at every size), and updates
+    swing the wave around that shift instead of scrolling it away.
+    """
+    for enemies in WAVE_SIZES:
+        game = build_game(fleet_backend='massive', massive_enemies=enemies)
+        game.game_active = True
+        fleet = game.enemy_fleet
+        fleet._start(float(game.settings.screen_w))
+        pool = spray_bullets(game, 100)
+        update, setup = _swinging(game)
+        yield f"massive_update[{enemies}]", update, setup
+        yield f"massive_draw[{enemies}]", fleet.draw, setup
+        yield (
+            f"massive_collide[{enemies}]",
+            lambda fleet=fleet, pool=pool: fleet.collide_bullets(pool, dokill=False),
+            setup
+        )
+
+@case
+def collisions():
+    """
+    groupcollide against the grid broad phase for N bullets x M enemies.
+    """
+    for bullets, enemies in COLLIDE_SIZES:
+        game = _fleet_game('sprite', enemies)
+        fleet = game.enemy_fleet
+        pool = spray_bullets(game, bullets)
+        yield (
+            f"groupcollide[{bullets}x{enemies}]",
+            lambda: pygame.sprite.groupcollide(fleet.fleet, pool, False, False)
+        )
+        yield (
+            f"grid_collide[{bullets}x{enemies}]",
+            lambda: fleet.collide_bullets(pool, dokill=False)
+        )
+
+@case
+def hud():
+    """
+    HUD.update_scores with a score that changes on every call.
+    """
+    game = build_game()
+    stats, hud = game.game_stats, game.hud
+
+    def churn():
+        stats.score += 50
+        stats.max_score = stats.score
+        hud.update_scores()
+    yield "hud_update_scores", churn
+
+@case
+def full_frame():
+    """
+    One frame of movement plus _update_screen, for each presentation mode
+    and for half-scale rendering (SDL-scaled and software-scaled).
+
+    Collisions are skipped so the wave never ends; the level is reset every
+    600 frames to keep the fleet on screen.
+    """
+    variants = {
+        'full': {'render_mode': 'full'},
+        'dirty': {'render_mode': 'dirty'},
+        'half': {'render_scale': 0.5},
+        'half_software': {'render_scale': 0.5, 'scaled_display': False},
+    }
+    for mode, overrides in variants.items():
+        game = build_game(**overrides)
+        game._start_game()
+        for _ in range(5):
+            game._fire_bullet()
+        frames = [0]
+
+        def frame(game=game, frames=frames):
+            frames[0] += 1
+            if frames[0] % 600 == 0:
+                game._reset_level()
+            game.enemy_fleet.update()
+            game.bullets.update()
+            game._update_screen()
+        yield f"update_screen[{mode}]", frame
+
+@case
+def particles():
+    """
+    ParticleSystem.update and draw with N live particles.
+
+    The system is refilled with explosions whenever it drops below N, so
+    each call works on about N particles.
+    """
+    for count in PARTICLE_COUNTS:
+        game = build_game(particle_cap=count)
+        system = game.particles
+        rng = random.Random(0)
+        rects = [
+            pygame.Rect(rng.randrange(game.settings.screen_w),
+                        rng.randrange(game.settings.screen_h), 40, 20)
+            for _ in range(count // game.settings.particle_burst + 1)
+        ]
+
+        def refill(system=system, rects=rects):
+            if system.count < system.limit // 2:
+                system.explode(rects)
+
+        def update(system=system, refill=refill):
+            refill()
+            system.update()
+
+        def draw(system=system, refill=refill):
+            refill()
+            system.draw()
+        yield f"particles_update[{count}]", update
+        yield f"particles_draw[{count}]", draw
+
+@case
+def snapshots():
+    """
+    snapshot.save and restore for a mid-wave game, per fleet backend and size.
+    """
+    games = [('sprite', enemies) for enemies in ENEMY_COUNTS[:3]]
+    games += [('array', enemies) for enemies in ENEMY_COUNTS]
+    games += [('massive', enemies) for enemies in WAVE_SIZES]
+    for backend, enemies in games:
+        if backend == 'massive':
+            game = build_game(fleet_backend=backend, massive_enemies=enemies)
+        else:
+            game = _fleet_game(backend, enemies)
+        game._start_game()
+        for _ in range(5):
+            game._fire_bullet()
+        for _ in range(30):
+            game.enemy_fleet.update()
+            game.bullets.update()
+        data = snapshot.save(game)
+        yield f"snapshot_save[{backend},{enemies}]", lambda game=game: snapshot.save(game)
+        yield (
+            f"snapshot_restore[{backend},{enemies}]",
+            lambda game=game, data=data: snapshot.restore(game, data)
+        )
+
+@case
+def startup():
+    """
+    AlienInvasion construction with and without the asset build.
+
+    Run python build_assets.py first; without a build both cases load from
+    the source files. Decoded files are not kept between games, so each call
+    reads its images again (from the OS file cache).
+    """
+    def start(**overrides):
+        build_game(**overrides).game_stats.leaderboard.close()
+    yield "startup[build]", start
+    yield "startup[sources]", lambda: start(asset_build_dir=None)
+
+@case
+def leaderboard():
+    """
+    Indexed top-N and personal-best queries on in-memory score stores.
+    """
+    for rows in SCORE_ROWS:
+        rng = random.Random(0)
+        store = ScoreStore(':memory:')
+        store.add_many(
+            (f"p{rng.randrange(500)}", rng.randrange(100000), 1,
+             f"2026-01-{rng.randrange(1, 29):02d}", 0.0)
+            for _ in range(rows)
+        )
+        yield f"leaderboard_top[{rows}]", lambda store=store: store.top(10)
+        yield (
+            f"leaderboard_top_day[{rows}]",
+            lambda store=store: store.top(10, '2026-01-15')
+        )
+        yield (
+            f"leaderboard_personal_best[{rows}]",
+            lambda store=store: store.personal_best('p7')
+        )
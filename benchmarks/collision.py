@@ -0,0 +1,106 @@
+"""
+Module: compare grid broad-phase collision against pygame's groupcollide.
+
+Run from the project root:
+    python -m benchmarks.collision [--repeat 20] [--json]
+
+Assets:
+- None (builds a headless AlienInvasion for its sprites)
+"""
+
+import argparse
+import json
+import random
+import timeit
+import pygame
+from settings import Settings
+from main import AlienInvasion
+from bullet_pool import BulletPool
+
+ENEMY_COUNTS  = (30, 300, 1000, 3000)
+BULLET_COUNTS = (10, 100, 1000)
+FLEET_COLS    = 5
+
+def _build_game(enemies: int, backend: str) -> AlienInvasion:
+    """
+    Create a headless game whose fleet holds roughly `enemies` ships.
+    """
+    settings = Settings()
+    settings.fleet_backend = backend
+    settings.fleet_cols = FLEET_COLS
+    settings.fleet_rows = max(1, enemies // FLEET_COLS)
+    return AlienInvasion(headless=True, settings=settings)
+
+def spray_bullets(game: AlienInvasion, count: int, seed: int = 0):
+    """
+    Scatter bullets over the formation's bounding box.
+    """
+    rng = random.Random(seed)
+    rects = game.enemy_fleet.rects()
+    left   = min(r.left for r in rects)
+    right  = max(r.right for r in rects)
+    top    = min(r.top for r in rects)
+    bottom = max(r.bottom for r in rects)
+    bullets = BulletPool(game, capacity=count)
+    for _ in range(count):
+        bullets.fire((rng.randint(left, right), rng.randint(top, bottom)), -1)
+    return bullets
+
+def run(repeat: int = 20) -> list:
+    """
+    Time both collision paths for every (enemies, bullets) combination.
+
+    Returns:
+        list: One dict per case with per-call milliseconds for each path.
+    """
+    results = []
+    for enemies in ENEMY_COUNTS:
+        game = _build_game(enemies, 'sprite')
+        fleet = game.enemy_fleet
+        for bullet_count in BULLET_COUNTS:
+            bullets = spray_bullets(game, bullet_count)
+            brute = pygame.sprite.groupcollide(fleet.fleet, bullets, False, False)
+            grid  = fleet.collide_bullets(bullets, dokill=False)
+            assert list(brute.items()) == list(grid.items()), \
+                'grid and groupcollide disagree'
+
+            groupcollide_ms = timeit.timeit(
+                lambda: pygame.sprite.groupcollide(fleet.fleet, bullets, False, False),
+                number=repeat
+            ) / repeat * 1000
+            grid_ms = timeit.timeit(
+                lambda: fleet.collide_bullets(bullets, dokill=False),
+                number=repeat
+            ) / repeat * 1000
+            results.append({
+                'enemies': len(fleet.fleet),
+                'bullets': bullet_count,
+                'hits': len(grid),
+                'groupcollide_ms': groupcollide_ms,
+                'grid_ms': grid_ms,
+                'speedup': groupcollide_ms / grid_ms if grid_ms else float('inf'),
+            })
+    return results
+
+def main(argv=None) -> None:
+    """
+    Print the comparison as a table or JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--json', action='store_true', help='print JSON results')
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=4))
+        return
+    print(f"{'enemies':>8} {'bullets':>8} {'hits':>6} "
+          f"{'groupcollide ms':>16} {'grid ms':>9} {'speedup':>8}")
+    for r in results:
+        print(f"{r['enemies']:>8} {r['bullets']:>8} {r['hits']:>6} "
+              f"{r['groupcollide_ms']:>16.3f} {r['grid_ms']:>9.3f} "
+              f"{r['speedup']:>7.1f}x")
+
+if __name__ == '__main__':
+    main()
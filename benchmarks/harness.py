@@ -0,0 +1,99 @@
+"""
+Module: timing, result files and regression checks for the benchmark suite.
+
+Assets:
+- None (reads/writes JSON result files given on the command line)
+"""
+
+import json
+import platform
+import subprocess
+import timeit
+from pathlib import Path
+import pygame
+from settings import Settings
+from main import AlienInvasion
+
+def build_game(**overrides) -> AlienInvasion:
+    """
+    Create a headless AlienInvasion with Settings attributes overridden.
+    """
+    settings = Settings()
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    return AlienInvasion(headless=True, settings=settings)
+
+def measure(fn, repeat: int = 5, min_time: float = 0.05, setup=None) -> dict:
+    """
+    Time fn and return best and median milliseconds per call.
+
+    The call count per sample is doubled until one sample runs for at least
+    min_time seconds. setup, if given, runs untimed before every sample, so
+    a case that changes game state starts each sample from the same state.
+    """
+    timer = timeit.Timer(fn, setup or 'pass')
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    samples = sorted(t / number for t in timer.repeat(repeat, number))
+    return {
+        'best_ms': samples[0] * 1000,
+        'median_ms': samples[len(samples) // 2] * 1000,
+        'calls': number,
+    }
+
+def _git_commit() -> str:
+    """
+    Return the current git commit hash, or '' outside a checkout.
+    """
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+            cwd=Path(__file__).parent, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+def metadata() -> dict:
+    """
+    Describe the machine and revision the results were taken on.
+    """
+    return {
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+    }
+
+def save_results(path, results: dict) -> None:
+    """
+    Write results (with metadata) as JSON.
+    """
+    Path(path).write_text(json.dumps(
+        {'meta': metadata(), 'results': results}, indent=4, sort_keys=True
+    ))
+
+def load_results(path) -> dict:
+    """
+    Read the results section of a file written by save_results.
+    """
+    return json.loads(Path(path).read_text())['results']
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """
+    Return (case, baseline_ms, current_ms, ratio) for every regression.
+
+    A case regresses when its median is more than threshold (e.g. 0.1 = 10%)
+    slower than the baseline median. Cases missing from either side are
+    ignored.
+    """
+    regressions = []
+    for case, result in current.items():
+        base = baseline.get(case)
+        if not base or not base['median_ms']:
+            continue
+        ratio = result['median_ms'] / base['median_ms']
+        if ratio > 1 + threshold:
+            regressions.append((case, base['median_ms'], result['median_ms'], ratio))
+    return regressions
@@ -0,0 +1,162 @@
+"""
+Module: asset build step that pre-scales images and packs the sprite atlas.
+
+Run from the project root after changing images or sprite sizes:
+    python build_assets.py
+
+Assets:
+- Reads every image the game requests at its Settings sizes (see settings.py)
+- Decodes every clip in settings.sound_files in the game's mixer format
+- Writes index.json, atlas.png, one .bmp per opaque image and one .pcm per
+  sound to settings.asset_build_dir (loaded by asset_cache.py)
+"""
+
+import copy
+import json
+import argparse
+from pathlib import Path
+import pygame
+from settings import Settings
+from asset_cache import INDEX_VERSION, source_stamp
+
+PADDING = 1
+
+def collect(settings: Settings) -> list:
+    """
+    Return ((path, size, rotation, opaque), Surface) for every image the game
+    asks for with these settings, scaled and rotated from the source files.
+    """
+    from main import AlienInvasion
+
+    settings = copy.copy(settings)
+    settings.asset_build_dir = None
+    game = AlienInvasion(headless=True, settings=settings)
+    game.ship.pick_side()  # the left-facing rotation is only built on demand
+    game.game_stats.leaderboard.close()
+    return game.assets.entries()
+
+def pack(sprites: list, padding: int = PADDING) -> tuple:
+    """
+    Shelf-pack sprite Surfaces into one atlas.
+
+    Sprites are placed tallest first, left to right in rows no wider than
+    the widest sprite or 256 pixels, whichever is larger.
+
+    Returns:
+        tuple: (atlas Surface, list of [x, y, w, h] in the order given).
+    """
+    width = max([256] + [s.get_width() + padding for s in sprites])
+    order = sorted(range(len(sprites)), key=lambda i: -sprites[i].get_height())
+    rects = [None] * len(sprites)
+    x = y = shelf_h = 0
+    for i in order:
+        w, h = sprites[i].get_size()
+        if x + w > width:
+            x, y = 0, y + shelf_h + padding
+            shelf_h = 0
+        rects[i] = [x, y, w, h]
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+
+    atlas = pygame.Surface((width, max(1, y + shelf_h)), pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    # BLEND_RGBA_MAX onto transparent pixels copies sprites exactly
+    atlas.blits(
+        [(sprite, rect[:2], None, pygame.BLEND_RGBA_MAX)
+         for sprite, rect in zip(sprites, rects)],
+        False
+    )
+    return atlas, rects
+
+def build_sounds(settings: Settings, out_dir: Path, sources: dict) -> list:
+    """
+    Decode every sound once and write its raw PCM samples.
+
+    The samples are only valid for the mixer format they were decoded in,
+    which is stored with each entry; AssetCache ignores entries whose format
+    does not match the running mixer.
+
+    Returns:
+        list: One index entry per sound.
+    """
+    if not pygame.mixer.get_init():
+        return []
+    root = out_dir.parent
+    fmt = list(pygame.mixer.get_init())
+    entries = []
+    for path in settings.sound_files.values():
+        rel = Path(path).relative_to(root).as_posix()
+        sources[rel] = source_stamp(path)
+        entry = {'path': rel, 'file': f"{Path(path).stem}.pcm", 'format': fmt}
+        (out_dir / entry['file']).write_bytes(pygame.mixer.Sound(str(path)).get_raw())
+        entries.append(entry)
+    return entries
+
+def build(settings: Settings = None) -> dict:
+    """
+    Pre-scale every image, pack the sprites, decode the sounds and write the index.
+
+    Source paths are stored relative to the build directory's parent (the
+    Assets directory by default), which is where AssetCache resolves them.
+
+    Returns:
+        dict: The index written to index.json.
+    """
+    settings = settings or Settings()
+    out_dir = Path(settings.asset_build_dir)
+    root = out_dir.parent
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    entries = []
+    sprites = []
+    sources = {}
+    for (path, size, rotation, opaque), surface in collect(settings):
+        rel = Path(path).relative_to(root).as_posix()
+        sources[rel] = source_stamp(path)
+        entry = {
+            'path': rel,
+            'size': list(size) if size else None,
+            'rotation': rotation,
+            'opaque': opaque,
+        }
+        if opaque:
+            # Uncompressed: decoding a full-screen image is the slow part
+            entry['file'] = f"{Path(path).stem}_{size[0]}x{size[1]}.bmp"
+            pygame.image.save(surface, str(out_dir / entry['file']))
+        else:
+            sprites.append((entry, surface))
+        entries.append(entry)
+
+    atlas, rects = pack([surface for _, surface in sprites])
+    for (entry, _), rect in zip(sprites, rects):
+        entry['rect'] = rect
+    pygame.image.save(atlas, str(out_dir / 'atlas.png'))
+    sounds = build_sounds(settings, out_dir, sources)
+
+    index = {
+        'version': INDEX_VERSION,
+        'atlas': 'atlas.png',
+        'sources': sources,
+        'entries': entries,
+        'sounds': sounds,
+    }
+    (out_dir / 'index.json').write_text(json.dumps(index, indent=4))
+    return index
+
+def main(argv=None) -> None:
+    """
+    Build the assets and print what was written.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.parse_args(argv)
+
+    settings = Settings()
+    out_dir = settings.asset_build_dir
+    index = build(settings)
+    packed = sum('rect' in entry for entry in index['entries'])
+    print(f"{packed} sprites packed into {Path(out_dir) / index['atlas']}, "
+          f"{len(index['entries']) - packed} pre-scaled images, "
+          f"{len(index['sounds'])} pre-decoded sounds")
+
+if __name__ == '__main__':
+    main()
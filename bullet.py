@@ -1,48 +1,62 @@
 """
-Module: defines the bullet sprite and its movement.
+Module: defines the bullet object and its movement.
 
 Assets:
 - Uses WhiteDualLaser.png (bullet sprite, see settings.py)
 """
 
-import pygame
-
-class Bullet(pygame.sprite.Sprite):
+class Bullet:
     """
     Represents a bullet fired by the player's ship.
 
+    Bullets are plain __slots__ objects recycled by a BulletPool (see
+    bullet_pool.py) rather than Sprites allocated per shot. They still expose
+    rect, update() and kill() so sprite-style collision code works on them.
+
     Attributes:
         game: Reference to the main game instance.
         settings: Game configuration settings.
         screen: Pygame display surface.
-        image: Surface representation of the bullet.
+        pool: Owning BulletPool (kill() returns the bullet to it), or None.
+        image: Shared surface of the bullet.
         rect: Rect defining bullet position.
         x (float): Precise horizontal coordinate for movement.
         direction (int): Horizontal travel direction (-1 left, +1 right).
     """
-    def __init__(self, game, start_pos, direction=None) -> None:
+    __slots__ = ('game', 'settings', 'screen', 'pool', 'image', 'rect', 'x', 'direction')
+
+    def __init__(self, game, start_pos=(0, 0), direction=None, pool=None) -> None:
         """
-        Create a new bullet at the given start position with an optional direction.
+        Create a bullet at the given start position with an optional direction.
 
         Args:
             game: The main AlienInvasion instance.
             start_pos (tuple): (x, y) coords where bullet is spawned.
             direction (int, optional): -1 for leftward, +1 for rightward travel.
                                        Defaults based on ship side.
+            pool (BulletPool, optional): Pool that owns and recycles this bullet.
         """
-        super().__init__()
         self.game      = game
         self.settings  = game.settings
         self.screen    = game.screen
+        self.pool      = pool
 
-        # Load and scale the bullet image
-        self.image = pygame.image.load(self.settings.bullet_file)
-        self.image = pygame.transform.scale(self.image, (15, 5))
-        self.rect = self.image.get_rect(center=start_pos)
+        # Shared, pre-scaled bullet image from the asset cache
+        self.image = game.assets.image(
+            self.settings.bullet_file,
+            (self.settings.bullet_w, self.settings.bullet_h)
+        )
+        self.rect = self.image.get_rect()
+        self.reset(start_pos, direction)
 
+    def reset(self, start_pos, direction=None) -> None:
+        """
+        Re-aim a (possibly recycled) bullet from start_pos.
+        """
+        self.rect.center = start_pos
         self.x = float(self.rect.x)
         if direction is None:
-            direction = -1 if game.ship.side == 'right' else 1
+            direction = -1 if self.game.ship.side == 'right' else 1
         self.direction = direction
 
     def update(self) -> None:
@@ -52,6 +66,13 @@ class Bullet(pygame.sprite.Sprite):
         self.x += self.direction * self.settings.bullet_speed
         self.rect.x = int(self.x)
 
+    def kill(self) -> None:
+        """
+        Return the bullet to its pool.
+        """
+        if self.pool is not None:
+            self.pool.release(self)
+
     def draw_bullet(self) -> None:
         """
         Draw the bullet on the screen at its current position.
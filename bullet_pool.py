@@ -0,0 +1,154 @@
+"""
+Module: fixed-size pool of recycled bullets with off-screen culling.
+
+Assets:
+- Uses Bullet objects (see bullet.py)
+"""
+
+import struct
+from bullet import Bullet
+
+# x, rect x, rect y, direction
+BULLET_STATE = struct.Struct('<diib')
+
+class BulletPool:
+    """
+    Own every bullet the ship can fire and recycle them instead of allocating.
+
+    All bullets are created up front. fire() takes one from the free list,
+    kill()/release() puts it back, and update() culls bullets once they have
+    fully left the screen. When every bullet is in flight fire() refuses the
+    shot, which caps the live count at settings.bullets_allowed; a lower
+    limit (set by the quality governor) caps it further.
+
+    The pool also behaves enough like a sprite Group (sprites(), update(),
+    empty(), len(), iteration) for the rest of the game to use it directly.
+
+    Attributes:
+        capacity (int): Number of pooled bullets.
+        limit (int): Maximum number of live bullets (at most capacity).
+        fired (int): Bullets fired since creation.
+        culled (int): Bullets recycled after leaving the screen.
+        dropped (int): Shots refused because the pool was exhausted.
+    """
+    def __init__(self, game, capacity: int = None) -> None:
+        """
+        Pre-allocate capacity bullets.
+        """
+        self.game     = game
+        self.screen   = game.screen
+        self.settings = game.settings
+        self.capacity = capacity or self.settings.bullets_allowed
+        self.limit    = self.capacity
+        self._free    = [Bullet(game, pool=self) for _ in range(self.capacity)]
+        self._live    = {}
+        self.fired    = 0
+        self.culled   = 0
+        self.dropped  = 0
+
+    def fire(self, start_pos, direction=None):
+        """
+        Launch a pooled bullet; return it, or None if the cap is reached.
+        """
+        if len(self._live) >= self.limit:
+            self.dropped += 1
+            return None
+        bullet = self._free.pop()
+        bullet.reset(start_pos, direction)
+        self._live[bullet] = None
+        self.fired += 1
+        return bullet
+
+    def release(self, bullet: Bullet) -> None:
+        """
+        Return a live bullet to the free list.
+        """
+        if bullet in self._live:
+            del self._live[bullet]
+            self._free.append(bullet)
+
+    def update(self) -> None:
+        """
+        Move every live bullet and cull the ones that left the screen.
+        """
+        screen_w = self.settings.screen_w
+        for bullet in list(self._live):
+            bullet.update()
+            rect = bullet.rect
+            if rect.right < 0 or rect.left > screen_w:
+                self.release(bullet)
+                self.culled += 1
+
+    def draw(self) -> None:
+        """
+        Draw every live bullet with one batched blit call.
+        """
+        offset = self.game.render_offset(self.settings.bullet_speed)
+        if not offset:
+            self.screen.blits(
+                [(bullet.image, bullet.rect) for bullet in self._live], False
+            )
+            return
+        self.screen.blits(
+            [(bullet.image, (bullet.rect.x + offset * bullet.direction, bullet.rect.y))
+             for bullet in self._live],
+            False
+        )
+
+    def sprites(self) -> list:
+        """
+        Return the live bullets.
+        """
+        return list(self._live)
+
+    def empty(self) -> None:
+        """
+        Return every live bullet to the pool.
+        """
+        self._free.extend(self._live)
+        self._live.clear()
+
+    def save_state(self) -> bytes:
+        """
+        Pack every live bullet, in firing order.
+        """
+        pack = BULLET_STATE.pack
+        return b''.join(
+            pack(b.x, b.rect.x, b.rect.y, b.direction) for b in self._live
+        )
+
+    def load_state(self, data: bytes) -> None:
+        """
+        Replace the live bullets with the ones save_state() packed (up to
+        the pool's capacity).
+        """
+        self.empty()
+        for x, rect_x, rect_y, direction in BULLET_STATE.iter_unpack(data):
+            if not self._free:
+                break
+            bullet = self._free.pop()
+            bullet.rect.topleft = (rect_x, rect_y)
+            bullet.x = x
+            bullet.direction = direction
+            self._live[bullet] = None
+
+    def stats(self) -> dict:
+        """
+        Return live/pooled/culled counters.
+        """
+        return {
+            'live': len(self._live),
+            'pooled': len(self._free),
+            'culled': self.culled,
+            'fired': self.fired,
+            'dropped': self.dropped,
+        }
+
+    def __iter__(self):
+        return iter(list(self._live))
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __bool__(self) -> bool:
+        return bool(self._live)
@@ -0,0 +1,190 @@
+"""
+Module: internal framebuffer that can draw the scene below window resolution.
+
+Assets:
+- None (scales whatever surfaces are drawn onto it)
+"""
+
+import math
+import weakref
+import pygame
+
+class ScaledCanvas:
+    """
+    Drawing surface with the game's logical size, rendered at render scale.
+
+    Everything that draws takes game.screen and calls blit(), blits(),
+    fill() and get_rect() on it in logical (settings.screen_w x screen_h)
+    coordinates. At scale 1.0 those calls go straight to the display
+    surface. Below 1.0 every position and area is scaled, and each source
+    surface is drawn from a scaled copy, cached (weakly) per surface, onto a
+    smaller framebuffer, cutting per-frame pixel work by about 1 / scale**2.
+
+    The framebuffer reaches the window in one of two ways:
+        - scaled_display: the display itself is opened at the reduced size
+          with pygame.SCALED and SDL stretches it to the window. Mouse
+          positions then arrive in framebuffer pixels (see to_logical).
+          The scale is fixed for the life of the window.
+        - otherwise: the display stays at full size and present() scales
+          the framebuffer onto it once per frame. The scale can be changed
+          at any time with set_scale().
+
+    A surface drawn from the cache and then modified in place must be
+    passed to forget() so its scaled copy is rebuilt.
+
+    Attributes:
+        display: The window's display surface.
+        surface: Framebuffer drawn into (the display itself at scale 1.0).
+        size (tuple): Logical (width, height).
+        scale (float): Framebuffer pixels per logical pixel.
+        rescalable (bool): Whether set_scale() may change the scale.
+    """
+    def __init__(self, display: pygame.Surface, size: tuple,
+                 scale: float = 1.0, scaled_display: bool = False) -> None:
+        """
+        Wrap display (already at the reduced size if scaled_display).
+        """
+        self.display    = display
+        self.size       = tuple(size)
+        self.scale      = None
+        self.rescalable = not scaled_display
+        self._cache     = weakref.WeakKeyDictionary()
+        self.set_scale(scale)
+
+    def set_scale(self, scale: float) -> None:
+        """
+        Switch the framebuffer to scale (a no-op if it is already in use).
+        """
+        if scale == self.scale:
+            return
+        if self.scale is not None and not self.rescalable:
+            raise ValueError("the scale of a pygame.SCALED display is fixed")
+        self.scale = scale
+        self._cache.clear()
+        if scale == 1.0 or not self.rescalable:
+            self.surface = self.display
+        else:
+            self.surface = pygame.Surface(self.scaled_size(self.size)).convert()
+
+        if scale == 1.0:
+            # Bind the display's own methods so full-scale drawing costs nothing
+            self.blit  = self.surface.blit
+            self.blits = self.surface.blits
+            self.fill  = self.surface.fill
+        else:
+            for name in ('blit', 'blits', 'fill'):
+                self.__dict__.pop(name, None)
+
+    def scaled_size(self, size: tuple) -> tuple:
+        """
+        Return size in framebuffer pixels (at least 1x1).
+        """
+        return (max(1, round(size[0] * self.scale)),
+                max(1, round(size[1] * self.scale)))
+
+    def get_rect(self) -> pygame.Rect:
+        """
+        Return the logical screen rect.
+        """
+        return pygame.Rect((0, 0), self.size)
+
+    def get_size(self) -> tuple:
+        """
+        Return the logical screen size.
+        """
+        return self.size
+
+    def to_logical(self, pos) -> tuple:
+        """
+        Map a mouse position from a display event to logical coordinates.
+        """
+        if self.rescalable:
+            return tuple(pos)
+        return (math.floor(pos[0] / self.scale), math.floor(pos[1] / self.scale))
+
+    def scaled(self, surface: pygame.Surface) -> pygame.Surface:
+        """
+        Return surface resized by the current scale (cached).
+        """
+        image = self._cache.get(surface)
+        if image is None:
+            size = self.scaled_size(surface.get_size())
+            if surface.get_bitsize() in (24, 32):
+                image = pygame.transform.smoothscale(surface, size)
+            else:
+                image = pygame.transform.scale(surface, size)
+            self._cache[surface] = image
+        return image
+
+    def forget(self, surface: pygame.Surface) -> None:
+        """
+        Drop the cached scaled copy of a surface that was modified.
+        """
+        self._cache.pop(surface, None)
+
+    def _point(self, pos) -> tuple:
+        """
+        Scale a logical (x, y) (or the topleft of a rect) to framebuffer pixels.
+        """
+        s = self.scale
+        return (math.floor(pos[0] * s), math.floor(pos[1] * s))
+
+    def _rect(self, rect) -> pygame.Rect:
+        """
+        Scale a logical rect by its edges, so adjacent rects stay adjacent.
+        """
+        rect = pygame.Rect(rect)
+        s = self.scale
+        left, top = math.floor(rect.left * s), math.floor(rect.top * s)
+        return pygame.Rect(
+            left, top,
+            math.floor(rect.right * s) - left, math.floor(rect.bottom * s) - top
+        )
+
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags: int = 0):
+        """
+        Draw source at logical dest, optionally only its logical area.
+        """
+        if area is not None:
+            area = self._rect(area)
+        return self.surface.blit(
+            self.scaled(source), self._point(dest), area, special_flags
+        )
+
+    def blits(self, blit_sequence, doreturn: bool = True):
+        """
+        Draw a sequence of (source, dest[, area[, special_flags]]) in one call.
+        """
+        scaled, point, rect = self.scaled, self._point, self._rect
+        sequence = []
+        for item in blit_sequence:
+            if len(item) == 2:
+                sequence.append((scaled(item[0]), point(item[1])))
+            else:
+                area = None if item[2] is None else rect(item[2])
+                sequence.append((scaled(item[0]), point(item[1]), area, *item[3:]))
+        return self.surface.blits(sequence, doreturn)
+
+    def fill(self, color, rect=None, special_flags: int = 0):
+        """
+        Fill the logical rect (default: everything) with color.
+        """
+        if rect is not None:
+            rect = self._rect(rect)
+        return self.surface.fill(color, rect, special_flags)
+
+    def present(self) -> None:
+        """
+        Scale the framebuffer onto the display, if it is a separate surface.
+        """
+        if self.surface is not self.display:
+            pygame.transform.scale(
+                self.surface, self.display.get_size(), self.display
+            )
+
+    def flip(self) -> None:
+        """
+        Present the framebuffer and update the whole window.
+        """
+        self.present()
+        pygame.display.flip()
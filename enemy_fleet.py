@@ -5,12 +5,72 @@ Assets:
 - Uses EnemyShip class (see enemy_ship.py)
 """
 
+import math
+import struct
+import functools
+import numpy as np
 import pygame
 from enemy_ship import EnemyShip
+from spatial_grid import SpatialGrid
+from formation_surface import FormationSurface
+
+# slots, composite shift
+STATE_HEADER = struct.Struct('<Id')
+
+def formation_layout(settings, enemy_width: int, enemy_height: int) -> tuple:
+    """
+    Return the (x, y) top-left position of every enemy in the formation.
+
+    The grid fills the screen with a column every three enemy widths and a row
+    every three enemy heights. settings.fleet_cols / settings.fleet_rows, when
+    set, override the computed grid size (used for stress and benchmark runs).
+    Layouts are computed once per screen size, sprite size and override, and
+    the cached tuple is shared, so it must not be modified.
+    """
+    return _formation_layout(
+        settings.screen_w, settings.screen_h, enemy_width, enemy_height,
+        settings.fleet_cols, settings.fleet_rows
+    )
+
+@functools.lru_cache(maxsize=32)
+def _formation_layout(screen_w: int, screen_h: int, enemy_width: int,
+                      enemy_height: int, fleet_cols, fleet_rows) -> tuple:
+    """
+    Compute the layout for formation_layout (cached).
+    """
+    # Horizontal and vertical spacing calculations
+    margin_right = enemy_width * 2
+    available_x  = screen_w - margin_right - enemy_width
+    per_row      = available_x // (enemy_width * 3)
+
+    top_margin   = enemy_height
+    available_y  = screen_h - (top_margin * 2)
+    full_rows    = available_y // (enemy_height * 3)
+
+    number_of_rows = max(1, full_rows - 1) + 2
+
+    if fleet_cols:
+        per_row = fleet_cols
+    if fleet_rows:
+        number_of_rows = fleet_rows
+
+    return tuple(
+        (enemy_width + (enemy_width * 3 * col),
+         top_margin + (enemy_height * 3 * row))
+        for row in range(int(number_of_rows))
+        for col in range(int(per_row))
+    )
 
 class EnemyFleet:
     """
     Manages a fleet of enemy spaceships arranged in rows along the horizontal axis.
+
+    EnemyShip instances are allocated once and reset in place for every new
+    wave, so level transitions create no garbage.
+
+    Attributes:
+        fleet (Group): The living enemies.
+        grid (SpatialGrid): Broad-phase index of the living enemies.
     """
     def __init__(self, game) -> None:
         """
@@ -18,50 +78,238 @@ class EnemyFleet:
         """
         self.game  = game
         self.fleet = pygame.sprite.Group()
+        settings   = game.settings
+
+        # Broad-phase cells sized from the enemy sprite
+        self.grid  = SpatialGrid(settings.enemy_w * 2, settings.enemy_h * 2)
+        self.image = game.assets.image(
+            settings.enemy_file, (settings.enemy_w, settings.enemy_h)
+        )
+        self.composite = None
+        self._members  = {}
+        self._enemies  = []
+        self._slots    = {}
+        self._size     = 0
         self.create_fleet()
 
     def create_fleet(self) -> None:
         """
-        Calculate spacing and populate the fleet group.
+        Place an enemy at every formation slot and index them in the grid.
+
+        Enemies left over from earlier waves are reused; new ones are only
+        allocated when the formation has grown.
         """
-        sample_enemy  = EnemyShip(self.game)
-        enemy_width   = sample_enemy.rect.width
-        enemy_height  = sample_enemy.rect.height
+        settings = self.game.settings
+        layout = formation_layout(settings, settings.enemy_w, settings.enemy_h)
+        enemies = self._allocate(len(layout))
 
-        screen_h = self.game.settings.screen_h
-        screen_w = self.game.settings.screen_w
+        self.grid.clear()
+        insert = self.grid.insert
+        for enemy, (x, y) in zip(enemies, layout):
+            enemy.reset(x, y)
+            insert(enemy, enemy.rect)
+        self.fleet.add(enemies[:len(layout)])
+        self._size = len(layout)
 
-        # Horizontal and vertical spacing calculations
-        margin_right = enemy_width * 2
-        available_x  = screen_w - margin_right - enemy_width
-        per_row      = available_x // (enemy_width * 3)
+        self._build_composite(self.image)
 
-        top_margin   = enemy_height
-        available_y  = screen_h - (top_margin * 2)
-        full_rows    = available_y // (enemy_height * 3)
+    def _allocate(self, size: int) -> list:
+        """
+        Grow the enemy pool to at least size and return it.
 
-        number_of_rows = max(1, full_rows - 1) + 2
+        Each enemy keeps its pool slot for life; slots are also the order the
+        enemies are added to the fleet Group.
+        """
+        enemies = self._enemies
+        while len(enemies) < size:
+            enemy = EnemyShip(self.game)
+            self._slots[enemy] = len(enemies)
+            enemies.append(enemy)
+        return enemies
 
-        for row in range(int(number_of_rows)):
-            for col in range(int(per_row)):
-                enemy = EnemyShip(self.game)
-                enemy.rect.x = enemy_width + (enemy_width * 3 * col)
-                enemy.rect.y = top_margin + (enemy_height * 3 * row)
-                enemy.x  = float(enemy.rect.x)
-                self.fleet.add(enemy)
+    def _build_composite(self, image, shift: float = 0.0) -> None:
+        """
+        Pre-composite the formation into one surface if settings ask for it.
+
+        While composited the formation moves rigidly: every enemy sits at its
+        start x plus one shared whole-pixel shift, so the single blit and the
+        per-enemy rects always agree. A restored fleet passes the shift it
+        had already moved, so start x is recovered from the current rects.
+        """
+        self.composite = None
+        self._members  = {}
+        self.shift     = 0.0
+        settings = self.game.settings
+        if not settings.fleet_composite:
+            return
+        composite = FormationSurface(image, settings.formation_max_pixels)
+        step = math.floor(shift)
+        members = {
+            enemy: (enemy.rect.x - step, enemy.rect.y) for enemy in self.fleet
+        }
+        if composite.build(members.values()):
+            self.composite = composite
+            self._members  = members
+            self.shift     = shift
 
     def update(self) -> None:
         """
-        Move each enemy toward the ship's side.
+        Move each enemy toward the ship's side and keep the grid in step.
         """
         direction = 1 if self.game.ship.side == 'right' else -1
+        move = self.grid.move
+        if self.composite is not None:
+            self.shift += self.game.settings.enemy_speed * direction
+            step = math.floor(self.shift)
+            members = self._members
+            for enemy in self.fleet.sprites():
+                x0 = members[enemy][0]
+                enemy.x = x0 + self.shift
+                enemy.rect.x = x0 + step
+                move(enemy, enemy.rect)
+            return
         for enemy in self.fleet.sprites():
             enemy.x += self.game.settings.enemy_speed * direction
             enemy.rect.x = int(enemy.x)
+            move(enemy, enemy.rect)
+
+    def collide_bullets(self, bullets, dokill: bool = True) -> dict:
+        """
+        Find bullet hits using the grid as a broad phase.
+
+        Returns the same mapping as pygame.sprite.groupcollide(fleet, bullets,
+        dokill, dokill): each hit enemy -> list of bullets that hit it, with
+        enemies in fleet order and a bullet listed under every enemy it
+        touches.
+        """
+        query = self.grid.query
+        hits = {}
+        for bullet in bullets.sprites():
+            rect = bullet.rect
+            for enemy in query(rect):
+                if enemy.rect.colliderect(rect):
+                    hits.setdefault(enemy, []).append(bullet)
+        if len(hits) > 1:
+            # Grid cells are sets; list enemies in Group order as groupcollide does
+            order = self._slots.__getitem__
+            hits = {enemy: hits[enemy] for enemy in sorted(hits, key=order)}
+        if dokill:
+            for enemy, hit_bullets in hits.items():
+                self.grid.remove(enemy)
+                enemy.kill()
+                for bullet in hit_bullets:
+                    bullet.kill()
+        return hits
+
+    def check_ship_hit(self, ship_rect, screen_w: int) -> bool:
+        """
+        Return True if an enemy touches the ship or reaches the right edge.
+        """
+        for enemy in self.grid.query(ship_rect):
+            if enemy.rect.colliderect(ship_rect):
+                return True
+        for enemy in self.grid.query_bounds(left=screen_w - 1):
+            if enemy.rect.right >= screen_w:
+                return True
+        return False
+
+    def rects(self) -> list:
+        """
+        Return the Rect of every enemy in the fleet.
+        """
+        return [enemy.rect for enemy in self.fleet.sprites()]
+
+    def positions(self) -> tuple:
+        """
+        Return (xs, ys) lists of every enemy's top-left corner.
+        """
+        sprites = self.fleet.sprites()
+        return [e.rect.x for e in sprites], [e.rect.y for e in sprites]
+
+    def state(self) -> tuple:
+        """
+        Return (xs, ys, alive) arrays for every slot of the current wave.
+
+        Slots keep their index for the whole wave, dead or alive.
+        """
+        enemies = self._enemies[:self._size]
+        n = len(enemies)
+        return (
+            np.fromiter((e.rect.x for e in enemies), np.int32, n),
+            np.fromiter((e.rect.y for e in enemies), np.int32, n),
+            np.fromiter((e.alive() for e in enemies), bool, n),
+        )
+
+    def save_state(self) -> bytes:
+        """
+        Pack every slot's precise x, rect position and alive flag.
+        """
+        enemies = self._enemies[:self._size]
+        xs, ys, alive = self.state()
+        precise = np.fromiter((e.x for e in enemies), np.float64, len(enemies))
+        return (STATE_HEADER.pack(len(enemies), self.shift) + precise.tobytes()
+                + xs.tobytes() + ys.tobytes() + alive.tobytes())
+
+    def load_state(self, data: bytes) -> None:
+        """
+        Put the wave back as save_state() packed it, reusing the EnemyShips.
+        """
+        n, shift = STATE_HEADER.unpack_from(data)
+        offset = STATE_HEADER.size
+        precise = np.frombuffer(data, np.float64, n, offset).tolist()
+        xs = np.frombuffer(data, np.int32, n, offset + 8 * n).tolist()
+        ys = np.frombuffer(data, np.int32, n, offset + 12 * n).tolist()
+        alive = np.frombuffer(data, bool, n, offset + 16 * n).tolist()
+
+        enemies = self._allocate(n)
+        self.fleet.empty()
+        self.grid.clear()
+        insert = self.grid.insert
+        living = []
+        for enemy, x, rect_x, y, is_alive in zip(enemies, precise, xs, ys, alive):
+            enemy.reset(rect_x, y)
+            enemy.x = x
+            if is_alive:
+                living.append(enemy)
+                insert(enemy, enemy.rect)
+        self.fleet.add(living)
+        self._size = n
+        self._build_composite(self.image, shift)
+
+    def _draw_composite(self) -> None:
+        """
+        Patch out destroyed enemies, then blit the formation once.
+        """
+        members = self._members
+        if len(members) != len(self.fleet):
+            for enemy in [e for e in members if not e.alive()]:
+                self.composite.erase(*members.pop(enemy))
+        if members:
+            self.composite.draw(
+                self.game.screen, math.floor(self.shift) + self._render_offset()
+            )
+
+    def _render_offset(self) -> int:
+        """
+        Return the interpolation offset for this frame's fleet step.
+        """
+        direction = 1 if self.game.ship.side == 'right' else -1
+        return self.game.render_offset(self.game.settings.enemy_speed * direction)
 
     def draw(self) -> None:
         """
-        Draw all enemies to the screen.
+        Draw all enemies to the screen (one blit when composited).
         """
+        if self.composite is not None:
+            self._draw_composite()
+            return
+        dx = self._render_offset()
+        if dx:
+            self.game.screen.blits(
+                [(enemy.image, (enemy.rect.x + dx, enemy.rect.y))
+                 for enemy in self.fleet.sprites()],
+                False
+            )
+            return
         for enemy in self.fleet.sprites():
             enemy.draw_enemy()
@@ -31,12 +31,22 @@ class EnemyShip(pygame.sprite.Sprite):
         self.settings = game.settings
         self.screen  = game.screen
 
-        # Load and scale the enemy image
-        self.image = pygame.image.load(self.settings.enemy_file)
-        self.image = pygame.transform.scale(self.image, (70, 55))
+        # Shared, pre-scaled enemy image from the asset cache
+        self.image = game.assets.image(
+            self.settings.enemy_file,
+            (self.settings.enemy_w, self.settings.enemy_h)
+        )
         self.rect = self.image.get_rect()
         self.x = float(self.rect.x)
 
+    def reset(self, x: int, y: int) -> None:
+        """
+        Move the enemy to (x, y) for reuse in a new formation.
+        """
+        self.rect.x = x
+        self.rect.y = y
+        self.x = float(x)
+
     def update(self) -> None:
         """
         Update the enemy's x-coordinate based on settings.enemy_speed.
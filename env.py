@@ -0,0 +1,367 @@
+"""
+Module: reset/step environment API and a multi-process vectorized wrapper.
+
+Run from the project root to measure steps per second:
+    python -m env [--envs 16] [--workers 16] [--steps 2000]
+
+Assets:
+- None directly (each environment builds a headless AlienInvasion)
+"""
+
+import os
+import copy
+import time
+import argparse
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+from settings import Settings
+
+# Actions: bit 0 = up, bit 1 = down, bit 2 = fire
+NOOP, UP, DOWN, FIRE = 0, 1, 2, 4
+NUM_ACTIONS = 8
+
+# Observation: scalar features, then enemy and bullet occupancy grids
+OBS_ROWS    = 12
+OBS_COLS    = 16
+OBS_SCALARS = 6
+OBS_SIZE    = OBS_SCALARS + 2 * OBS_ROWS * OBS_COLS
+
+class AlienInvasionEnv:
+    """
+    One headless game driven one simulation tick per step().
+
+    Actions and observations never go through pygame.event or the display:
+    step() sets the ship's movement flags and fires directly, then runs the
+    same update/collision pipeline as the game loop. Like every headless
+    game it keeps scores in a private in-memory leaderboard, so bots never
+    touch the player's scores.
+
+    Observation (float32, OBS_SIZE): ship y, lives, level, enemy speed, live
+    bullets and remaining enemies (each scaled to about 0..1; level and enemy
+    speed as 1 - first / current, which is 0 on the first wave and
+    approaches 1 as they grow), followed by OBS_ROWS x OBS_COLS enemy counts
+    and bullet counts by screen cell.
+
+    Attributes:
+        game (AlienInvasion): The wrapped game.
+        steps (int): Steps taken since the last reset.
+        max_steps (int|None): Steps after which an episode is cut off.
+    """
+    def __init__(self, settings: Settings = None, max_steps: int = None) -> None:
+        """
+        Build the game with no window (and so its own leaderboard).
+
+        settings is copied, since the game changes its speeds as levels pass.
+        Input is always taken from the actions, never the keyboard, so poll
+        mode (which reads held keys every tick) is switched off.
+        """
+        from main import AlienInvasion
+
+        settings = copy.deepcopy(settings) if settings else Settings()
+        settings.input_mode = 'events'
+        self.game      = AlienInvasion(headless=True, settings=settings)
+        self.max_steps = max_steps
+        self.steps     = 0
+        self._initial_enemies = 1
+        self._base_speed = settings.enemy_speed
+        self._cell_w = settings.screen_w / OBS_COLS
+        self._cell_h = settings.screen_h / OBS_ROWS
+
+    def reset(self, out: np.ndarray = None) -> np.ndarray:
+        """
+        Start a new game and return the first observation.
+        """
+        self.game._start_game()
+        self.steps = 0
+        self._initial_enemies = max(1, len(self.game.enemy_fleet.fleet))
+        return self.observation(out)
+
+    def step(self, action: int, out: np.ndarray = None) -> tuple:
+        """
+        Apply action for one tick.
+
+        Returns:
+            tuple: (observation, reward, done, info) where reward is the
+                   score gained this tick and info holds score and level.
+        """
+        game = self.game
+        ship = game.ship
+        ship.moving_up = bool(action & UP)
+        ship.moving_down = bool(action & DOWN)
+        if action & FIRE:
+            game._fire_bullet()
+
+        score = game.game_stats.score
+        game._update_game()
+        game.frame += 1
+        self.steps += 1
+
+        stats = game.game_stats
+        done = not game.game_active or (
+            self.max_steps is not None and self.steps >= self.max_steps
+        )
+        info = {'score': stats.score, 'level': stats.level}
+        return self.observation(out), stats.score - score, done, info
+
+    def observation(self, out: np.ndarray = None) -> np.ndarray:
+        """
+        Fill out (or a new array) with the current observation.
+        """
+        if out is None:
+            out = np.empty(OBS_SIZE, dtype=np.float32)
+        game = self.game
+        settings = game.settings
+        fleet = game.enemy_fleet
+        bullets = game.bullets.sprites()
+
+        out[0] = game.ship.y / settings.screen_h
+        out[1] = game.game_stats.ship_left / settings.starting_ship_count
+        out[2] = 1.0 - 1.0 / game.game_stats.level
+        out[3] = 1.0 - self._base_speed / settings.enemy_speed
+        out[4] = len(bullets) / settings.bullets_allowed
+        out[5] = len(fleet.fleet) / self._initial_enemies
+
+        cells = OBS_ROWS * OBS_COLS
+        enemies = out[OBS_SCALARS:OBS_SCALARS + cells]
+        xs, ys = fleet.positions()
+        self._count_cells(
+            enemies,
+            np.asarray(xs) + settings.enemy_w // 2,
+            np.asarray(ys) + settings.enemy_h // 2
+        )
+        shots = out[OBS_SCALARS + cells:]
+        self._count_cells(
+            shots,
+            np.fromiter((b.rect.centerx for b in bullets), np.int64, len(bullets)),
+            np.fromiter((b.rect.centery for b in bullets), np.int64, len(bullets))
+        )
+        return out
+
+    def _count_cells(self, grid: np.ndarray, xs, ys) -> None:
+        """
+        Zero grid, then count the points (xs, ys) by screen cell.
+        """
+        grid[:] = 0
+        if not len(xs):
+            return
+        cols = np.clip((xs / self._cell_w).astype(np.int64), 0, OBS_COLS - 1)
+        rows = np.clip((ys / self._cell_h).astype(np.int64), 0, OBS_ROWS - 1)
+        grid += np.bincount(rows * OBS_COLS + cols, minlength=grid.size)
+
+    def close(self) -> None:
+        """
+        Stop the leaderboard writer.
+        """
+        self.game.game_stats.close()
+
+def _worker(conn, shm_name: str, num_envs: int, first: int, count: int,
+            settings: Settings, max_steps: int) -> None:
+    """
+    Run envs [first, first + count) and serve step/reset commands over conn.
+
+    Actions are read from, and observations, rewards, dones, scores and
+    levels written to, the shared arrays; conn only carries command names.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    arrays = _SharedArrays(shm.buf, num_envs)
+    envs = [AlienInvasionEnv(settings, max_steps) for _ in range(count)]
+    rows = range(first, first + count)
+    try:
+        while True:
+            command = conn.recv()
+            if command == 'step':
+                for i, env in zip(rows, envs):
+                    _, reward, done, info = env.step(
+                        int(arrays.actions[i]), arrays.obs[i]
+                    )
+                    arrays.rewards[i] = reward
+                    arrays.dones[i] = done
+                    arrays.scores[i] = info['score']
+                    arrays.levels[i] = info['level']
+                    if done:
+                        env.reset(arrays.obs[i])
+            elif command == 'reset':
+                for i, env in zip(rows, envs):
+                    env.reset(arrays.obs[i])
+                    arrays.rewards[i] = 0
+                    arrays.dones[i] = False
+            else:
+                break
+            conn.send(True)
+    finally:
+        for env in envs:
+            env.close()
+        del arrays
+        shm.close()
+        conn.close()
+
+class _SharedArrays:
+    """
+    NumPy views of one shared memory block laid out for num_envs envs.
+
+    Fields are ordered by decreasing alignment so every view stays aligned.
+    """
+    FIELDS = (
+        ('actions', np.int64, ()),
+        ('scores', np.int64, ()),
+        ('levels', np.int64, ()),
+        ('obs', np.float32, (OBS_SIZE,)),
+        ('rewards', np.float32, ()),
+        ('dones', np.bool_, ()),
+    )
+
+    def __init__(self, buffer, num_envs: int) -> None:
+        """
+        Map every field onto buffer (which must hold nbytes(num_envs)).
+        """
+        offset = 0
+        for name, dtype, shape in self.FIELDS:
+            array = np.ndarray((num_envs, *shape), dtype, buffer, offset)
+            setattr(self, name, array)
+            offset += array.nbytes
+
+    @classmethod
+    def nbytes(cls, num_envs: int) -> int:
+        """
+        Return the bytes needed for num_envs envs.
+        """
+        return sum(
+            num_envs * int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize
+            for _, dtype, shape in cls.FIELDS
+        )
+
+class VectorEnv:
+    """
+    N independent headless games stepped in parallel worker processes.
+
+    Envs are split into contiguous slices, one slice per worker. Every step
+    writes actions into shared memory, sends each worker a one-word command,
+    and waits for all of them; observations come back as one stacked
+    (num_envs, OBS_SIZE) float32 array in the same shared block, so nothing
+    but the command is pickled. Finished games reset automatically (the
+    returned observation is then the new game's first).
+
+    Attributes:
+        num_envs (int): Number of games.
+        num_workers (int): Number of worker processes.
+    """
+    def __init__(self, num_envs: int, num_workers: int = None,
+                 settings: Settings = None, max_steps: int = None) -> None:
+        """
+        Start the workers and reset every env.
+        """
+        self.num_envs = num_envs
+        self.num_workers = max(1, min(num_envs, num_workers or os.cpu_count() or 1))
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=_SharedArrays.nbytes(num_envs)
+        )
+        self._arrays = _SharedArrays(self._shm.buf, num_envs)
+        self._arrays.actions[:] = NOOP
+
+        context = mp.get_context('spawn')
+        self._conns = []
+        self._procs = []
+        per, extra = divmod(num_envs, self.num_workers)
+        first = 0
+        for w in range(self.num_workers):
+            count = per + (w < extra)
+            parent, child = context.Pipe()
+            proc = context.Process(
+                target=_worker,
+                args=(child, self._shm.name, num_envs, first, count,
+                      settings or Settings(), max_steps),
+                daemon=True
+            )
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+            first += count
+        self._closed = False
+
+    def _broadcast(self, command: str) -> None:
+        """
+        Send command to every worker and wait until all have finished it.
+        """
+        for conn in self._conns:
+            conn.send(command)
+        for conn in self._conns:
+            conn.recv()
+
+    def reset(self) -> np.ndarray:
+        """
+        Start a new game in every env; return the stacked observations.
+        """
+        self._broadcast('reset')
+        return self._arrays.obs
+
+    def step(self, actions) -> tuple:
+        """
+        Step every env with its action.
+
+        Returns:
+            tuple: (observations, rewards, dones, info) as arrays of length
+                   num_envs; info holds 'score' and 'level' arrays. The arrays
+                   are views of shared memory, overwritten by the next call.
+        """
+        self._arrays.actions[:] = actions
+        self._broadcast('step')
+        a = self._arrays
+        return a.obs, a.rewards, a.dones, {'score': a.scores, 'level': a.levels}
+
+    def close(self) -> None:
+        """
+        Stop the workers and release the shared memory.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for conn in self._conns:
+            try:
+                conn.send('close')
+            except OSError:
+                pass
+        for proc in self._procs:
+            proc.join()
+        del self._arrays
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> 'VectorEnv':
+        """
+        Use as a context manager that closes the workers on exit.
+        """
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """
+        Close the workers.
+        """
+        self.close()
+
+def main(argv=None) -> None:
+    """
+    Report vectorized steps per second for random actions.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--envs', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--workers', type=int, help='default: one per core')
+    parser.add_argument('--steps', type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    with VectorEnv(args.envs, args.workers) as env:
+        env.reset()
+        start = time.perf_counter()
+        for _ in range(args.steps):
+            env.step(rng.integers(0, NUM_ACTIONS, args.envs))
+        elapsed = time.perf_counter() - start
+        total = args.steps * args.envs
+        print(
+            f"{args.envs} envs on {env.num_workers} workers: {total} steps in "
+            f"{elapsed:.2f}s ({total / elapsed:,.0f} steps/s)"
+        )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Module: cached surfaces holding a whole rigid enemy formation.
+
+Assets:
+- Uses the shared enemy image from the asset cache (see asset_cache.py)
+"""
+
+import pygame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from canvas import ScaledCanvas
+
+class FormationSurface:
+    """
+    Composite a formation into one cached strip per row, drawn in one call.
+
+    The fleet moves rigidly, so the strips only need to be built when the
+    formation is created; a destroyed enemy is patched out by clearing its
+    area in its row's strip. Enemies are copied in with BLEND_RGBA_MAX onto
+    fully transparent strips, which reproduces their pixels exactly. Strips
+    are RLE encoded so the transparent gaps between enemies cost little to
+    blit (SDL's RLE alpha blend can differ from a plain blit by one level
+    per channel on edge pixels); keeping one strip per row means a kill only
+    re-encodes that row.
+
+    Attributes:
+        strips (dict): Row y -> (surface, left x) as built.
+    """
+    def __init__(self, image: pygame.Surface, max_pixels: int) -> None:
+        """
+        Prepare to composite copies of image, up to max_pixels in area.
+        """
+        self.image      = image
+        self.max_pixels = max_pixels
+        self.strips     = {}
+        self._erased    = set()
+
+    def build(self, positions) -> bool:
+        """
+        Composite the enemy image at every (x, y) in positions.
+
+        Returns False (and caches nothing) when the strips would exceed
+        max_pixels in total, in which case callers should draw per enemy.
+        """
+        self.strips = {}
+        self._erased.clear()
+        rows = {}
+        for x, y in positions:
+            rows.setdefault(y, []).append(x)
+        if not rows:
+            return False
+        iw, ih = self.image.get_size()
+        widths = {y: max(xs) + iw - min(xs) for y, xs in rows.items()}
+        if sum(widths.values()) * ih > self.max_pixels:
+            return False
+
+        for y, xs in rows.items():
+            left = min(xs)
+            strip = pygame.Surface((widths[y], ih), pygame.SRCALPHA)
+            strip.fill((0, 0, 0, 0))
+            strip.blits(
+                [(self.image, (x - left, 0), None, pygame.BLEND_RGBA_MAX) for x in xs],
+                False
+            )
+            strip = strip.convert_alpha()
+            strip.set_alpha(255, pygame.RLEACCEL)
+            self.strips[y] = (strip, left)
+        return True
+
+    def erase(self, x: int, y: int) -> None:
+        """
+        Clear the enemy that was built at (x, y).
+        """
+        strip, left = self.strips[y]
+        strip.fill((0, 0, 0, 0), pygame.Rect((x - left, 0), self.image.get_size()))
+        self._erased.add(strip)
+
+    def draw(self, screen: 'ScaledCanvas', dx: int, dy: int = 0) -> None:
+        """
+        Blit every row strip shifted by (dx, dy) from where it was built.
+        """
+        for strip in self._erased:
+            screen.forget(strip)  # its scaled copy predates the erase
+        self._erased.clear()
+        screen.blits(
+            [(strip, (left + dx, y + dy)) for y, (strip, left) in self.strips.items()],
+            False
+        )
@@ -0,0 +1,168 @@
+"""
+Module: per-phase frame timing and the in-game performance overlay.
+
+Assets:
+- Uses RetroTech.ttf (system font file, see settings.py)
+"""
+
+import time
+import pygame.font
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import AlienInvasion
+
+PHASES = (
+    'events', 'ship', 'fleet', 'bullets', 'particles', 'collisions', 'draw', 'sleep'
+)
+
+class FrameTimer:
+    """
+    Ring buffer of per-phase frame timings.
+
+    Each frame is one row of preallocated slots; lap() adds the time since
+    the previous mark to the current row and end_frame() advances the ring.
+    A phase that runs more than once in a frame (several fixed-timestep
+    ticks) accumulates; phases that did not run (e.g. updates on the Play
+    screen) stay at zero for that row.
+
+    Attributes:
+        size (int): Number of frames kept.
+        frames (int): Frames recorded since creation.
+    """
+    def __init__(self, size: int = 240, phases: tuple = PHASES) -> None:
+        """
+        Preallocate size rows of zeroed samples for every phase.
+        """
+        self.size    = size
+        self.phases  = phases
+        self.samples = {phase: [0.0] * size for phase in phases}
+        self.index   = 0
+        self.frames  = 0
+        self.clock   = time.perf_counter
+
+    def lap(self, phase: str, start: float) -> float:
+        """
+        Add the time since start to phase and return the current time.
+        """
+        now = self.clock()
+        self.samples[phase][self.index] += now - start
+        return now
+
+    def end_frame(self) -> None:
+        """
+        Advance to the next row of the ring and clear it.
+        """
+        self.frames += 1
+        self.index = (self.index + 1) % self.size
+        for row in self.samples.values():
+            row[self.index] = 0.0
+
+    def summary(self) -> dict:
+        """
+        Return {phase: (mean, p95, p99)} in milliseconds over the filled rows.
+        """
+        filled = min(self.frames, self.size)
+        result = {}
+        for phase, row in self.samples.items():
+            if filled == 0:
+                result[phase] = (0.0, 0.0, 0.0)
+                continue
+            if filled < self.size:
+                values = sorted(row[:filled])
+            else:
+                values = sorted(row)
+            mean = sum(values) / filled
+            p95 = values[min(filled - 1, int(filled * 0.95))]
+            p99 = values[min(filled - 1, int(filled * 0.99))]
+            result[phase] = (mean * 1000, p95 * 1000, p99 * 1000)
+        return result
+
+class PerfOverlay:
+    """
+    On-screen table of rolling phase timings and entity counts.
+
+    Toggled with settings.perf_overlay_key. The text is re-rendered only every
+    settings.perf_overlay_refresh frames so the overlay itself stays cheap.
+
+    Attributes:
+        visible (bool): Whether the overlay is drawn.
+        image: Rendered overlay surface (None until first shown).
+        rect: Screen position of the overlay.
+    """
+    def __init__(self, game: 'AlienInvasion') -> None:
+        """
+        Load the overlay font and start hidden.
+        """
+        self.game     = game
+        self.screen   = game.screen
+        self.settings = game.settings
+        self.timer    = game.frame_timer
+        self.font     = pygame.font.Font(
+            str(self.settings.font_file),
+            self.settings.perf_font_size
+        )
+        self.visible  = False
+        self.image    = None
+        self.rect     = pygame.Rect(0, 0, 0, 0)
+        self._age     = 0
+
+    def toggle(self) -> None:
+        """
+        Show or hide the overlay.
+        """
+        self.visible = not self.visible
+        self._age = 0
+
+    def _rows(self) -> list:
+        """
+        Build the table rows: a header, one row per phase, input-to-display
+        latency, entity counts and the quality level.
+        """
+        rows = [('ms', 'mean', 'p95', 'p99')]
+        for phase, (mean, p95, p99) in self.timer.summary().items():
+            rows.append((phase, f"{mean:.2f}", f"{p95:.2f}", f"{p99:.2f}"))
+        game = self.game
+        mean, p95, p99 = game.latency.summary()
+        rows.append(('input', f"{mean:.2f}", f"{p95:.2f}", f"{p99:.2f}"))
+        rows.append(('enemies', str(len(game.enemy_fleet.fleet))))
+        rows.append(('bullets', str(len(game.bullets))))
+        if game.particles:
+            rows.append(('particles', str(game.particles.count)))
+        if game.governor:
+            rows.append(('quality', f"{game.governor.level}/{game.governor.max_level}"))
+        return rows
+
+    def _render(self) -> None:
+        """
+        Render the table into one surface placed under the HUD's level text.
+        """
+        font = self.font
+        color = self.settings.text_color
+        rows = self._rows()
+        name_w = font.size('collisions ')[0]
+        cell_w = font.size('000.00 ')[0]
+        line_h = font.get_linesize()
+        self.image = pygame.Surface(
+            (name_w + cell_w * 3, line_h * len(rows)), pygame.SRCALPHA
+        )
+        for i, row in enumerate(rows):
+            x = 0
+            for j, cell in enumerate(row):
+                self.image.blit(font.render(cell, True, color), (x, i * line_h))
+                x += name_w if j == 0 else cell_w
+        hud = self.game.hud
+        self.rect = self.image.get_rect(
+            left=hud.padding, top=hud.level_rect.bottom + hud.padding
+        )
+
+    def draw(self) -> None:
+        """
+        Refresh the overlay text if it is stale, then draw it.
+        """
+        if not self.visible:
+            return
+        if self._age == 0 or self.image is None:
+            self._render()
+        self._age = (self._age + 1) % self.settings.perf_overlay_refresh
+        self.screen.blit(self.image, self.rect)
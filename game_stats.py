@@ -1,13 +1,12 @@
 """
-Module: track game statistics and handle high-score persistence.
+Module: track game statistics and record finished games on the leaderboard.
 
 Assets:
-- None (no external assets used here)
+- None directly (scores are stored by leaderboard.py)
 """
 
-from pathlib import Path
-import json
 from typing import TYPE_CHECKING
+from leaderboard import Leaderboard
 
 if TYPE_CHECKING:
     from main import AlienInvasion
@@ -23,32 +22,29 @@ class GameStats:
         score (int): Current score.
         level (int): Current game level.
         hi_score (int): Highest score recorded.
+        leaderboard (Leaderboard): Background store of finished games.
+                                   Headless games (simulation, benchmarks,
+                                   asset builds, environments) get a private
+                                   in-memory one, so they never add rows to
+                                   or migrate into the player's database.
     """
     def __init__(self, game: 'AlienInvasion') -> None:
         """
-        Initialize statistics; load high score from disk.
+        Initialize statistics; load the all-time high score.
         """
         self.game = game
         self.settings  = game.settings
         self.max_score = 0
-        self._init_saved_scores()
+        private = game.headless
+        self.leaderboard = Leaderboard(
+            ':memory:' if private else self.settings.leaderboard_file,
+            self.settings.leaderboard_size,
+            legacy_file=None if private else self.settings.scores_file,
+            interval=self.settings.score_flush_interval
+        )
+        self.hi_score = self.leaderboard.hi_score
         self.reset_stats()
 
-    def _init_saved_scores(self) -> None:
-        """
-        Load high score from file or initialize to zero.
-        """
-        path = self.settings.scores_file
-        if path.exists() and path.stat().st_size > 0:
-            try:
-                data = json.loads(path.read_text())
-                self.hi_score = data.get('hi_score', 0)
-            except Exception:
-                self.hi_score = 0
-        else:
-            self.hi_score = 0
-            self.save_scores()
-
     def reset_stats(self) -> None:
         """
         Reset statistics for a new game.
@@ -57,15 +53,26 @@ class GameStats:
         self.score = 0
         self.level = 1
 
-    def save_scores(self) -> None:
+    def record_game(self) -> None:
+        """
+        Queue the finished game on the leaderboard and ask it to write.
+
+        Never touches the database on the calling thread. Replayed games
+        are not recorded: they were played (and recorded) once already.
+        """
+        if self.score > 0 and not self.game.input_player:
+            self.leaderboard.submit(
+                self.settings.player_name, self.score, self.level
+            )
+        self.leaderboard.flush()
+
+    def close(self) -> None:
         """
-        Save high score to disk.
+        Record a game still in progress, then write and close (call on quit).
         """
-        data = {'hi_score': self.hi_score}
-        try:
-            Path(self.settings.scores_file).write_text(json.dumps(data, indent=4))
-        except Exception as e:
-            print(f"Error saving scores: {e}")
+        if self.game.game_active:
+            self.record_game()
+        self.leaderboard.close()
 
     def update(self, collisions) -> None:
         """
@@ -74,7 +81,6 @@ class GameStats:
         self._update_score(collisions)
         self._update_max_score()
         self._update_hi_score()
-        self.save_scores()
 
     def _update_score(self, collisions) -> None:
         """
@@ -0,0 +1,74 @@
+"""
+Module: pre-rendered glyphs for drawing HUD text without rasterizing.
+
+Assets:
+- Uses RetroTech.ttf (system font file, see settings.py)
+"""
+
+import pygame.font
+
+DIGITS = '0123456789,-'
+
+class GlyphAtlas:
+    """
+    Cache of rendered glyph and label surfaces for one font and color.
+
+    Digits, punctuation and whole label strings (e.g. 'Score: ') are
+    rendered once up front. Text is then laid out as a list of
+    (surface, position) pairs that can go straight to Surface.blits, so
+    changing a number costs a few cached blits and no font.render call.
+    Characters that were not pre-rendered are rendered and cached the first
+    time they are needed.
+
+    Attributes:
+        height (int): Line height of the font.
+        renders (int): Number of font.render calls made so far.
+    """
+    def __init__(self, font: pygame.font.Font, color, labels=(), chars=DIGITS) -> None:
+        """
+        Render every character in chars and every label string.
+        """
+        self.font    = font
+        self.color   = color
+        self.height  = font.get_height()
+        self.renders = 0
+        self._glyphs = {}
+        for text in (*chars, *labels):
+            self.glyph(text)
+
+    def glyph(self, text: str) -> pygame.Surface:
+        """
+        Return the cached surface for a character or label, rendering it once.
+        """
+        surface = self._glyphs.get(text)
+        if surface is None:
+            surface = self.font.render(text, True, self.color)
+            self._glyphs[text] = surface
+            self.renders += 1
+        return surface
+
+    def _pieces(self, label: str, value: str) -> list:
+        """
+        Return the glyph surfaces for a label followed by a value.
+        """
+        glyph = self.glyph
+        pieces = [glyph(label)] if label else []
+        pieces.extend(glyph(ch) for ch in value)
+        return pieces
+
+    def size(self, label: str, value: str) -> tuple:
+        """
+        Return the (w, h) that label + value occupies.
+        """
+        return (sum(s.get_width() for s in self._pieces(label, value)), self.height)
+
+    def layout(self, label: str, value: str, topleft) -> list:
+        """
+        Return (surface, (x, y)) pairs drawing label + value from topleft.
+        """
+        x, y = topleft
+        blits = []
+        for surface in self._pieces(label, value):
+            blits.append((surface, (x, y)))
+            x += surface.get_width()
+        return blits
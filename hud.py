@@ -8,6 +8,8 @@ Assets:
 import pygame.font
 from typing import TYPE_CHECKING
 
+from glyph_atlas import GlyphAtlas
+
 if TYPE_CHECKING:
     from game_stats import GameStats
     from main import AlienInvasion
@@ -15,7 +17,15 @@ if TYPE_CHECKING:
 class HUD:
     """
     Manage on-screen display of scores, levels, and lives.
+
+    Text is drawn from a GlyphAtlas and only re-laid-out when a displayed
+    value actually changes; version increases on every change so other code
+    (e.g. the dirty renderer) can tell when the HUD needs repainting.
+    With refresh_interval above 1 (set by the quality governor), score
+    changes are only laid out by flush() every refresh_interval frames.
     """
+    LABELS = ('Score: ', 'Max: ', 'Hi-Score: ', 'Level: ')
+
     def __init__(self, game: 'AlienInvasion') -> None:
         """
         Initialize HUD elements and prepare initial renderings.
@@ -30,94 +40,144 @@ class HUD:
             str(self.settings.font_file),
             self.settings.HUD_font_size
         )
+        self.atlas   = GlyphAtlas(self.font, self.settings.text_color, self.LABELS)
         self.padding = 20
+        self.version = 0
+        self.refresh_interval = 1
+        self._stale  = False
+        self._age    = 0
+        self._texts  = {}
+        self._blits  = {}
+        self._lives  = (None, [])
+        self._draw_list = None
         self._setup_life_image()
         self.update_scores()
         self.update_level()
 
     def _setup_life_image(self) -> None:
         """
-        Load and scale ship icon for life indicators.
+        Fetch the shared, scaled ship icon for life indicators.
         """
-        self.life_image = pygame.image.load(self.settings.ship_file)
-        self.life_image = pygame.transform.scale(
-            self.life_image,
+        self.life_image = self.game.assets.image(
+            self.settings.ship_file,
             (self.settings.ship_w, self.settings.ship_h)
         )
         self.life_rect = self.life_image.get_rect()
 
+    def _prep_text(self, name: str, label: str, value: str):
+        """
+        Return an unplaced Rect for label + value, or None if unchanged.
+        """
+        text = (label, value)
+        if self._texts.get(name) == text:
+            return None
+        self._texts[name] = text
+        return pygame.Rect((0, 0), self.atlas.size(label, value))
+
+    def _place_text(self, name: str, rect: pygame.Rect) -> None:
+        """
+        Lay out the glyphs for a field at its placed rect.
+        """
+        label, value = self._texts[name]
+        self._blits[name] = self.atlas.layout(label, value, rect.topleft)
+        self._draw_list = None
+        self.version += 1
+
     def update_scores(self) -> None:
         """
-        Re-render score, max score, and hi-score images.
+        Refresh score, max score, and hi-score text if their values changed.
+
+        Deferred to the next flush() while refresh_interval is above 1.
         """
+        if self.refresh_interval > 1:
+            self._stale = True
+            return
+        self._stale = False
         self._update_max_score()
         self._update_score()
         self._update_hi_score()
 
+    def flush(self) -> None:
+        """
+        Lay out deferred score changes once every refresh_interval frames.
+        """
+        self._age += 1
+        if self._stale and self._age >= self.refresh_interval:
+            self._age = 0
+            interval, self.refresh_interval = self.refresh_interval, 1
+            self.update_scores()
+            self.refresh_interval = interval
+
     def _update_score(self) -> None:
         """
-        Render current score image.
+        Lay out current score text.
         """
-        score_str = f"Score: {self.stats.score:,.0f}"
-        self.score_image = self.font.render(
-            score_str, True, self.settings.text_color
-        )
-        self.score_rect = self.score_image.get_rect()
-        self.score_rect.top   = self.max_score_rect.bottom + self.padding
-        self.score_rect.right = self.screen.get_rect().right - self.padding
+        rect = self._prep_text('score', 'Score: ', f"{self.stats.score:,.0f}")
+        if rect is None:
+            return
+        rect.top   = self.max_score_rect.bottom + self.padding
+        rect.right = self.screen.get_rect().right - self.padding
+        self.score_rect = rect
+        self._place_text('score', rect)
 
     def _update_max_score(self) -> None:
         """
-        Render max session score image.
+        Lay out max session score text.
         """
-        max_str = f"Max: {self.stats.max_score:,.0f}"
-        self.max_score_image = self.font.render(
-            max_str, True, self.settings.text_color
-        )
-        self.max_score_rect = self.max_score_image.get_rect()
-        self.max_score_rect.top   = self.padding
-        self.max_score_rect.right = self.screen.get_rect().right - self.padding
+        rect = self._prep_text('max', 'Max: ', f"{self.stats.max_score:,.0f}")
+        if rect is None:
+            return
+        rect.top   = self.padding
+        rect.right = self.screen.get_rect().right - self.padding
+        self.max_score_rect = rect
+        self._place_text('max', rect)
 
     def _update_hi_score(self) -> None:
         """
-        Render all-time high score image.
+        Lay out all-time high score text.
         """
-        hi = self.stats.hi_score
-        hi_str = f"Hi-Score: {hi:,.0f}"
-        self.hi_score_image = self.font.render(
-            hi_str, True, self.settings.text_color
-        )
-        self.hi_score_rect = self.hi_score_image.get_rect()
-        self.hi_score_rect.midtop = (
-            self.screen.get_rect().centerx, self.padding)
+        rect = self._prep_text('hi', 'Hi-Score: ', f"{self.stats.hi_score:,.0f}")
+        if rect is None:
+            return
+        rect.midtop = (self.screen.get_rect().centerx, self.padding)
+        self.hi_score_rect = rect
+        self._place_text('hi', rect)
 
     def update_level(self) -> None:
         """
-        Render current level image.
+        Lay out current level text.
         """
-        lvl_str = f"Level: {self.stats.level}"
-        self.level_image = self.font.render(
-            lvl_str, True, self.settings.text_color
-        )
-        self.level_rect = self.level_image.get_rect()
-        self.level_rect.left = self.padding
-        self.level_rect.top  = self.life_rect.bottom + self.padding
+        rect = self._prep_text('level', 'Level: ', str(self.stats.level))
+        if rect is None:
+            return
+        rect.left = self.padding
+        rect.top  = self.life_rect.bottom + self.padding
+        self.level_rect = rect
+        self._place_text('level', rect)
 
-    def _draw_lives(self) -> None:
-        """
-        Draw ship icons equal to lives left.
-        """
-        x, y = self.padding, self.padding
-        for _ in range(self.stats.ship_left):
-            self.screen.blit(self.life_image, (x, y))
-            x += self.life_rect.width + self.padding
+    def life_rects(self) -> list:
+        """
+        Return the screen rect of each ship icon for the lives left.
+        """
+        ship_left, rects = self._lives
+        if ship_left != self.stats.ship_left:
+            step = self.life_rect.width + self.padding
+            rects = [
+                self.life_rect.move(self.padding + step * i, self.padding)
+                for i in range(self.stats.ship_left)
+            ]
+            self._lives = (self.stats.ship_left, rects)
+            self._draw_list = None
+        return rects
 
     def draw(self) -> None:
         """
-        Draw all HUD elements on the screen.
+        Draw all HUD elements on the screen with one batched blit call.
         """
-        self.screen.blit(self.hi_score_image,  self.hi_score_rect)
-        self.screen.blit(self.max_score_image, self.max_score_rect)
-        self.screen.blit(self.score_image,     self.score_rect)
-        self._draw_lives()
-        self.screen.blit(self.level_image,     self.level_rect)
+        lives = self.life_rects()
+        if self._draw_list is None:
+            draw_list = [(self.life_image, rect) for rect in lives]
+            for blits in self._blits.values():
+                draw_list.extend(blits)
+            self._draw_list = draw_list
+        self.screen.blits(self._draw_list, False)
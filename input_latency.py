@@ -0,0 +1,74 @@
+"""
+Module: input-to-display latency measurement.
+
+Assets:
+- None
+"""
+
+import time
+
+class LatencyTracker:
+    """
+    Measure how long handled input takes to reach the screen.
+
+    mark() timestamps an input as it is handled (event dequeued, or key
+    state change seen by a poll). applied() is called after each simulation
+    tick: marked inputs have then taken effect. presented() is called after
+    the frame is pushed to the display, and records the time from each
+    applied input's mark to that moment. Samples live in a fixed ring buffer.
+
+    Attributes:
+        size (int): Number of samples kept.
+        samples (int): Samples recorded since creation.
+    """
+    def __init__(self, size: int = 240) -> None:
+        """
+        Preallocate the sample ring.
+        """
+        self.size     = size
+        self.samples  = 0
+        self.clock    = time.perf_counter
+        self._ring    = [0.0] * size
+        self._waiting = []
+        self._applied = []
+
+    def mark(self, stamp: float = None) -> None:
+        """
+        Record that an input was handled at stamp (default: now).
+        """
+        if len(self._waiting) < self.size:
+            self._waiting.append(self.clock() if stamp is None else stamp)
+
+    def applied(self) -> None:
+        """
+        Note that a tick has run, so every marked input has taken effect.
+        """
+        if self._waiting:
+            if len(self._applied) < self.size:
+                self._applied.extend(self._waiting)
+            self._waiting.clear()
+
+    def presented(self) -> None:
+        """
+        Record the latency of every applied input now that a frame is shown.
+        """
+        if not self._applied:
+            return
+        now = self.clock()
+        for stamp in self._applied:
+            self._ring[self.samples % self.size] = now - stamp
+            self.samples += 1
+        self._applied.clear()
+
+    def summary(self) -> tuple:
+        """
+        Return (mean, p95, p99) latency in milliseconds over the kept samples.
+        """
+        filled = min(self.samples, self.size)
+        if filled == 0:
+            return (0.0, 0.0, 0.0)
+        values = sorted(self._ring[:filled])
+        mean = sum(values) / filled
+        p95 = values[min(filled - 1, int(filled * 0.95))]
+        p99 = values[min(filled - 1, int(filled * 0.99))]
+        return (mean * 1000, p95 * 1000, p99 * 1000)
@@ -0,0 +1,249 @@
+"""
+Module: SQLite score store with per-player, per-day and all-time leaderboards.
+
+Assets:
+- Reads/writes Assets/file/leaderboard.db (see settings.py)
+- Imports the legacy Assets/file/scores.json once, if present
+"""
+
+import json
+import sqlite3
+import datetime
+import threading
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id      INTEGER PRIMARY KEY,
+    player  TEXT    NOT NULL,
+    score   INTEGER NOT NULL,
+    level   INTEGER NOT NULL,
+    day     TEXT    NOT NULL,
+    created REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_score  ON scores (score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_day    ON scores (day, score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_player ON scores (player, score DESC);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+LEGACY_PLAYER = 'Legacy'
+
+class ScoreStore:
+    """
+    Synchronous access to the scores database.
+
+    Every query is answered from an index: top-N all-time by score, top-N
+    for a day by (day, score) and personal bests by (player, score).
+
+    Attributes:
+        path (Path): Database file (or ':memory:').
+    """
+    def __init__(self, path) -> None:
+        """
+        Open (creating if needed) the database and its schema.
+        """
+        self.path = path if path == ':memory:' else Path(path)
+        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        if path != ':memory:':
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+
+    def add_many(self, rows) -> None:
+        """
+        Insert (player, score, level, day, created) rows in one transaction.
+        """
+        with self.conn:
+            self.conn.executemany(
+                'INSERT INTO scores (player, score, level, day, created) '
+                'VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+
+    def top(self, n: int = 10, day: str = None) -> list:
+        """
+        Return the n best (player, score, level, day) rows, all-time or for day.
+        """
+        if day is None:
+            cursor = self.conn.execute(
+                'SELECT player, score, level, day FROM scores '
+                'ORDER BY score DESC LIMIT ?', (n,)
+            )
+        else:
+            cursor = self.conn.execute(
+                'SELECT player, score, level, day FROM scores '
+                'WHERE day = ? ORDER BY score DESC LIMIT ?', (day, n)
+            )
+        return cursor.fetchall()
+
+    def personal_best(self, player: str) -> int:
+        """
+        Return player's best score (0 if they have none).
+        """
+        row = self.conn.execute(
+            'SELECT MAX(score) FROM scores WHERE player = ?', (player,)
+        ).fetchone()
+        return row[0] or 0
+
+    def best(self) -> int:
+        """
+        Return the all-time best score (0 for an empty store).
+        """
+        row = self.conn.execute('SELECT MAX(score) FROM scores').fetchone()
+        return row[0] or 0
+
+    def count(self) -> int:
+        """
+        Return the number of stored scores.
+        """
+        return self.conn.execute('SELECT COUNT(*) FROM scores').fetchone()[0]
+
+    def migrate_json(self, path) -> bool:
+        """
+        Import the hi_score from a legacy scores.json, once per database.
+
+        The score is stored for LEGACY_PLAYER on the file's modification day.
+        The JSON file itself is left untouched. Returns True if a score was
+        imported.
+        """
+        if path is None:
+            return False
+        done = self.conn.execute(
+            "SELECT 1 FROM meta WHERE key = 'migrated_json'"
+        ).fetchone()
+        path = Path(path)
+        if done or not path.exists():
+            return False
+        try:
+            hi_score = int(json.loads(path.read_text()).get('hi_score', 0))
+        except (OSError, ValueError, AttributeError):
+            hi_score = 0
+        stamp = path.stat().st_mtime
+        with self.conn:
+            if hi_score > 0:
+                self.conn.execute(
+                    'INSERT INTO scores (player, score, level, day, created) '
+                    'VALUES (?, ?, 0, ?, ?)',
+                    (LEGACY_PLAYER, hi_score,
+                     datetime.date.fromtimestamp(stamp).isoformat(), stamp)
+                )
+            self.conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('migrated_json', ?)",
+                (str(path),)
+            )
+        return hi_score > 0
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self.conn.close()
+
+class Leaderboard:
+    """
+    Record finished games on a background thread and cache the top-N lists.
+
+    submit() only queues a row in memory. The writer thread inserts queued
+    rows in one batch when flush() asks it to (at game over) or every
+    `interval` seconds, then re-reads the all-time and today top-N lists
+    into `top` and `today` and bumps `version`. The Play screen draws from
+    those cached lists, so it never waits on the database. close() stops the
+    thread and writes anything still queued.
+
+    Attributes:
+        store (ScoreStore): The database (owned by the writer thread once running).
+        size (int): Rows kept in each cached top-N list.
+        hi_score (int): All-time best when the leaderboard was opened.
+        top (list): Cached all-time top-N (player, score, level, day) rows.
+        today (list): Cached top-N rows for the current day.
+        version (int): Increases whenever the cached lists change.
+        writes (int): Number of batches inserted.
+    """
+    def __init__(self, path, size: int = 5, legacy_file=None,
+                 interval: float = 5.0) -> None:
+        """
+        Open the store, import legacy scores, read the lists, start the thread.
+        """
+        if path != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.store    = ScoreStore(path)
+        self.store.migrate_json(legacy_file)
+        self.size     = size
+        self.interval = interval
+        self.hi_score = self.store.best()
+        self.writes   = 0
+        self.version  = 0
+        self._refresh()
+        self._pending = []
+        self._lock    = threading.Lock()
+        self._wake    = threading.Event()
+        self._closed  = False
+        self._thread  = threading.Thread(
+            target=self._run, name='leaderboard', daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, player: str, score: int, level: int) -> None:
+        """
+        Queue one finished game; it is inserted with the next batch.
+        """
+        now = datetime.datetime.now()
+        with self._lock:
+            self._pending.append(
+                (player, score, level, now.date().isoformat(), now.timestamp())
+            )
+
+    def flush(self) -> None:
+        """
+        Ask the background thread to insert queued games now (non-blocking).
+        """
+        self._wake.set()
+
+    def close(self) -> None:
+        """
+        Stop the writer thread, insert anything queued and close the store.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        self._write_pending()
+        self.store.close()
+
+    def _run(self) -> None:
+        """
+        Background loop: wait for a flush request or the interval, then write.
+        """
+        while not self._closed:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if not self._closed:
+                self._write_pending()
+
+    def _write_pending(self) -> None:
+        """
+        Insert the queued rows as one batch and refresh the cached lists.
+        """
+        with self._lock:
+            rows, self._pending = self._pending, []
+        if not rows:
+            return
+        try:
+            self.store.add_many(rows)
+            self.writes += 1
+            self._refresh()
+        except sqlite3.Error as e:
+            print(f"Error saving scores: {e}")
+
+    def _refresh(self) -> None:
+        """
+        Re-read the all-time and today top-N lists.
+        """
+        self.top = self.store.top(self.size)
+        self.today = self.store.top(self.size, datetime.date.today().isoformat())
+        self.version += 1
@@ -41,89 +41,441 @@ Assets:
 - Integrates all sprites, HUD, and button assets defined in other modules.
 """
 
+import os
 import sys
+import time
+import argparse
 import pygame
+import snapshot
 from settings import Settings
+from asset_cache import AssetCache
+from audio import open_audio
+from canvas import ScaledCanvas
 from game_stats import GameStats
 from ship import Ship
 from enemy_fleet import EnemyFleet
-from bullet import Bullet
+from array_fleet import ArrayEnemyFleet
+from massive_fleet import MassiveEnemyFleet
+from bullet_pool import BulletPool
+from particles import ParticleSystem
 from button import Button
 from hud import HUD
+from scoreboard import Scoreboard
+from renderer import DirtyRectRenderer
+from frame_timer import FrameTimer, PerfOverlay
+from replay import InputRecorder, InputPlayer
+from input_latency import LatencyTracker
+from quality import QualityGovernor
+from spectate import SpectatorServer
+
+UP_KEYS   = (pygame.K_UP, pygame.K_w)
+DOWN_KEYS = (pygame.K_DOWN, pygame.K_s)
+FIRE_KEY  = pygame.K_SPACE
+GAME_KEYS = (*UP_KEYS, *DOWN_KEYS, FIRE_KEY)
 
 class AlienInvasion:
     """
     Manage game initialization, main loop, and overall orchestration.
     """
-    def __init__(self) -> None:
+    def __init__(self, headless: bool = False, settings: Settings = None) -> None:
         """
         Initialize pygame, hide cursor, load resources, and create game objects.
+
+        Args:
+            headless (bool): Use SDL's dummy video/audio drivers so the game can
+                             run with no window (CI, soak tests, benchmarks).
+            settings (Settings, optional): Pre-configured settings to use instead
+                                           of the defaults.
         """
-        pygame.init()
-        self.settings    = Settings()
+        # Startup phase timings in milliseconds (see --startup)
+        self.startup_times = {}
+        started = start = time.perf_counter()
+
+        self.headless = headless
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        self.settings    = settings or Settings()
         self.settings.initialize_dynamic_settings()
-
-        self.screen      = pygame.display.set_mode(
-            (self.settings.screen_w, self.settings.screen_h)
+        pygame.mixer.pre_init(
+            self.settings.mixer_frequency, -16, 2, self.settings.mixer_buffer
         )
+        pygame.init()
+        start = self._startup_lap('init', start)
+
+        # Draw through a canvas so the scene can render below window size
+        size  = (self.settings.screen_w, self.settings.screen_h)
+        scale = self.settings.render_scale
+        scaled_display = scale != 1.0 and self.settings.scaled_display
+        if scaled_display:
+            try:
+                self.display = pygame.display.set_mode(
+                    (max(1, round(size[0] * scale)), max(1, round(size[1] * scale))),
+                    pygame.SCALED
+                )
+            except pygame.error:
+                # No SDL renderer for SCALED here: scale in software instead
+                scaled_display = False
+        if not scaled_display:
+            self.display = pygame.display.set_mode(size)
+        self.screen      = ScaledCanvas(self.display, size, scale, scaled_display)
         pygame.display.set_caption(self.settings.name)
         pygame.mouse.set_visible(False)
+        start = self._startup_lap('display', start)
+
+        # Shared sprite cache; needs the display mode set for convert_alpha()
+        self.assets      = AssetCache(self.settings.asset_build_dir)
 
         # Load and scale background
-        self.bg = pygame.image.load(self.settings.bg_file)
-        self.bg = pygame.transform.scale(
-            self.bg,
-            (self.settings.screen_w, self.settings.screen_h)
+        self.bg = self.assets.image(
+            self.settings.bg_file,
+            (self.settings.screen_w, self.settings.screen_h),
+            opaque=True
         )
+        self.bg_fill = None  # solid color used instead of bg (see quality.py)
+        start = self._startup_lap('background', start)
+
+        # Sound effects, decoded once (silent when headless)
+        self.audio       = open_audio(self)
+        start = self._startup_lap('audio', start)
 
         # Game state and entities
         self.clock        = pygame.time.Clock()
         self.running      = True
         self.game_active  = False
+        self.frame        = 0
+        self.render_alpha = 1.0
+
+        # Optional input recording / replay (see replay.py)
+        self.input_recorder = None
+        self.input_player   = None
+
+        # Input handling: latency samples, and held keys for poll mode
+        self.latency        = LatencyTracker(self.settings.perf_window)
+        self._held_keys     = set()
+        self._fire_latched  = False
+        self._fire_cooldown = 0
+        self._last_autosave = 0
 
         self.game_stats   = GameStats(self)
         self.hud          = HUD(self)
         self.play_button  = Button(self, 'Play')
+        self.scoreboard   = Scoreboard(self)
+        self.frame_timer  = FrameTimer(self.settings.perf_window)
+        self.perf_overlay = PerfOverlay(self)
+        start = self._startup_lap('ui', start)
 
         self.ship         = Ship(self)
-        self.enemy_fleet  = EnemyFleet(self)
-        self.bullets      = pygame.sprite.Group()
+        if self.settings.fleet_backend == 'array':
+            self.enemy_fleet = ArrayEnemyFleet(self)
+        elif self.settings.fleet_backend == 'massive':
+            self.enemy_fleet = MassiveEnemyFleet(self)
+        else:
+            self.enemy_fleet = EnemyFleet(self)
+        self.bullets      = BulletPool(self)
+
+        # Optional explosion and trail effects (see particles.py)
+        self.particles = None
+        if self.settings.particles:
+            self.particles = ParticleSystem(self)
+        self._startup_lap('entities', start)
+
+        # Optional dirty-rectangle presentation instead of a full flip
+        # (a reduced render scale always presents the whole frame)
+        self.renderer = None
+        if self.settings.render_mode == 'dirty' and scale == 1.0:
+            self.renderer = DirtyRectRenderer(self)
+
+        # Optional resume snapshot, written off the frame path (see snapshot.py)
+        self.resume_writer = None
+        if self.settings.resume_file:
+            self.resume_writer = snapshot.SnapshotWriter(self.settings.resume_file)
+
+        # Optional state stream for spectators (see spectate.py)
+        self.spectators = None
+        if self.settings.spectate:
+            self.spectators = SpectatorServer(self)
+
+        # Optional frame-budget quality governor (used by run_game only)
+        self.governor = None
+        if self.settings.quality_governor:
+            self.governor = QualityGovernor(self)
+        self.startup_times['total'] = (time.perf_counter() - started) * 1000
+
+    def _startup_lap(self, phase: str, start: float) -> float:
+        """
+        Record the milliseconds since start as a startup phase; return now.
+        """
+        now = time.perf_counter()
+        self.startup_times[phase] = (now - start) * 1000
+        return now
 
     def run_game(self) -> None:
         """
         Enter main game loop: events, updates, collisions, and rendering.
+
+        With settings.fixed_timestep the update/collision step runs at a
+        constant settings.tick_rate from an accumulator of real time, so a
+        slow frame runs several ticks (at most settings.max_catchup_ticks)
+        instead of slowing the game down. Rendering happens once per loop
+        with sprites interpolated between their last two ticks. self.frame
+        counts ticks, so recordings replay tick for tick.
+
+        Each frame's work time (everything but the clock's sleep) is fed to
+        the quality governor, if there is one.
         """
+        timer = self.frame_timer
+        tick = 1.0 / self.settings.tick_rate
+        max_ticks = self.settings.max_catchup_ticks
+        accumulator = 0.0
+        last = timer.clock()
         while self.running:
+            start = began = timer.clock()
             self._check_events()
-            if self.game_active:
-                self.ship.update()
-                self.enemy_fleet.update()
-                self.bullets.update()
-                self._check_collisions()
-            self._update_screen()
+            start = timer.lap('events', start)
+            if not self.settings.fixed_timestep:
+                if self.game_active:
+                    start = self._update_game(start)
+                self._autosave()
+                start = self._update_screen_timed(start)
+                self._observe_frame(start - began)
+                self.clock.tick(self.settings.FPS)
+                timer.lap('sleep', start)
+                timer.end_frame()
+                self.frame += 1
+                continue
+
+            # Clamp long stalls (window drags, breakpoints) to one catch-up burst
+            accumulator += min(start - last, tick * max_ticks)
+            last = start
+            ticks = 0
+            while accumulator >= tick and ticks < max_ticks:
+                if self.game_active:
+                    start = self._update_game(start)
+                accumulator -= tick
+                ticks += 1
+                self.frame += 1
+            if accumulator >= tick:
+                accumulator %= tick  # drop the backlog rather than spiral
+            self.render_alpha = self._interpolation_alpha(accumulator / tick)
+            self._autosave()
+            start = self._update_screen_timed(start)
+            self._observe_frame(start - began)
             self.clock.tick(self.settings.FPS)
+            timer.lap('sleep', start)
+            timer.end_frame()
+
+    def _observe_frame(self, work: float) -> None:
+        """
+        Report a frame's work time in seconds to the quality governor.
+        """
+        if self.governor:
+            self.governor.observe(work)
+
+    def _autosave(self) -> None:
+        """
+        Save the resume snapshot every settings.autosave_interval ticks of play.
+
+        Only packs the game here; the file is written on the snapshot thread.
+        """
+        if not self.resume_writer or not self.game_active:
+            return
+        if self.frame - self._last_autosave >= self.settings.autosave_interval:
+            self.resume_writer.submit(self)
+            self._last_autosave = self.frame
+
+    def _interpolation_alpha(self, alpha: float) -> float:
+        """
+        Return how far between the last two ticks to draw sprites.
+
+        1.0 (draw at the latest tick) when interpolation is off, the game is
+        not running, or the dirty renderer needs drawn and simulated
+        positions to agree.
+        """
+        if (not self.settings.interpolate or not self.game_active
+                or self.renderer):
+            return 1.0
+        return alpha
+
+    def render_offset(self, per_tick: float) -> int:
+        """
+        Return the draw offset, in pixels, for something moving per_tick each tick.
+
+        Interpolated sprites are drawn (1 - render_alpha) of a tick behind
+        their simulated position; at render_alpha 1.0 this is always 0.
+        """
+        return round((self.render_alpha - 1.0) * per_tick)
+
+    def start_recording(self, path) -> None:
+        """
+        Record every handled input event to path (written on quit).
+        """
+        self.input_recorder = InputRecorder(path)
+
+    def run_replay(self, path, render: bool = False, paced: bool = False) -> dict:
+        """
+        Replay a recording frame-for-frame and return the outcome.
+
+        Each loop iteration is one fixed simulation step, exactly as when the
+        recording was made, so the same input always gives the same score and
+        level regardless of machine speed.
+
+        Args:
+            path: Replay file written by InputRecorder.
+            render (bool): Draw each frame.
+            paced (bool): Throttle to settings.FPS (for watching a replay).
+
+        Returns:
+            dict: frames, elapsed seconds, frames per second, score and level.
+        """
+        self.input_player = InputPlayer(path)
+        last_frame = self.input_player.last_frame
+        start = time.perf_counter()
+        while self.running and self.frame <= last_frame:
+            self._check_events()
+            if self.game_active:
+                self._update_game()
+            if render:
+                self._update_screen()
+            if paced:
+                self.clock.tick(self.settings.FPS)
+            self.frame += 1
+        elapsed = time.perf_counter() - start
+        return {
+            'frames': self.frame,
+            'elapsed': elapsed,
+            'fps': self.frame / elapsed if elapsed else float('inf'),
+            'score': self.game_stats.score,
+            'level': self.game_stats.level,
+        }
+
+    def run_simulation(self, frames: int, render: bool = False,
+                       fire_every: int = 5) -> dict:
+        """
+        Step the game as fast as possible with no frame cap.
+
+        Uses the same update/collision pipeline as run_game, but skips event
+        polling and clock.tick; self.frame counts the simulated frames, as in
+        run_game. A simple autopilot fires every fire_every frames, and a new
+        game starts whenever the last life is lost, so the run keeps
+        exercising the fleet, bullets and collisions.
+
+        Args:
+            frames (int): Number of frames to simulate.
+            render (bool): Also run _update_screen each frame.
+            fire_every (int): Fire a bullet every N frames (0 disables firing).
+
+        Returns:
+            dict: frames, elapsed seconds, frames per second, final stats and
+                  per-phase (mean, p95, p99) milliseconds.
+        """
+        self._start_game()
+        timer = self.frame_timer
+        start = time.perf_counter()
+        for frame in range(frames):
+            if not self.game_active:
+                self._start_game()
+            if fire_every and frame % fire_every == 0:
+                self._fire_bullet()
+            lap = self._update_game(timer.clock())
+            if render:
+                self._update_screen_timed(lap)
+            timer.end_frame()
+            self.frame += 1
+        elapsed = time.perf_counter() - start
+        return {
+            'frames': frames,
+            'elapsed': elapsed,
+            'fps': frames / elapsed if elapsed else float('inf'),
+            'score': self.game_stats.score,
+            'level': self.game_stats.level,
+            'phases': timer.summary(),
+        }
+
+    def _update_game(self, start: float = None) -> float:
+        """
+        Advance the ship, fleet and bullets one frame, then resolve collisions.
+
+        When start is given, each phase is timed into frame_timer and the
+        time at the end of the last phase is returned. The resulting state
+        is published to spectators, if any.
+        """
+        if self.settings.input_mode == 'poll':
+            self._poll_input()
+        if start is None:
+            self.ship.update()
+            self.enemy_fleet.update()
+            self.bullets.update()
+            if self.particles:
+                self.particles.update()
+            self._check_collisions()
+            self.latency.applied()
+            if self.spectators:
+                self.spectators.publish()
+            return None
+        lap = self.frame_timer.lap
+        self.ship.update()
+        start = lap('ship', start)
+        self.enemy_fleet.update()
+        start = lap('fleet', start)
+        self.bullets.update()
+        start = lap('bullets', start)
+        if self.particles:
+            self.particles.update()
+            start = lap('particles', start)
+        self._check_collisions()
+        self.latency.applied()
+        if self.spectators:
+            self.spectators.publish()
+        return lap('collisions', start)
+
+    def _poll_input(self) -> None:
+        """
+        Set movement from the keys held at the start of this tick, with autofire.
+
+        Live keys come from pygame.key.get_pressed(); during a replay the held
+        set is rebuilt from the recorded key events instead, so replays stay
+        exact. Holding fire shoots every settings.autofire_interval ticks, and
+        a tap shorter than a tick still fires once.
+        """
+        if self.input_player:
+            held = self._held_keys
+        else:
+            pressed = pygame.key.get_pressed()
+            held = {key for key in GAME_KEYS if pressed[key]}
+        self.ship.moving_up = any(key in held for key in UP_KEYS)
+        self.ship.moving_down = any(key in held for key in DOWN_KEYS)
+
+        if self._fire_cooldown:
+            self._fire_cooldown -= 1
+        if (FIRE_KEY in held or self._fire_latched) and not self._fire_cooldown:
+            self._fire_bullet()
+            self._fire_cooldown = self.settings.autofire_interval
+        self._fire_latched = False
+
+    def _update_screen_timed(self, start: float) -> float:
+        """
+        Run _update_screen and record it as the 'draw' phase.
+        """
+        self._update_screen()
+        return self.frame_timer.lap('draw', start)
 
     def _check_collisions(self) -> None:
         """
         Handle bullet-enemy collisions, ship hits, and level completion.
         """
-        # Bullet vs. enemy
-        collisions = pygame.sprite.groupcollide(
-            self.enemy_fleet.fleet,
-            self.bullets,
-            True,
-            True
-        )
+        # Bullet vs. enemy (grid broad phase, same result as groupcollide)
+        collisions = self.enemy_fleet.collide_bullets(self.bullets)
         if collisions:
             self.game_stats.update(collisions)
             self.hud.update_scores()
+            self.audio.play('impact')
+            if self.particles:
+                self.particles.explode(enemy.rect for enemy in collisions)
 
         # Ship hit or enemy breach
-        for enemy in self.enemy_fleet.fleet.sprites():
-            if (enemy.rect.colliderect(self.ship.rect) or
-                enemy.rect.right >= self.settings.screen_w):
-                self._ship_hit()
-                break
+        if self.enemy_fleet.check_ship_hit(self.ship.rect, self.settings.screen_w):
+            self._ship_hit()
 
         # Level cleared
         if not self.enemy_fleet.fleet:
@@ -143,7 +495,10 @@ class AlienInvasion:
             self._reset_level()
         else:
             self.game_active = False
+            self.game_stats.record_game()
             pygame.mouse.set_visible(True)
+            if self.resume_writer:
+                self.resume_writer.discard()
 
     def _reset_level(self) -> None:
         """
@@ -153,20 +508,30 @@ class AlienInvasion:
         self.enemy_fleet.fleet.empty()
         self.enemy_fleet.create_fleet()
         self.ship.reset_position()
+        if self.renderer:
+            self.renderer.invalidate()
 
     def _check_events(self) -> None:
         """
-        Process keyboard and mouse events.
+        Process keyboard and mouse events (or the replayed ones for this frame).
         """
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if self.input_player:
+            events = self.input_player.events_for(self.frame)
+        for event in events:
+            if self.input_recorder:
+                self.input_recorder.record(self.frame, event)
             if event.type == pygame.QUIT:
                 self._quit_game()
+            elif (event.type == pygame.KEYDOWN and
+                  event.key == self.settings.perf_overlay_key):
+                self.perf_overlay.toggle()
             elif event.type == pygame.KEYDOWN and self.game_active:
                 self._check_keydown(event)
             elif event.type == pygame.KEYUP and self.game_active:
                 self._check_keyup(event)
             elif event.type == pygame.MOUSEBUTTONDOWN and not self.game_active:
-                if self.play_button.check_clicked(event.pos):
+                if self.play_button.check_clicked(self.screen.to_logical(event.pos)):
                     self._start_game()
 
     def _start_game(self) -> None:
@@ -182,6 +547,12 @@ class AlienInvasion:
         self.enemy_fleet.create_fleet()
         self.bullets.empty()
         self.ship.reset_position()
+        if self.particles:
+            self.particles.clear()
+
+        self._held_keys.clear()
+        self._fire_latched  = False
+        self._fire_cooldown = 0
 
         self.game_active = True
         pygame.mouse.set_visible(False)
@@ -189,56 +560,226 @@ class AlienInvasion:
     def _check_keydown(self, event) -> None:
         """
         Respond to key presses for movement and firing.
+
+        In poll mode game keys only update the held-key set; the next tick
+        reads the keyboard (see _poll_input).
         """
-        if event.key in (pygame.K_UP, pygame.K_w):
+        if event.key in GAME_KEYS:
+            self.latency.mark()
+            if self.settings.input_mode == 'poll':
+                self._held_keys.add(event.key)
+                self._fire_latched |= event.key == FIRE_KEY
+                return
+        if event.key in UP_KEYS:
             self.ship.moving_up = True
-        elif event.key in (pygame.K_DOWN, pygame.K_s):
+        elif event.key in DOWN_KEYS:
             self.ship.moving_down = True
-        elif event.key == pygame.K_SPACE:
-            direction = -1 if self.ship.side == 'right' else 1
-            start = (
-                self.ship.rect.midleft if direction == -1
-                else self.ship.rect.midright
-            )
-            self.bullets.add(Bullet(self, start, direction))
+        elif event.key == FIRE_KEY:
+            self._fire_bullet()
         elif event.key == pygame.K_q:
             self._quit_game()
 
+    def _fire_bullet(self) -> None:
+        """
+        Spawn a bullet at the ship's nose, travelling toward the fleet, and
+        play the laser sound if it was fired.
+        """
+        direction = -1 if self.ship.side == 'right' else 1
+        start = (
+            self.ship.rect.midleft if direction == -1
+            else self.ship.rect.midright
+        )
+        if self.bullets.fire(start, direction) is not None:
+            self.audio.play('laser')
+
     def _check_keyup(self, event) -> None:
         """
         Respond to key releases for movement.
         """
-        if event.key in (pygame.K_UP, pygame.K_w):
+        if event.key in GAME_KEYS:
+            self.latency.mark()
+            if self.settings.input_mode == 'poll':
+                self._held_keys.discard(event.key)
+                return
+        if event.key in UP_KEYS:
             self.ship.moving_up = False
-        elif event.key in (pygame.K_DOWN, pygame.K_s):
+        elif event.key in DOWN_KEYS:
             self.ship.moving_down = False
 
     def _update_screen(self) -> None:
         """
         Draw background, sprites, HUD or play button, then flip display.
         """
-        self.screen.blit(self.bg, (0, 0))
+        if not self.game_active:
+            self.scoreboard.refresh()
+            if self.spectators:
+                self.spectators.publish()  # no ticks run on the Play screen
+        self.hud.flush()
+        if self.renderer:
+            self.renderer.present()
+        else:
+            self._draw_background()
+            self._draw_scene()
+            self.screen.flip()
+        self.latency.presented()
+
+    def _draw_background(self, rect: pygame.Rect = None) -> None:
+        """
+        Paint the background over rect (default: the whole screen).
+
+        Uses a solid fill of bg_fill instead of the image when it is set.
+        """
+        if self.bg_fill is not None:
+            self.screen.fill(self.bg_fill, rect)
+        elif rect is None:
+            self.screen.blit(self.bg, (0, 0))
+        else:
+            self.screen.blit(self.bg, rect, rect)
+
+    def _draw_scene(self) -> None:
+        """
+        Draw sprites and the HUD or play button over the current background.
+        """
         self.ship.draw()
-        for bullet in self.bullets.sprites():
-            bullet.draw_bullet()
+        self.bullets.draw()
         self.enemy_fleet.draw()
+        if self.particles:
+            self.particles.draw()
 
         if self.game_active:
             self.hud.draw()
         else:
             pygame.mouse.set_visible(True)
             self.play_button.draw()
-
-        pygame.display.flip()
+            self.scoreboard.draw()
+        self.perf_overlay.draw()
 
     def _quit_game(self) -> None:
         """
         End game loop, save scores, and quit pygame.
+
+        During a replay this only stops the replay loop.
         """
-        self.game_stats.save_scores()
+        if self.input_player:
+            self.running = False
+            return
+        if self.input_recorder:
+            self.input_recorder.close()
+        if self.resume_writer:
+            if self.game_active:
+                self.resume_writer.submit(self)
+                # Recorded on the leaderboard when the resumed game really ends
+                self.game_active = False
+            self.resume_writer.close()
+        self.game_stats.close()
+        self.audio.stop()
+        if self.spectators:
+            self.spectators.close()
         pygame.quit()
         sys.exit()
 
+def _parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parse command-line options for normal play or headless simulation.
+    """
+    parser = argparse.ArgumentParser(description='Alien Invasion')
+    parser.add_argument('--headless', action='store_true',
+                        help='run uncapped with no window and report frames/sec')
+    parser.add_argument('--frames', type=int, default=10000,
+                        help='frames to simulate in headless mode')
+    parser.add_argument('--render', action='store_true',
+                        help='still draw each frame in headless mode')
+    parser.add_argument('--fleet', choices=('sprite', 'array', 'massive'),
+                        default='sprite',
+                        help="enemy fleet backend ('massive' is the stress mode)")
+    parser.add_argument('--enemies', type=int,
+                        help='enemies per wave with --fleet massive')
+    parser.add_argument('--rows', type=int, help='override formation rows')
+    parser.add_argument('--cols', type=int, help='override formation columns')
+    parser.add_argument('--dirty', action='store_true',
+                        help='present with dirty rectangles instead of full flips')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='render at this fraction of the window size (e.g. 0.5)')
+    parser.add_argument('--spectate', nargs='?', type=int, const=0, metavar='PORT',
+                        help='stream the game to spectators (python spectate.py)')
+    parser.add_argument('--mute', action='store_true',
+                        help='play no sound effects')
+    parser.add_argument('--no-particles', action='store_true',
+                        help='draw no explosion or trail particles')
+    parser.add_argument('--trails', action='store_true',
+                        help='leave particle trails behind bullets and the ship')
+    parser.add_argument('--fixed-quality', action='store_true',
+                        help='keep full quality instead of adapting to the frame budget')
+    parser.add_argument('--poll-input', action='store_true',
+                        help='poll held keys each tick (with autofire) instead of key events')
+    parser.add_argument('--record', metavar='PATH',
+                        help='record input events to PATH')
+    parser.add_argument('--replay', metavar='PATH',
+                        help='replay input events from PATH and report the result')
+    parser.add_argument('--player', default='Player',
+                        help='name to record scores under on the leaderboard')
+    parser.add_argument('--resume', metavar='PATH',
+                        help='continue the game saved in PATH, and save to it on quit')
+    parser.add_argument('--startup', action='store_true',
+                        help='report startup phase timings and exit')
+    return parser.parse_args(argv)
+
+def _settings_from_args(args: argparse.Namespace) -> Settings:
+    """
+    Build Settings with any command-line overrides applied.
+    """
+    settings = Settings()
+    settings.fleet_backend = args.fleet
+    settings.fleet_rows = args.rows
+    settings.fleet_cols = args.cols
+    if args.enemies:
+        settings.massive_enemies = args.enemies
+    settings.render_mode = 'dirty' if args.dirty else 'full'
+    settings.render_scale = args.scale
+    settings.player_name = args.player
+    settings.input_mode = 'poll' if args.poll_input else 'events'
+    settings.quality_governor = not args.fixed_quality
+    settings.sound = not args.mute
+    settings.particles = not args.no_particles
+    settings.particle_trails = args.trails
+    settings.resume_file = args.resume
+    if args.spectate is not None:
+        settings.spectate = True
+        settings.spectate_port = args.spectate or settings.spectate_port
+    return settings
+
 if __name__ == '__main__':
-    ai = AlienInvasion()
-    ai.run_game()
+    args = _parse_args()
+    ai = AlienInvasion(headless=args.headless, settings=_settings_from_args(args))
+    if args.startup:
+        for phase, ms in ai.startup_times.items():
+            print(f"{phase:<12} {ms:>8.2f} ms")
+        print(f"{'sprites':<12} {ai.assets.built} from build, "
+              f"{ai.assets.disk_loads} file loads")
+        ai.game_stats.close()
+    elif args.replay:
+        result = ai.run_replay(
+            args.replay,
+            render=not args.headless or args.render,
+            paced=not args.headless
+        )
+        print(
+            f"replayed {result['frames']} frames in {result['elapsed']:.3f}s "
+            f"({result['fps']:,.0f} fps), score {result['score']}, "
+            f"level {result['level']}"
+        )
+        ai.game_stats.close()
+    elif args.headless:
+        result = ai.run_simulation(args.frames, render=args.render)
+        print(
+            f"{result['frames']} frames in {result['elapsed']:.3f}s "
+            f"({result['fps']:,.0f} fps), score {result['score']}, "
+            f"level {result['level']}"
+        )
+        ai.game_stats.close()
+    else:
+        if args.record:
+            ai.start_recording(args.record)
+        if args.resume:
+            snapshot.restore_file(ai, args.resume)
+        ai.run_game()
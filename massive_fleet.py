@@ -0,0 +1,138 @@
+"""
+Module: massive-wave stress mode, a world-sized fleet that scrolls into view.
+
+Assets:
+- Uses ememyShip.png through the shared asset cache (see asset_cache.py)
+"""
+
+import math
+import numpy as np
+from array_fleet import ArrayEnemyFleet
+from enemy_fleet import STATE_HEADER
+
+class MassiveEnemyFleet(ArrayEnemyFleet):
+    """
+    Thousands of enemies in a world that extends far left of the screen.
+
+    The wave is laid out in rows that fill the screen height and columns
+    that run off the left edge, then marches toward the ship rigidly (every
+    enemy at its start x plus one shared shift), so the whole world scrolls
+    into view. Enemies are kept sorted by start x, which makes the ones
+    inside or near the viewport one contiguous index range, found with two
+    np.searchsorted calls per frame. Only that active window is moved,
+    collided and drawn; everything outside it costs nothing per frame. The
+    collision grid indexes the whole wave once, at its start positions, and
+    is queried shifted back by the wave's whole-pixel shift, so it never
+    changes while the wave scrolls.
+
+    Attributes:
+        x0 (ndarray): Start x of every enemy, ascending (int64).
+        shift (float): Distance the world has moved since the wave began.
+        lo (int), hi (int): Active window of enemy indices [lo, hi).
+        world_w (int): Width of the wave's world in pixels.
+    """
+    def create_fleet(self) -> None:
+        """
+        Lay out settings.massive_enemies enemies and activate the visible ones.
+        """
+        self._layout(self.settings.massive_enemies)
+        self.alive[:] = True
+        self._start(0.0)
+
+    def _layout(self, n: int) -> None:
+        """
+        Compute start positions for a wave of n enemies (kept if n is unchanged).
+        """
+        w, h = self.enemy_w, self.enemy_h
+        gap_x = w + w // 2
+        gap_y = h + h // 2
+        rows = max(1, (self.settings.screen_h - h) // gap_y)
+        if self.alive is None or len(self.alive) != n:
+            # Column 0 is the front line; later columns sit further left
+            col = np.arange(n) // rows
+            row = np.arange(n) % rows
+            order = np.argsort(-col, kind='stable')
+            self.x0 = (w - col * gap_x)[order].astype(np.int64)
+            self.ys = (h // 2 + row * gap_y)[order].astype(np.int64)
+            self.xs = np.empty(n, dtype=np.float64)
+            self.ix = np.empty(n, dtype=np.int64)
+            self.vx = np.ones(n, dtype=np.float64)
+            self.alive = np.empty(n, dtype=bool)
+            self.grid.build(np.arange(n), self.x0, self.ys, w, h)
+        self.world_w = -(-n // rows) * gap_x
+
+    def _start(self, shift: float) -> None:
+        """
+        Place the wave shift pixels along and activate the visible window.
+        """
+        self.xs[:] = self.x0 + shift
+        self.ix[:] = self.x0 + math.floor(shift)
+        self.count = int(np.count_nonzero(self.alive))
+        self.composite = None
+        self.shift = shift
+        self._drift = (math.floor(shift),) * 2
+
+        self.lo, self.hi = self._window()
+
+    def _window(self) -> tuple:
+        """
+        Return the [lo, hi) index range overlapping the viewport plus margin.
+        """
+        margin = self.settings.cull_margin
+        step = math.floor(self.shift)
+        left = -margin - self.enemy_w - step
+        right = self.settings.screen_w + margin - step
+        return (
+            int(np.searchsorted(self.x0, left, side='right')),
+            int(np.searchsorted(self.x0, right, side='right')),
+        )
+
+    def _indexed(self, keys: set) -> list:
+        """
+        Return the keys from a grid query that are living and in the window.
+        """
+        lo, hi, alive = self.lo, self.hi, self.alive
+        return [key for key in sorted(keys) if lo <= key < hi and alive[key]]
+
+    def update(self) -> None:
+        """
+        Scroll the world and move only the enemies in the active window.
+        """
+        direction = 1 if self.game.ship.side == 'right' else -1
+        self.shift += self.settings.enemy_speed * direction
+        step = math.floor(self.shift)
+        self._drift = (step, step)
+        self.lo, self.hi = self._window()
+        window = slice(self.lo, self.hi)
+        self.xs[window] = self.x0[window] + self.shift
+        self.ix[window] = self.x0[window] + step
+
+    def state(self) -> tuple:
+        """
+        Return (xs, ys, alive) arrays for the whole wave, off-screen included.
+        """
+        xs = self.x0 + math.floor(self.shift)
+        return xs.astype(np.int32), self.ys.astype(np.int32), self.alive.copy()
+
+    def save_state(self) -> bytes:
+        """
+        Pack the shift and one alive bit per enemy (the layout is recomputed).
+        """
+        return (STATE_HEADER.pack(len(self.alive), self.shift)
+                + np.packbits(self.alive).tobytes())
+
+    def load_state(self, data: bytes) -> None:
+        """
+        Restore the wave as save_state() packed it.
+        """
+        n, shift = STATE_HEADER.unpack_from(data)
+        bits = np.frombuffer(data, np.uint8, offset=STATE_HEADER.size)
+        self._layout(n)
+        self.alive[:] = np.unpackbits(bits, count=n).astype(bool)
+        self._start(shift)
+
+    def living(self) -> np.ndarray:
+        """
+        Return the indices of the living enemies in the active window.
+        """
+        return np.flatnonzero(self.alive[self.lo:self.hi]) + self.lo
@@ -0,0 +1,257 @@
+"""
+Module: array-backed particle effects (enemy explosions, bullet and engine trails).
+
+Assets:
+- None (particles are plain colored squares; colors come from settings.py)
+"""
+
+import numpy as np
+import pygame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import AlienInvasion
+
+EXPLOSION = 0
+TRAIL     = 1
+
+# Shades per particle kind, from full color down to the background color
+FADE_STEPS = 8
+
+class ParticleSystem:
+    """
+    Tens of thousands of short-lived particles in preallocated NumPy arrays.
+
+    Every particle is one slot of the position, velocity, life and kind
+    arrays; the live ones are always the first `count` slots. update()
+    moves, slows and ages all of them in a handful of array operations and
+    compacts the survivors to the front with one boolean mask, so no
+    per-particle Python object ever exists. draw() computes every screen
+    position and fade shade at once and writes the squares straight into
+    the canvas's pixels through pygame.surfarray (or, for 24-bit surfaces,
+    one batched Surface.blits call).
+
+    Particles are purely visual: they use their own random generator and
+    never touch game state, so recordings and replays are unaffected.
+
+    Particles past `limit` are never created. A tick's explosions share the
+    remaining room evenly, so under load every kill still gets a (smaller)
+    burst instead of the first few taking all of it.
+
+    Attributes:
+        capacity (int): Number of preallocated slots (settings.particle_cap).
+        limit (int): Maximum number of live particles (at most capacity).
+        count (int): Live particles.
+        spawned (int): Particles created since creation.
+        dropped (int): Particles not created because the limit was reached.
+    """
+    def __init__(self, game: 'AlienInvasion') -> None:
+        """
+        Preallocate every particle slot.
+        """
+        self.game     = game
+        self.settings = game.settings
+        self.capacity = self.settings.particle_cap
+        self.limit    = self.capacity
+        self.count    = 0
+        self.spawned  = 0
+        self.dropped  = 0
+        self.x        = np.zeros(self.capacity, np.float32)
+        self.y        = np.zeros(self.capacity, np.float32)
+        self.vx       = np.zeros(self.capacity, np.float32)
+        self.vy       = np.zeros(self.capacity, np.float32)
+        self.life     = np.zeros(self.capacity, np.int16)
+        self.kind     = np.zeros(self.capacity, np.uint8)
+        self._arrays  = (self.x, self.y, self.vx, self.vy, self.life, self.kind)
+        self._rng     = np.random.default_rng()
+        self._palette = None  # (surface, size, mapped colors, squares)
+
+    def emit(self, xs, ys, count: int, kind: int, speed: float,
+             vx: float = 0.0, vy: float = 0.0) -> None:
+        """
+        Spawn count particles at each (xs[i], ys[i]).
+
+        Each particle gets a random direction and a random speed up to
+        speed, added to the shared (vx, vy), and a random life between half
+        and all of settings.particle_life ticks.
+        """
+        xs = np.asarray(xs, np.float32).ravel()
+        ys = np.asarray(ys, np.float32).ravel()
+        total = len(xs) * count
+        room = max(0, self.limit - self.count)
+        if total > room:
+            self.dropped += total - room
+            if not room or not len(xs):
+                return
+            count = room // len(xs)
+            if not count:
+                # Less than one each: one particle for the first `room` origins
+                xs, ys, count = xs[:room], ys[:room], 1
+            total = len(xs) * count
+        if not total:
+            return
+
+        rng = self._rng
+        lo, hi = self.count, self.count + total
+        angle = rng.uniform(0.0, 2 * np.pi, total)
+        velocity = rng.uniform(0.0, speed, total)
+        self.x[lo:hi] = np.repeat(xs, count)
+        self.y[lo:hi] = np.repeat(ys, count)
+        self.vx[lo:hi] = np.cos(angle) * velocity + vx
+        self.vy[lo:hi] = np.sin(angle) * velocity + vy
+        life = self.settings.particle_life
+        self.life[lo:hi] = rng.integers(max(1, life // 2), life + 1, total)
+        self.kind[lo:hi] = kind
+        self.count = hi
+        self.spawned += total
+
+    def explode(self, rects) -> None:
+        """
+        Spawn an explosion burst at the center of every rect.
+        """
+        centers = [rect.center for rect in rects]
+        if not centers:
+            return
+        xs, ys = zip(*centers)
+        self.emit(
+            xs, ys, self.settings.particle_burst, EXPLOSION,
+            self.settings.particle_speed
+        )
+
+    def trail(self) -> None:
+        """
+        Spawn one trail particle behind every live bullet and the ship.
+        """
+        game = self.game
+        speed = self.settings.particle_trail_speed
+        bullets = game.bullets.sprites()
+        if bullets:
+            xs = [b.rect.centerx - b.direction * b.rect.width // 2 for b in bullets]
+            ys = [b.rect.centery for b in bullets]
+            self.emit(xs, ys, 1, TRAIL, speed)
+        ship = game.ship.rect
+        # The engine is on the side away from the fleet (see _fire_bullet)
+        back = 1 if game.ship.side == 'right' else -1
+        engine = ship.midright if back == 1 else ship.midleft
+        self.emit(
+            [engine[0]], [engine[1]], 1, TRAIL, speed,
+            vx=back * self.settings.particle_engine_speed
+        )
+
+    def update(self) -> None:
+        """
+        Move, slow and age every live particle, then drop the dead ones.
+        """
+        if self.settings.particle_trails:
+            self.trail()
+        n = self.count
+        if not n:
+            return
+        x, y, vx, vy, life = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n], self.life[:n]
+        x += vx
+        y += vy
+        vx *= self.settings.particle_drag
+        vy *= self.settings.particle_drag
+        life -= 1
+        alive = life > 0
+        k = int(np.count_nonzero(alive))
+        if k < n:
+            for array in self._arrays:
+                array[:k] = array[:n][alive]
+            self.count = k
+
+    def clear(self) -> None:
+        """
+        Remove every live particle.
+        """
+        self.count = 0
+
+    def bounds(self):
+        """
+        Return the logical Rect covering every live particle, or None.
+        """
+        n = self.count
+        if not n:
+            return None
+        size = self.settings.particle_size
+        left, top = int(self.x[:n].min()), int(self.y[:n].min())
+        return pygame.Rect(
+            left, top,
+            int(self.x[:n].max()) - left + size, int(self.y[:n].max()) - top + size
+        )
+
+    def _shades(self, surface: pygame.Surface, size: int) -> tuple:
+        """
+        Return (mapped colors, squares) for every kind and fade step on surface.
+
+        Shades fade from the kind's color toward the background's average
+        color, so dying particles blend in instead of turning into black
+        specks over the starfield.
+        """
+        palette = self._palette
+        if palette and palette[0] is surface and palette[1] == size:
+            return palette[2], palette[3]
+        background = np.array(pygame.transform.average_color(self.game.bg)[:3], float)
+        shades = []
+        for color in (self.settings.particle_explosion_color,
+                      self.settings.particle_trail_color):
+            color = np.array(color, float)
+            for step in range(FADE_STEPS):
+                mix = (step + 1) / FADE_STEPS
+                shades.append(tuple(int(c) for c in background + (color - background) * mix))
+        mapped = np.array([surface.map_rgb(shade) for shade in shades], np.uint32)
+        squares = []
+        for shade in shades:
+            square = pygame.Surface((size, size)).convert(surface)
+            square.fill(shade)
+            squares.append(square)
+        self._palette = (surface, size, mapped, squares)
+        return mapped, squares
+
+    def draw(self) -> None:
+        """
+        Draw every live particle as a square that fades with its life.
+        """
+        n = self.count
+        if not n:
+            return
+        canvas = self.game.screen
+        surface = canvas.surface
+        scale = canvas.scale
+        size = max(1, round(self.settings.particle_size * scale))
+        behind = self.game.render_alpha - 1.0
+        xs = ((self.x[:n] + self.vx[:n] * behind) * scale).astype(np.intp)
+        ys = ((self.y[:n] + self.vy[:n] * behind) * scale).astype(np.intp)
+        width, height = surface.get_size()
+        inside = (xs >= 0) & (ys >= 0) & (xs <= width - size) & (ys <= height - size)
+        xs, ys = xs[inside], ys[inside]
+        life = self.settings.particle_life
+        step = np.minimum(
+            self.life[:n][inside].astype(np.intp) * FADE_STEPS // life, FADE_STEPS - 1
+        )
+        shade = self.kind[:n][inside].astype(np.intp) * FADE_STEPS + step
+        mapped, squares = self._shades(surface, size)
+
+        if surface.get_bytesize() == 3:
+            # surfarray cannot reference 24-bit pixels
+            surface.blits(
+                [(squares[i], pos) for i, pos in zip(shade.tolist(), zip(xs.tolist(), ys.tolist()))],
+                False
+            )
+            return
+        colors = mapped[shade]
+        pixels = pygame.surfarray.pixels2d(surface)
+        for dx in range(size):
+            for dy in range(size):
+                pixels[xs + dx, ys + dy] = colors
+        del pixels  # unlock the surface
+
+    def stats(self) -> dict:
+        """
+        Return live/spawned/dropped counters.
+        """
+        return {
+            'live': self.count,
+            'spawned': self.spawned,
+            'dropped': self.dropped,
+        }
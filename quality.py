@@ -0,0 +1,127 @@
+"""
+Module: adaptive quality governor that holds the frame rate on slow machines.
+
+Assets:
+- Uses the game's pre-scaled background surface for its solid fill color (see main.py)
+"""
+
+import pygame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import AlienInvasion
+
+# Steps that change the simulation, so are never taken while recording input
+GAMEPLAY_STEPS = ('bullets',)
+
+class QualityGovernor:
+    """
+    Step rendering quality down when frames run over budget, and back up.
+
+    observe() is fed the work time of every frame (everything but the
+    clock's sleep). Once settings.quality_window frames are collected their
+    mean is compared with the 1 / settings.FPS budget: above
+    settings.quality_high of it, one more step of settings.quality_steps is
+    taken; below settings.quality_low of it for settings.quality_recover
+    windows in a row, the last step is undone. The gap between the two
+    thresholds and the slower recovery are the hysteresis that keeps the
+    level from flapping.
+
+    Steps, cheapest loss first:
+        'hud': lay out HUD text changes only every
+               settings.quality_hud_interval frames.
+        'particles': cap live particles at settings.quality_particle_cap.
+        'background': fill with the background's average color instead of
+                      blitting the image.
+        'resolution': draw at settings.quality_render_scale (only when the
+                      canvas can change scale, see canvas.py).
+        'bullets': cap live bullets at settings.quality_bullet_cap.
+
+    Attributes:
+        level (int): Number of steps currently taken (0 is full quality).
+        max_level (int): Number of available steps.
+        changes (int): Level changes since creation.
+    """
+    def __init__(self, game: 'AlienInvasion') -> None:
+        """
+        Start at full quality with an empty window.
+        """
+        self.game      = game
+        self.settings  = game.settings
+        self.steps     = tuple(
+            step for step in self.settings.quality_steps
+            if (step != 'resolution' or game.screen.rescalable)
+            and (step != 'particles' or game.particles)
+        )
+        self.max_level = len(self.steps)
+        self.level     = 0
+        self.changes   = 0
+        self.budget    = 1.0 / self.settings.FPS
+        self._total    = 0.0
+        self._count    = 0
+        self._good     = 0
+        self._fill     = None
+
+    def observe(self, frame_time: float) -> None:
+        """
+        Add one frame's work time in seconds; re-evaluate after a full window.
+        """
+        self._total += frame_time
+        self._count += 1
+        if self._count < self.settings.quality_window:
+            return
+        mean = self._total / self._count
+        self._total = 0.0
+        self._count = 0
+
+        if mean > self.budget * self.settings.quality_high:
+            self._good = 0
+            if self.level < self.max_level:
+                self.set_level(self.level + 1)
+        elif mean < self.budget * self.settings.quality_low:
+            self._good += 1
+            if self._good >= self.settings.quality_recover and self.level > 0:
+                self._good = 0
+                self.set_level(self.level - 1)
+        else:
+            self._good = 0
+
+    def set_level(self, level: int) -> None:
+        """
+        Apply the first level steps and undo the rest.
+        """
+        self.level = max(0, min(level, self.max_level))
+        self.changes += 1
+        game = self.game
+        active = self.steps[:self.level]
+        if game.input_recorder:
+            active = [step for step in active if step not in GAMEPLAY_STEPS]
+        settings = self.settings
+
+        game.hud.refresh_interval = (
+            settings.quality_hud_interval if 'hud' in active else 1
+        )
+        if 'background' in active:
+            if self._fill is None:
+                self._fill = pygame.transform.average_color(game.bg)[:3]
+            game.bg_fill = self._fill
+        else:
+            game.bg_fill = None
+        game.screen.set_scale(
+            min(settings.quality_render_scale, settings.render_scale)
+            if 'resolution' in active else settings.render_scale
+        )
+        if game.particles:
+            particles = game.particles
+            particles.limit = (
+                min(settings.quality_particle_cap, particles.capacity)
+                if 'particles' in active else particles.capacity
+            )
+        if 'bullets' in active:
+            game.bullets.limit = min(settings.quality_bullet_cap,
+                                     game.bullets.capacity)
+        else:
+            game.bullets.limit = game.bullets.capacity
+
+        if game.renderer:
+            game.renderer.invalidate()
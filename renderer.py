@@ -0,0 +1,141 @@
+"""
+Module: dirty-rectangle renderer that only repaints and pushes what changed.
+
+Assets:
+- Uses the game's pre-scaled background surface or its solid fill (see main.py)
+"""
+
+import pygame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import AlienInvasion
+
+class DirtyRectRenderer:
+    """
+    Opt-in replacement for the full background blit and display.flip().
+
+    Each frame it compares the rects drawn last frame with the rects about to
+    be drawn (ship, bullets, enemies, particles, HUD text). Background is restored only
+    under last frame's sprites, the scene is drawn, and only the regions that
+    changed are pushed with pygame.display.update(rects). When the changed
+    area exceeds settings.dirty_area_limit of the screen, or after
+    invalidate() (level resets, Play/game-over switches), or while the canvas
+    draws below full scale, it falls back to a full repaint and flip.
+
+    Attributes:
+        game: Reference to main game instance.
+        full_frames (int): Frames presented with a full flip.
+        dirty_frames (int): Frames presented with partial updates.
+    """
+    def __init__(self, game: 'AlienInvasion') -> None:
+        """
+        Start with an empty history so the first frame is a full repaint.
+        """
+        self.game     = game
+        self.screen   = game.screen
+        self.settings = game.settings
+        self.area_limit = (
+            self.settings.screen_w * self.settings.screen_h
+            * self.settings.dirty_area_limit
+        )
+        self.full_frames  = 0
+        self.dirty_frames = 0
+        self._prev_rects  = set()
+        self._prev_hud    = None
+        self._prev_overlay = []
+        self._prev_active = None
+        self._force_full  = True
+
+    def invalidate(self) -> None:
+        """
+        Force the next frame to be a full repaint and flip.
+        """
+        self._force_full = True
+
+    def _collect_rects(self) -> set:
+        """
+        Return (x, y, w, h) tuples for every moving sprite about to be drawn.
+        """
+        game = self.game
+        rects = {tuple(game.ship.rect)}
+        rects.update(tuple(bullet.rect) for bullet in game.bullets.sprites())
+        rects.update(tuple(rect) for rect in game.enemy_fleet.rects())
+        if game.particles:
+            # One rect around all particles; a big spread falls back to a full repaint
+            bounds = game.particles.bounds()
+            if bounds:
+                rects.add(tuple(bounds))
+        return rects
+
+    def _hud_state(self) -> tuple:
+        """
+        Return values that change whenever the HUD or overlay needs repainting.
+        """
+        overlay = self.game.perf_overlay
+        return (
+            self.game.hud.version, self.game.game_stats.ship_left,
+            self.game.scoreboard.version,
+            overlay.image if overlay.visible else None
+        )
+
+    def _overlay_rects(self) -> list:
+        """
+        Return the screen areas covered by the HUD, Play screen and overlay.
+        """
+        game = self.game
+        if game.game_active:
+            hud = game.hud
+            rects = [
+                hud.score_rect, hud.max_score_rect,
+                hud.hi_score_rect, hud.level_rect
+            ]
+            rects.extend(hud.life_rects())
+        else:
+            rects = [
+                game.play_button.rect.union(game.play_button.msg_image_rect),
+                game.scoreboard.rect
+            ]
+        if game.perf_overlay.visible:
+            rects.append(game.perf_overlay.rect)
+        return [rect.copy() for rect in rects]
+
+    def present(self) -> None:
+        """
+        Draw the frame and push it to the display.
+        """
+        game = self.game
+        rects = self._collect_rects()
+        hud_state = self._hud_state()
+        overlay = self._overlay_rects()
+
+        if game.game_active != self._prev_active:
+            self._force_full = True
+        dirty = [pygame.Rect(r) for r in self._prev_rects ^ rects]
+        if hud_state != self._prev_hud:
+            dirty.extend(self._prev_overlay)
+            dirty.extend(overlay)
+
+        area = sum(r.width * r.height for r in dirty)
+        if self._force_full or area > self.area_limit or self.screen.scale != 1.0:
+            game._draw_background()
+            game._draw_scene()
+            self.screen.flip()
+            self.full_frames += 1
+            self._force_full = False
+        else:
+            # Restore everything drawn last frame so alpha edges never stack
+            restore = game._draw_background
+            for rect in self._prev_rects:
+                restore(rect)
+            for rect in self._prev_overlay:
+                restore(rect)
+            game._draw_scene()
+            if dirty:
+                pygame.display.update(dirty)
+            self.dirty_frames += 1
+
+        self._prev_rects = rects
+        self._prev_hud = hud_state
+        self._prev_overlay = overlay
+        self._prev_active = game.game_active
@@ -0,0 +1,111 @@
+"""
+Module: deterministic recording and replay of player input.
+
+Assets:
+- Reads/writes replay files (compact binary, see InputRecorder)
+"""
+
+import struct
+from pathlib import Path
+import pygame
+
+MAGIC   = b'AIRP'
+VERSION = 1
+
+# frame, kind, key (SDL keycodes exceed 16 bits), x, y
+RECORD = struct.Struct('<IBIhh')
+
+KIND_KEYDOWN = 1
+KIND_KEYUP   = 2
+KIND_CLICK   = 3
+KIND_QUIT    = 4
+
+class InputRecorder:
+    """
+    Record the input events the game handles, tagged with their frame number.
+
+    Each event is a 13-byte little-endian record (frame u32, kind u8,
+    key u32, x i16, y i16) after a 5-byte header. Records are buffered in
+    memory and written once by close().
+
+    Attributes:
+        path (Path): Destination file.
+        count (int): Events recorded.
+    """
+    def __init__(self, path) -> None:
+        """
+        Start an empty recording.
+        """
+        self.path   = Path(path)
+        self.count  = 0
+        self._data  = bytearray(MAGIC + bytes([VERSION]))
+        self._closed = False
+
+    def record(self, frame: int, event) -> None:
+        """
+        Append event if it is one the game reacts to.
+        """
+        if event.type == pygame.KEYDOWN:
+            packed = RECORD.pack(frame, KIND_KEYDOWN, event.key, 0, 0)
+        elif event.type == pygame.KEYUP:
+            packed = RECORD.pack(frame, KIND_KEYUP, event.key, 0, 0)
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            x, y = event.pos
+            packed = RECORD.pack(frame, KIND_CLICK, event.button, x, y)
+        elif event.type == pygame.QUIT:
+            packed = RECORD.pack(frame, KIND_QUIT, 0, 0, 0)
+        else:
+            return
+        self._data += packed
+        self.count += 1
+
+    def close(self) -> None:
+        """
+        Write the recording to disk (once).
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.path.write_bytes(bytes(self._data))
+
+class InputPlayer:
+    """
+    Feed a recording back to the game frame by frame.
+
+    Attributes:
+        last_frame (int): Frame of the final recorded event.
+        count (int): Number of recorded events.
+    """
+    def __init__(self, path) -> None:
+        """
+        Load and decode a recording made by InputRecorder.
+        """
+        data = Path(path).read_bytes()
+        if data[:4] != MAGIC or data[4] != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} replay file")
+        self._events = {}
+        self.last_frame = 0
+        self.count = 0
+        for frame, kind, key, x, y in RECORD.iter_unpack(data[5:]):
+            self._events.setdefault(frame, []).append(self._to_event(kind, key, x, y))
+            self.last_frame = frame
+            self.count += 1
+
+    @staticmethod
+    def _to_event(kind: int, key: int, x: int, y: int):
+        """
+        Rebuild the pygame event a record stands for.
+        """
+        if kind == KIND_KEYDOWN:
+            return pygame.event.Event(pygame.KEYDOWN, key=key)
+        if kind == KIND_KEYUP:
+            return pygame.event.Event(pygame.KEYUP, key=key)
+        if kind == KIND_CLICK:
+            return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=key, pos=(x, y))
+        return pygame.event.Event(pygame.QUIT)
+
+    def events_for(self, frame: int) -> list:
+        """
+        Return the events recorded at frame (possibly empty).
+        """
+        return self._events.get(frame, [])
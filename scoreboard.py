@@ -0,0 +1,89 @@
+"""
+Module: top-N leaderboard table shown under the Play button.
+
+Assets:
+- Uses RetroTech.ttf through the HUD font (see hud.py)
+"""
+
+import pygame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import AlienInvasion
+
+class Scoreboard:
+    """
+    Today's and all-time best scores, drawn from the leaderboard's cache.
+
+    The table is rendered into one surface only when the leaderboard's
+    cached lists change (its version moves on), so drawing it is one blit.
+
+    Attributes:
+        image: Rendered table surface.
+        rect: Screen position of the table, centered under the Play button.
+        version (int): Leaderboard version the image was rendered from.
+    """
+    def __init__(self, game: 'AlienInvasion') -> None:
+        """
+        Share the HUD font and render the current lists.
+        """
+        self.game        = game
+        self.screen      = game.screen
+        self.settings    = game.settings
+        self.leaderboard = game.game_stats.leaderboard
+        self.font        = game.hud.font
+        self.version     = None
+        self.image       = None
+        self.rect        = pygame.Rect(0, 0, 0, 0)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Re-render the table if the leaderboard has new results.
+        """
+        if self.version == self.leaderboard.version:
+            return
+        self.version = self.leaderboard.version
+        columns = [
+            self._column('Today', self.leaderboard.today),
+            self._column('All time', self.leaderboard.top),
+        ]
+        gap = self.font.size('    ')[0]
+        width = sum(c.get_width() for c in columns) + gap * (len(columns) - 1)
+        height = max(c.get_height() for c in columns)
+        self.image = pygame.Surface((width, height), pygame.SRCALPHA)
+        x = 0
+        for column in columns:
+            self.image.blit(column, (x, 0))
+            x += column.get_width() + gap
+        button = self.game.play_button.rect
+        self.rect = self.image.get_rect(
+            midtop=(button.centerx, button.bottom + self.font.get_linesize())
+        )
+
+    def _column(self, title: str, rows: list) -> pygame.Surface:
+        """
+        Render a title and numbered "name score" lines into one surface.
+        """
+        color = self.settings.text_color
+        lines = [title] + [
+            f"{i}. {player} {score:,}"
+            for i, (player, score, _level, _day) in enumerate(rows, 1)
+        ]
+        if not rows:
+            lines.append('-')
+        line_h = self.font.get_linesize()
+        images = [self.font.render(line, True, color) for line in lines]
+        column = pygame.Surface(
+            (max(i.get_width() for i in images), line_h * len(images)),
+            pygame.SRCALPHA
+        )
+        for n, image in enumerate(images):
+            column.blit(image, (0, n * line_h))
+        return column
+
+    def draw(self) -> None:
+        """
+        Draw the table.
+        """
+        self.screen.blit(self.image, self.rect)
@@ -9,6 +9,7 @@ Assets:
 """
 
 from pathlib import Path
+import pygame
 
 class Settings:
     """
@@ -19,6 +20,11 @@ class Settings:
         screen_w (int): Width of the game screen.
         screen_h (int): Height of the game screen.
         FPS (int): Frames per second for the game loop.
+        fixed_timestep (bool): Update at tick_rate regardless of frame rate.
+        tick_rate (int): Simulation ticks per second (speeds are per tick).
+        max_catchup_ticks (int): Most ticks run in one frame before the
+                                 backlog is dropped.
+        interpolate (bool): Draw moving sprites between their last two ticks.
         bg_file (Path): Path to background image.
         ship_file (Path): Path to ship image.
         enemy_file (Path): Path to enemy image.
@@ -27,12 +33,31 @@ class Settings:
         ship_h (int): Height of the ship sprite.
         ship_speed (float): Vertical movement speed of the ship.
         starting_ship_count (int): Number of ship lives at start.
+        enemy_w (int): Width of an enemy sprite.
+        enemy_h (int): Height of an enemy sprite.
         enemy_speed (float): Horizontal movement speed of enemies.
+        fleet_backend (str): 'sprite' (one Sprite per enemy), 'array' (NumPy)
+                             or 'massive' (world-sized wave, see massive_fleet.py).
+        massive_enemies (int): Enemies per wave in the 'massive' mode.
+        cull_margin (int): Pixels beyond the screen edges in which massive-wave
+                           enemies stay active.
+        fleet_rows (int|None): Override the number of formation rows.
+        fleet_cols (int|None): Override the number of formation columns.
+        fleet_composite (bool): Draw the formation from one cached surface.
+        formation_max_pixels (int): Largest formation area to composite.
+        bullet_w (int): Width of a bullet sprite.
+        bullet_h (int): Height of a bullet sprite.
         bullet_speed (float): Horizontal movement speed of bullets.
+        bullets_allowed (int): Cap on live bullets (size of the bullet pool).
         alien_points (int): Points awarded per alien destroyed.
         ship_side (str): Starting side of the ship ('left' or 'right').
         difficulty_scale (float): Scaling factor for difficulty.
-        scores_file (Path): Path for saving high score data.
+        scores_file (Path|None): Legacy high-score JSON, imported into the
+                                 leaderboard once if present.
+        leaderboard_file (Path): SQLite database of finished games.
+        leaderboard_size (int): Entries shown per list on the Play screen.
+        player_name (str): Name finished games are recorded under.
+        score_flush_interval (float): Seconds between background score writes.
         button_w (int): Width of the Play button.
         button_h (int): Height of the Play button.
         button_color (tuple): RGB color of the Play button.
@@ -40,6 +65,68 @@ class Settings:
         button_font_size (int): Font size for button text.
         HUD_font_size (int): Font size for HUD text.
         font_file (Path): Path to font file for UI text.
+        asset_build_dir (Path|None): Output of build_assets.py (pre-scaled
+                                     images and sprite atlas); None loads
+                                     every image from its source file.
+        input_mode (str): 'events' (react to key presses) or 'poll' (read
+                          held keys at the start of every tick).
+        autofire_interval (int): Ticks between shots while fire is held in
+                                 poll mode.
+        sound (bool): Play sound effects (never in headless runs).
+        sound_files (dict): Clip name -> sound file path.
+        sound_voices (dict): Clip name -> channels reserved for that clip.
+        sound_volume (float): Volume of every clip (0.0 - 1.0).
+        mixer_frequency (int): Mixer sample rate in Hz.
+        mixer_buffer (int): Mixer buffer size in samples (lower is less latency).
+        spectate (bool): Stream the game state to spectators (see spectate.py).
+        spectate_host (str): Interface the spectator server listens on.
+        spectate_port (int): Spectator server port.
+        spectate_keyframe_interval (int): Delta messages between keyframes.
+        spectate_max_backlog (int): Unsent bytes after which a spectator is
+                                    disconnected.
+        resume_file (Path|None): Snapshot saved on quit (and autosaved) and
+                                 restored on start (see snapshot.py).
+        autosave_interval (int): Ticks of play between resume snapshots.
+        perf_overlay_key (int): Key that toggles the frame-timing overlay.
+        perf_window (int): Frames kept by the frame timer's ring buffer.
+        perf_overlay_refresh (int): Frames between overlay text refreshes.
+        perf_font_size (int): Font size for the overlay text.
+        render_mode (str): 'full' (flip every frame) or 'dirty' (changed rects only).
+        dirty_area_limit (float): Fraction of the screen above which the
+                                  dirty renderer falls back to a full flip.
+        render_scale (float): Internal framebuffer size as a fraction of the
+                              window (see canvas.py); below 1.0 every frame
+                              is presented in full.
+        scaled_display (bool): Below full scale, let SDL stretch a reduced
+                               display (pygame.SCALED) instead of scaling
+                               the framebuffer onto a full-size one.
+        particles (bool): Draw particle effects (see particles.py).
+        particle_cap (int): Preallocated particle slots (the live maximum).
+        particle_burst (int): Particles per destroyed enemy.
+        particle_speed (float): Maximum explosion particle speed (px/tick).
+        particle_life (int): Maximum particle life in ticks.
+        particle_drag (float): Velocity kept by a particle each tick.
+        particle_size (int): Particle square size in pixels.
+        particle_trails (bool): Leave trails behind bullets and the ship.
+        particle_trail_speed (float): Maximum trail particle scatter (px/tick).
+        particle_engine_speed (float): Speed of engine trail particles away
+                                       from the ship (px/tick).
+        particle_explosion_color (tuple): RGB of explosion particles.
+        particle_trail_color (tuple): RGB of trail particles.
+        quality_governor (bool): Lower quality while frames run over the FPS
+                                 budget (see quality.py).
+        quality_steps (tuple): Quality reductions, in the order they are taken.
+        quality_window (int): Frames averaged per governor decision.
+        quality_high (float): Fraction of the frame budget above which
+                              quality steps down.
+        quality_low (float): Fraction of the frame budget below which
+                             quality may step back up.
+        quality_recover (int): Consecutive fast windows needed to step up.
+        quality_hud_interval (int): Frames between HUD text updates on the
+                                    'hud' step.
+        quality_render_scale (float): Render scale on the 'resolution' step.
+        quality_bullet_cap (int): Live bullet cap on the 'bullets' step.
+        quality_particle_cap (int): Live particle cap on the 'particles' step.
     """
     def __init__(self) -> None:
         """
@@ -50,6 +137,12 @@ class Settings:
         self.screen_h = 800
         self.FPS = 60
 
+        # Fixed-timestep simulation (see AlienInvasion.run_game)
+        self.fixed_timestep = True
+        self.tick_rate = 60
+        self.max_catchup_ticks = 5
+        self.interpolate = True
+
         # Resource file paths
         base = Path(__file__).parent / 'Assets'
         self.bg_file = base / 'images' / 'SpacePixalBackground.png'
@@ -62,8 +155,20 @@ class Settings:
         self.ship_h = 60
         self.ship_speed = 8
         self.starting_ship_count = 3
+        self.enemy_w = 70
+        self.enemy_h = 55
         self.enemy_speed = 0.8
+        self.fleet_backend = 'sprite'
+        self.fleet_rows = None
+        self.fleet_cols = None
+        self.fleet_composite = False
+        self.massive_enemies = 2000
+        self.cull_margin = 140
+        self.formation_max_pixels = 4096 * 4096
+        self.bullet_w = 15
+        self.bullet_h = 5
         self.bullet_speed = 15
+        self.bullets_allowed = 64
         self.alien_points = 50
 
         # Ship starting side
@@ -80,9 +185,80 @@ class Settings:
         # Font file path
         self.font_file = base / 'Fonts' / 'RetroTech.ttf'
 
+        # Pre-built sprite atlas (python build_assets.py); unused if missing
+        self.asset_build_dir = base / 'build'
+
+        # Input handling
+        self.input_mode = 'events'
+        self.autofire_interval = 8
+
+        # Sound effects (see audio.py)
+        self.sound = True
+        self.sound_files = {
+            'laser': base / 'sound' / 'laser.mp3',
+            'impact': base / 'sound' / 'impactSound.mp3',
+        }
+        self.sound_voices = {'laser': 4, 'impact': 4}
+        self.sound_volume = 0.5
+        self.mixer_frequency = 44100
+        self.mixer_buffer = 512
+
+        # Spectator streaming
+        self.spectate = False
+        self.spectate_host = '127.0.0.1'
+        self.spectate_port = 50765
+        self.spectate_keyframe_interval = 60
+        self.spectate_max_backlog = 1 << 20
+
+        # Resumable sessions
+        self.resume_file = None
+        self.autosave_interval = 600
+
+        # Frame-timing overlay
+        self.perf_overlay_key = pygame.K_F3
+        self.perf_window = 240
+        self.perf_overlay_refresh = 15
+        self.perf_font_size = 16
+
+        # Presentation
+        self.render_mode = 'full'
+        self.dirty_area_limit = 0.35
+        self.render_scale = 1.0
+        self.scaled_display = True
+
+        # Particle effects (see particles.py)
+        self.particles = True
+        self.particle_cap = 50000
+        self.particle_burst = 24
+        self.particle_speed = 4.0
+        self.particle_life = 40
+        self.particle_drag = 0.93
+        self.particle_size = 3
+        self.particle_trails = False
+        self.particle_trail_speed = 0.6
+        self.particle_engine_speed = 3.0
+        self.particle_explosion_color = (255, 170, 60)
+        self.particle_trail_color = (120, 190, 255)
+
+        # Adaptive quality (see quality.py)
+        self.quality_governor = True
+        self.quality_steps = ('hud', 'particles', 'background', 'resolution', 'bullets')
+        self.quality_window = 30
+        self.quality_high = 0.9
+        self.quality_low = 0.5
+        self.quality_recover = 4
+        self.quality_hud_interval = 10
+        self.quality_render_scale = 0.5
+        self.quality_bullet_cap = 16
+        self.quality_particle_cap = 5000
+
         # Scoring and difficulty
         self.difficulty_scale = 1.1
         self.scores_file = Path(__file__).parent / 'Assets' / 'file' / 'scores.json'
+        self.leaderboard_file = Path(__file__).parent / 'Assets' / 'file' / 'leaderboard.db'
+        self.leaderboard_size = 5
+        self.player_name = 'Player'
+        self.score_flush_interval = 5.0
 
     def initialize_dynamic_settings(self) -> None:
         """
@@ -5,9 +5,12 @@ Assets:
 - Uses YellowShip.png (player sprite, see settings.py)
 """
 
-import pygame
+import struct
 from settings import Settings
 
+# side (1 = left), y, prev_y, moving_up, moving_down
+SHIP_STATE = struct.Struct('<Bdd??')
+
 class Ship:
     """
     Represents the player's rocket ship.
@@ -20,6 +23,7 @@ class Ship:
         image: Rotated/scaled ship image.
         rect: Rect defining ship position.
         y (float): Precise vertical coordinate for movement.
+        prev_y (float): y before the latest update (for interpolated drawing).
         moving_up (bool), moving_down (bool): Movement flags.
     """
     def __init__(self, game) -> None:
@@ -34,18 +38,16 @@ class Ship:
         self.screen = game.screen
         self.boundaries = self.screen.get_rect()
 
-        # Load and scale the ship image
-        self.original_image = pygame.image.load(self.settings.ship_file)
-        self.original_image = pygame.transform.scale(
-            self.original_image,
-            (self.settings.ship_w, self.settings.ship_h)
-        )
+        # Shared, scaled ship image from the asset cache
+        self.size = (self.settings.ship_w, self.settings.ship_h)
+        self.original_image = game.assets.image(self.settings.ship_file, self.size)
 
         # Set orientation & position based on starting side
         self.side = self.settings.ship_side
         self._set_orientation_and_position()
 
         self.y = float(self.rect.y)
+        self.prev_y = self.y
         self.moving_up = False
         self.moving_down = False
 
@@ -54,11 +56,15 @@ class Ship:
         Rotate the ship image and place it at the appropriate edge based on self.side.
         """
         if self.side == 'left':
-            self.image = pygame.transform.rotate(self.original_image, -90)
+            self.image = self.game.assets.image(
+                self.settings.ship_file, self.size, rotation=-90
+            )
             self.rect = self.image.get_rect()
             self.rect.midleft = self.boundaries.midleft
         else:
-            self.image = pygame.transform.rotate(self.original_image, 90)
+            self.image = self.game.assets.image(
+                self.settings.ship_file, self.size, rotation=90
+            )
             self.rect = self.image.get_rect()
             self.rect.midright = self.boundaries.midright
 
@@ -75,12 +81,34 @@ class Ship:
         """
         self._set_orientation_and_position()
         self.y = float(self.rect.y)
+        self.prev_y = self.y
+
+    def save_state(self) -> bytes:
+        """
+        Pack the side, position and movement flags.
+        """
+        return SHIP_STATE.pack(
+            self.side == 'left', self.y, self.prev_y,
+            self.moving_up, self.moving_down
+        )
+
+    def load_state(self, data: bytes) -> None:
+        """
+        Restore what save_state() packed.
+        """
+        left, self.y, self.prev_y, self.moving_up, self.moving_down = (
+            SHIP_STATE.unpack(data)
+        )
+        self.side = 'left' if left else 'right'
+        self._set_orientation_and_position()
+        self.rect.y = int(self.y)
 
     def update(self) -> None:
         """
         Adjust the ship's vertical position based on movement flags,
         then re-anchor horizontally to the chosen side.
         """
+        self.prev_y = self.y
         if self.moving_up and self.rect.top > self.boundaries.top:
             self.y -= self.settings.ship_speed
         if self.moving_down and self.rect.bottom < self.boundaries.bottom:
@@ -94,6 +122,11 @@ class Ship:
 
     def draw(self) -> None:
         """
-        Draw the ship image at its current position.
+        Draw the ship image at its current (or interpolated) position.
         """
-        self.screen.blit(self.image, self.rect)
+        alpha = self.game.render_alpha
+        if alpha >= 1.0:
+            self.screen.blit(self.image, self.rect)
+            return
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        self.screen.blit(self.image, (self.rect.x, int(y)))
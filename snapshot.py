@@ -0,0 +1,234 @@
+"""
+Module: compact binary snapshots of a running game, saved and restored in place.
+
+Assets:
+- Reads/writes snapshot files (see settings.resume_file and main.py --resume)
+"""
+
+import os
+import struct
+import threading
+from pathlib import Path
+import pygame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import AlienInvasion
+
+MAGIC   = b'AISN'
+VERSION = 1
+
+# magic, version, fleet backend, game active, tick,
+# ship/enemy/bullet speed, score, max score, hi-score, level, ships left,
+# fire cooldown, fire latched, then the byte lengths of the ship, fleet
+# and bullet sections that follow
+HEADER = struct.Struct('<4sBB?QdddqqqIiH?III')
+
+BACKENDS = ('sprite', 'array', 'massive')
+
+# Queued in place of snapshot bytes to delete the file instead
+DELETE = object()
+
+def save(game: 'AlienInvasion') -> bytes:
+    """
+    Pack the whole simulation state of game into bytes.
+
+    Covers the dynamic speeds in Settings, the GameStats counters, the ship,
+    every enemy slot of the current wave and every live bullet. Rendering,
+    timing and the leaderboard are not part of a snapshot.
+    """
+    settings = game.settings
+    stats = game.game_stats
+    ship = game.ship.save_state()
+    fleet = game.enemy_fleet.save_state()
+    bullets = game.bullets.save_state()
+    header = HEADER.pack(
+        MAGIC, VERSION, BACKENDS.index(settings.fleet_backend),
+        game.game_active, game.frame,
+        settings.ship_speed, settings.enemy_speed, settings.bullet_speed,
+        int(stats.score), int(stats.max_score), int(stats.hi_score),
+        stats.level, stats.ship_left,
+        game._fire_cooldown, game._fire_latched,
+        len(ship), len(fleet), len(bullets)
+    )
+    return header + ship + fleet + bullets
+
+def restore(game: 'AlienInvasion', data: bytes) -> None:
+    """
+    Put game back into the state save() packed, without create_fleet().
+
+    The existing ship, enemies and pooled bullets are reused. Raises
+    ValueError for data that is not a snapshot, or one taken with a
+    different fleet backend.
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("snapshot is truncated")
+    (magic, version, backend, active, frame,
+     ship_speed, enemy_speed, bullet_speed,
+     score, max_score, hi_score, level, ship_left,
+     fire_cooldown, fire_latched,
+     ship_len, fleet_len, bullets_len) = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not an Alien Invasion snapshot")
+    if BACKENDS[backend] != game.settings.fleet_backend:
+        raise ValueError(
+            f"snapshot uses the {BACKENDS[backend]!r} fleet backend, "
+            f"game uses {game.settings.fleet_backend!r}"
+        )
+    if len(data) != HEADER.size + ship_len + fleet_len + bullets_len:
+        raise ValueError("snapshot is truncated")
+
+    settings = game.settings
+    settings.ship_speed   = ship_speed
+    settings.enemy_speed  = enemy_speed
+    settings.bullet_speed = bullet_speed
+    stats = game.game_stats
+    stats.score, stats.max_score = score, max_score
+    stats.hi_score = max(hi_score, stats.hi_score)
+    stats.level, stats.ship_left = level, ship_left
+
+    view = memoryview(data)
+    offset = HEADER.size
+    game.ship.load_state(view[offset:offset + ship_len])
+    offset += ship_len
+    game.enemy_fleet.load_state(view[offset:offset + fleet_len])
+    offset += fleet_len
+    game.bullets.load_state(view[offset:offset + bullets_len])
+
+    game.frame          = frame
+    game._last_autosave = frame
+    game.game_active    = active
+    game.render_alpha   = 1.0
+    game._held_keys.clear()
+    game._fire_cooldown = fire_cooldown
+    game._fire_latched  = fire_latched
+    if game.particles:
+        game.particles.clear()
+    game.hud.update_scores()
+    game.hud.update_level()
+    if game.renderer:
+        game.renderer.invalidate()
+    pygame.mouse.set_visible(not active)
+
+def _write(path, data: bytes) -> None:
+    """
+    Replace the file at path with data atomically (through a .tmp file).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(path.name + '.tmp')
+    temp.write_bytes(data)
+    os.replace(temp, path)
+
+def save_file(game: 'AlienInvasion', path) -> int:
+    """
+    Write a snapshot to path atomically; return its size in bytes.
+    """
+    data = save(game)
+    _write(path, data)
+    return len(data)
+
+def restore_file(game: 'AlienInvasion', path) -> bool:
+    """
+    Restore the snapshot at path; return False if there is no usable one.
+    """
+    try:
+        restore(game, Path(path).read_bytes())
+    except OSError:
+        return False
+    except ValueError as e:
+        print(f"Ignoring snapshot {path}: {e}")
+        return False
+    return True
+
+class SnapshotWriter:
+    """
+    Keep the resume snapshot file up to date from a background thread.
+
+    submit() packs the game on the calling thread, which only touches
+    memory, and hands the bytes to the writer thread. discard() asks for the
+    file to be deleted instead. Only the newest request matters, so one
+    still waiting is replaced rather than queued. The game loop therefore
+    never touches the file system. A failed write or delete (full or
+    read-only disk) is reported and the game carries on. close() stops the
+    thread and carries out anything still waiting.
+
+    Attributes:
+        path (Path): Snapshot file.
+        writes (int): Snapshots written.
+        errors (int): Writes or deletes that failed.
+    """
+    def __init__(self, path) -> None:
+        """
+        Start the writer thread for path.
+        """
+        self.path     = Path(path)
+        self.writes   = 0
+        self.errors   = 0
+        self._pending = None
+        self._lock    = threading.Lock()
+        self._wake    = threading.Event()
+        self._closed  = False
+        self._thread  = threading.Thread(
+            target=self._run, name='snapshot', daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, game: 'AlienInvasion') -> None:
+        """
+        Pack game now and write it to the file in the background.
+        """
+        self._request(save(game))
+
+    def discard(self) -> None:
+        """
+        Delete the file in the background (nothing left to resume).
+        """
+        self._request(DELETE)
+
+    def _request(self, job) -> None:
+        """
+        Replace the waiting job with job and wake the thread.
+        """
+        with self._lock:
+            self._pending = job
+        self._wake.set()
+
+    def close(self) -> None:
+        """
+        Stop the thread and carry out the last request (call on quit).
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        self._flush()
+
+    def _run(self) -> None:
+        """
+        Background loop: wait for a request, then carry it out.
+        """
+        while not self._closed:
+            self._wake.wait()
+            self._wake.clear()
+            if not self._closed:
+                self._flush()
+
+    def _flush(self) -> None:
+        """
+        Write or delete the file for the waiting request, if any.
+        """
+        with self._lock:
+            job, self._pending = self._pending, None
+        if job is None:
+            return
+        try:
+            if job is DELETE:
+                self.path.unlink(missing_ok=True)
+            else:
+                _write(self.path, job)
+                self.writes += 1
+        except OSError as e:
+            self.errors += 1
+            print(f"Error saving snapshot: {e}")
@@ -0,0 +1,311 @@
+"""
+Module: uniform-grid spatial hash used as a collision broad phase.
+
+Assets:
+- None (no external assets used here)
+"""
+
+import numpy as np
+
+class SpatialGrid:
+    """
+    Bucket rectangles into fixed-size cells so overlap queries only look nearby.
+
+    Each key (a sprite, an array index, ...) is stored in every cell its
+    rectangle touches. move() recomputes a key's cell span and only
+    re-buckets it when the span actually changed, so slow-moving entities
+    cost almost nothing to keep up to date.
+
+    Attributes:
+        cell_w (int): Cell width in pixels.
+        cell_h (int): Cell height in pixels.
+        columns (dict): column -> {row -> set of keys}.
+    """
+    def __init__(self, cell_w: int, cell_h: int) -> None:
+        """
+        Create an empty grid with the given cell size.
+        """
+        self.cell_w  = max(1, int(cell_w))
+        self.cell_h  = max(1, int(cell_h))
+        self.columns = {}
+        self._spans  = {}
+
+    def _span(self, rect) -> tuple:
+        """
+        Return the inclusive (c0, r0, c1, r1) cell range covered by rect.
+        """
+        x, y, w, h = rect
+        return (
+            x // self.cell_w,
+            y // self.cell_h,
+            (x + max(w, 1) - 1) // self.cell_w,
+            (y + max(h, 1) - 1) // self.cell_h,
+        )
+
+    def _add(self, key, span: tuple) -> None:
+        """
+        Put key into every cell of span.
+        """
+        c0, r0, c1, r1 = span
+        columns = self.columns
+        for c in range(c0, c1 + 1):
+            column = columns.get(c)
+            if column is None:
+                column = columns[c] = {}
+            for r in range(r0, r1 + 1):
+                cell = column.get(r)
+                if cell is None:
+                    cell = column[r] = set()
+                cell.add(key)
+
+    def _discard(self, key, span: tuple) -> None:
+        """
+        Take key out of every cell of span, dropping emptied cells.
+        """
+        c0, r0, c1, r1 = span
+        columns = self.columns
+        for c in range(c0, c1 + 1):
+            column = columns[c]
+            for r in range(r0, r1 + 1):
+                cell = column[r]
+                cell.discard(key)
+                if not cell:
+                    del column[r]
+            if not column:
+                del columns[c]
+
+    def insert(self, key, rect) -> None:
+        """
+        Add key covering rect (anything unpackable as x, y, w, h).
+        """
+        if key in self._spans:
+            self.move(key, rect)
+            return
+        span = self._span(rect)
+        self._spans[key] = span
+        self._add(key, span)
+
+    def move(self, key, rect) -> bool:
+        """
+        Update key to cover rect; return True if it changed cells.
+        """
+        span = self._span(rect)
+        old = self._spans.get(key)
+        if old == span:
+            return False
+        if old is not None:
+            self._discard(key, old)
+        self._spans[key] = span
+        self._add(key, span)
+        return True
+
+    def remove(self, key) -> None:
+        """
+        Remove key from the grid if present.
+        """
+        span = self._spans.pop(key, None)
+        if span is not None:
+            self._discard(key, span)
+
+    def clear(self) -> None:
+        """
+        Remove every key.
+        """
+        self.columns.clear()
+        self._spans.clear()
+
+    @staticmethod
+    def _select(mapping: dict, lo, hi) -> list:
+        """
+        Return the values of mapping whose integer key lies in [lo, hi].
+
+        None means unbounded. Walks whichever is smaller: the key range or
+        the occupied keys.
+        """
+        if lo is not None and hi is not None and hi - lo < len(mapping):
+            return [mapping[k] for k in range(lo, hi + 1) if k in mapping]
+        return [
+            value for k, value in mapping.items()
+            if (lo is None or k >= lo) and (hi is None or k <= hi)
+        ]
+
+    def query_bounds(self, left=None, top=None, right=None, bottom=None) -> set:
+        """
+        Return keys in cells overlapping the pixel bounds (None = unbounded).
+
+        right and bottom are inclusive pixel coordinates.
+        """
+        c0 = None if left is None else left // self.cell_w
+        c1 = None if right is None else right // self.cell_w
+        r0 = None if top is None else top // self.cell_h
+        r1 = None if bottom is None else bottom // self.cell_h
+        found = set()
+        for column in self._select(self.columns, c0, c1):
+            for cell in self._select(column, r0, r1):
+                found |= cell
+        return found
+
+    def query(self, rect) -> set:
+        """
+        Return candidate keys whose cells overlap rect.
+        """
+        c0, r0, c1, r1 = self._span(rect)
+        columns = self.columns
+        found = set()
+        for c in range(c0, c1 + 1):
+            column = columns.get(c)
+            if column is None:
+                continue
+            for r in range(r0, r1 + 1):
+                cell = column.get(r)
+                if cell:
+                    found |= cell
+        return found
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __contains__(self, key) -> bool:
+        return key in self._spans
+
+class ArrayGrid:
+    """
+    Uniform grid over arrays of equal-sized rectangles, built in bulk with NumPy.
+
+    build() bins every key into the cells its rectangle covers and sorts the
+    (cell, key) pairs by cell, column by column, so any cell (and any run of
+    whole columns) is a single slice found with np.searchsorted. A cell is
+    turned into a Python list the first time it is queried, so the small
+    queries of the collision loop are plain dict lookups like SpatialGrid's.
+    There is no per-key update: an owner whose rectangles
+    move together queries with bounds shifted back by how far they moved
+    since build(), and only rebuilds when they have spread apart (see
+    ArrayEnemyFleet). Keys of removed rectangles stay in the grid until the
+    next build(), so owners filter what query_bounds() returns.
+
+    Attributes:
+        cell_w (int): Cell width in pixels.
+        cell_h (int): Cell height in pixels.
+    """
+    def __init__(self, cell_w: int, cell_h: int) -> None:
+        """
+        Create an empty grid with the given cell size.
+        """
+        self.cell_w = max(1, int(cell_w))
+        self.cell_h = max(1, int(cell_h))
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Remove every key.
+        """
+        self._cells = np.empty(0, dtype=np.int64)
+        self._keys  = np.empty(0, dtype=np.int64)
+        self._col0  = 0
+        self._col1  = -1
+        self._row0  = 0
+        self._rows  = 1
+        self._memo  = {}
+
+    def build(self, keys, xs, ys, w: int, h: int) -> None:
+        """
+        Replace the contents with keys[i] covering (xs[i], ys[i], w, h).
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        if not keys.size:
+            self.clear()
+            return
+        xs = np.asarray(xs, dtype=np.int64)
+        ys = np.asarray(ys, dtype=np.int64)
+        c0, c1 = xs // self.cell_w, (xs + max(w, 1) - 1) // self.cell_w
+        r0, r1 = ys // self.cell_h, (ys + max(h, 1) - 1) // self.cell_h
+
+        # One entry per covered cell: every rect has the same size, so it
+        # spans the same few columns and rows (or one fewer) as every other
+        cols, rows, owners = [], [], []
+        for dc in range(int((c1 - c0).max()) + 1):
+            for dr in range(int((r1 - r0).max()) + 1):
+                covers = (c0 + dc <= c1) & (r0 + dr <= r1)
+                cols.append(c0[covers] + dc)
+                rows.append(r0[covers] + dr)
+                owners.append(keys[covers])
+        cols, rows, owners = np.concatenate(cols), np.concatenate(rows), np.concatenate(owners)
+
+        self._col0, self._col1 = int(cols.min()), int(cols.max())
+        self._row0 = int(rows.min())
+        self._rows = int(rows.max()) - self._row0 + 1
+        cells = (cols - self._col0) * self._rows + (rows - self._row0)
+        order = np.argsort(cells, kind='stable')
+        self._cells = cells[order]
+        self._keys  = owners[order]
+        self._memo  = {}
+
+    def _cell(self, cell: int) -> list:
+        """
+        Return the keys in one cell (by its index in the sorted order).
+        """
+        keys = self._memo.get(cell)
+        if keys is None:
+            search = self._cells.searchsorted
+            keys = self._keys[search(cell):search(cell, 'right')].tolist()
+            self._memo[cell] = keys
+        return keys
+
+    def query_bounds(self, left=None, top=None, right=None, bottom=None) -> set:
+        """
+        Return keys in cells overlapping the pixel bounds (None = unbounded).
+
+        right and bottom are inclusive pixel coordinates.
+        """
+        c0 = self._col0 if left is None else max(left // self.cell_w, self._col0)
+        c1 = self._col1 if right is None else min(right // self.cell_w, self._col1)
+        r0 = 0 if top is None else max(top // self.cell_h - self._row0, 0)
+        r1 = self._rows - 1 if bottom is None else min(
+            bottom // self.cell_h - self._row0, self._rows - 1
+        )
+        if c0 > c1 or r0 > r1:
+            return set()
+        rows = self._rows
+        first = (c0 - self._col0) * rows
+        last = first + (c1 - c0 + 1) * rows
+        if r0 == 0 and r1 == rows - 1:
+            # Whole columns are one run of cells
+            search = self._cells.searchsorted
+            return set(self._keys[search(first):search(last)].tolist())
+        return self.query(
+            c0 * self.cell_w, (r0 + self._row0) * self.cell_h,
+            c1 * self.cell_w, (r1 + self._row0) * self.cell_h
+        )
+
+    def query(self, left: int, top: int, right: int, bottom: int) -> set:
+        """
+        Return keys in cells overlapping the inclusive pixel bounds.
+
+        The fast path for small areas (bullets, the ship).
+        """
+        rows = self._rows
+        r0 = top // self.cell_h - self._row0
+        r1 = bottom // self.cell_h - self._row0
+        if r0 < 0:
+            r0 = 0
+        if r1 >= rows:
+            r1 = rows - 1
+        c0 = left // self.cell_w - self._col0
+        c1 = right // self.cell_w - self._col0
+        if c0 < 0:
+            c0 = 0
+        if c1 > self._col1 - self._col0:
+            c1 = self._col1 - self._col0
+        memo = self._memo
+        found = set()
+        for start in range(c0 * rows, (c1 + 1) * rows, rows):
+            for index in range(start + r0, start + r1 + 1):
+                keys = memo.get(index)
+                if keys is None:
+                    keys = self._cell(index)
+                if keys:
+                    found.update(keys)
+        return found
+
+    def __len__(self) -> int:
+        return len(self._keys)
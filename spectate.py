@@ -0,0 +1,459 @@
+"""
+Module: state streaming to spectators over TCP, and a reference viewer.
+
+Start a game that accepts spectators, then connect a viewer:
+    python main.py --spectate
+    python spectate.py [--host 127.0.0.1] [--port 50765]
+
+Protocol (all little-endian). On connect the server sends HELLO (magic,
+version, screen, enemy, ship and bullet sizes). After that every message
+is a u32 byte length followed by HEADER and a zlib-compressed body:
+    keyframe: x i32[n], y i32[n], alive u8[n], bullets i16[2b]
+    delta:    dx i32[n], dy i32[n], dalive u8[n], bullets i16[2b]
+where n and b are the enemy and bullet counts in the header, and deltas
+are against the previous message (x - prev_x, alive ^ prev_alive). A
+rigid fleet makes every delta array nearly constant, so deltas compress
+to a few dozen bytes however many enemies there are.
+
+Assets:
+- The viewer draws with the game's images and font (see settings.py)
+"""
+
+import sys
+import zlib
+import socket
+import struct
+import argparse
+import selectors
+import threading
+import numpy as np
+import pygame
+from typing import TYPE_CHECKING
+from settings import Settings
+from asset_cache import AssetCache
+
+if TYPE_CHECKING:
+    from main import AlienInvasion
+
+MAGIC   = b'AISP'
+VERSION = 1
+
+# magic, version, screen w/h, enemy w/h, ship w/h, bullet w/h
+HELLO  = struct.Struct('<4sBHHHHHHHH')
+LENGTH = struct.Struct('<I')
+# kind, tick, score, level, lives, ship y, flags, enemies, bullets
+HEADER = struct.Struct('<BIIHBhBII')
+
+KIND_KEYFRAME = 1
+KIND_DELTA    = 2
+
+FLAG_ACTIVE = 1
+FLAG_LEFT   = 2
+
+def capture(game: 'AlienInvasion') -> tuple:
+    """
+    Copy the state spectators see: (tick, score, level, lives, ship y, flags,
+    xs, ys, alive, bullets).
+    """
+    stats = game.game_stats
+    flags = (FLAG_ACTIVE if game.game_active else 0) | (
+        FLAG_LEFT if game.ship.side == 'left' else 0
+    )
+    xs, ys, alive = game.enemy_fleet.state()
+    bullets = np.array(
+        [(b.rect.x, b.rect.y) for b in game.bullets.sprites()], dtype=np.int16
+    ).reshape(-1, 2)
+    return (
+        game.frame, int(stats.score), stats.level, stats.ship_left,
+        game.ship.rect.y, flags, xs, ys, alive, bullets
+    )
+
+class StateEncoder:
+    """
+    Turn captured states into keyframe or delta messages.
+
+    Attributes:
+        interval (int): Messages between scheduled keyframes.
+        keyframes (int), deltas (int): Messages of each kind encoded.
+    """
+    def __init__(self, interval: int = 60) -> None:
+        """
+        Start with no previous state, so the first message is a keyframe.
+        """
+        self.interval  = interval
+        self.keyframes = 0
+        self.deltas    = 0
+        self._prev     = None
+        self._since    = 0
+
+    def encode(self, state: tuple, keyframe: bool = False) -> tuple:
+        """
+        Return (message bytes, is keyframe) for a captured state.
+
+        A keyframe is sent when asked for, every interval messages, and
+        whenever the number of enemies changes (a new wave layout).
+        """
+        tick, score, level, lives, ship_y, flags, xs, ys, alive, bullets = state
+        prev = self._prev
+        keyframe = (keyframe or prev is None or self._since >= self.interval
+                    or len(prev[0]) != len(xs))
+        if keyframe:
+            body = (xs.tobytes() + ys.tobytes() + alive.tobytes())
+            self.keyframes += 1
+            self._since = 0
+        else:
+            body = ((xs - prev[0]).tobytes() + (ys - prev[1]).tobytes()
+                    + (alive ^ prev[2]).tobytes())
+            self.deltas += 1
+            self._since += 1
+        self._prev = (xs, ys, alive)
+        payload = HEADER.pack(
+            KIND_KEYFRAME if keyframe else KIND_DELTA, tick, score, level,
+            lives, ship_y, flags, len(xs), len(bullets)
+        ) + zlib.compress(body + bullets.tobytes(), 1)
+        return LENGTH.pack(len(payload)) + payload, keyframe
+
+class StateDecoder:
+    """
+    Rebuild the game state from a stream of messages.
+
+    Deltas are ignored until the first keyframe arrives.
+
+    Attributes:
+        tick, score, level, lives, ship_y (int): Latest header values.
+        active (bool), side (str): Game running and ship side.
+        xs, ys (ndarray), alive (ndarray): Enemy slots.
+        bullets (ndarray): (b, 2) bullet positions.
+        synced (bool): Whether a keyframe has been applied.
+    """
+    def __init__(self) -> None:
+        """
+        Start unsynced with an empty state.
+        """
+        self.synced  = False
+        self.tick    = self.score = self.level = self.lives = self.ship_y = 0
+        self.active  = False
+        self.side    = 'right'
+        self.xs      = self.ys = np.zeros(0, dtype=np.int32)
+        self.alive   = np.zeros(0, dtype=bool)
+        self.bullets = np.zeros((0, 2), dtype=np.int16)
+
+    def apply(self, payload: bytes) -> bool:
+        """
+        Apply one message (without its length prefix); return False if skipped.
+        """
+        (kind, tick, score, level, lives, ship_y, flags,
+         n, b) = HEADER.unpack_from(payload)
+        if kind == KIND_DELTA and (not self.synced or n != len(self.xs)):
+            return False
+        body = zlib.decompress(payload[HEADER.size:])
+        xs = np.frombuffer(body, np.int32, n, 0)
+        ys = np.frombuffer(body, np.int32, n, 4 * n)
+        alive = np.frombuffer(body, bool, n, 8 * n)
+        if kind == KIND_KEYFRAME:
+            self.xs, self.ys, self.alive = xs.copy(), ys.copy(), alive.copy()
+            self.synced = True
+        else:
+            self.xs = self.xs + xs
+            self.ys = self.ys + ys
+            self.alive = self.alive ^ alive
+        self.bullets = np.frombuffer(body, np.int16, 2 * b, 9 * n).reshape(-1, 2)
+        self.tick, self.score, self.level = tick, score, level
+        self.lives, self.ship_y = lives, ship_y
+        self.active = bool(flags & FLAG_ACTIVE)
+        self.side = 'left' if flags & FLAG_LEFT else 'right'
+        return True
+
+class SpectatorServer:
+    """
+    Publish the game state to every connected spectator without blocking.
+
+    publish() runs on the game thread after each tick. It only copies the
+    state (and only when someone is watching) and hands it to the publisher
+    thread, replacing any state that thread has not picked up yet. The
+    thread accepts connections, encodes the newest state and writes it to
+    non-blocking sockets, so a slow or stalled viewer never delays a tick.
+    New viewers are brought in with a keyframe; a viewer that falls more
+    than settings.spectate_max_backlog bytes behind is disconnected.
+
+    Attributes:
+        port (int): Port actually bound (useful with port 0).
+        clients (int): Connected spectators.
+        published (int): States handed over by publish().
+        skipped (int): States replaced before they were encoded.
+        bytes_sent (int): Bytes written to sockets.
+    """
+    def __init__(self, game: 'AlienInvasion') -> None:
+        """
+        Bind the listening socket and start the publisher thread.
+        """
+        settings        = game.settings
+        self.game       = game
+        self.encoder    = StateEncoder(settings.spectate_keyframe_interval)
+        self.backlog    = settings.spectate_max_backlog
+        self.listener   = socket.create_server(
+            (settings.spectate_host, settings.spectate_port)
+        )
+        self.listener.setblocking(False)
+        self.port       = self.listener.getsockname()[1]
+        self.hello      = HELLO.pack(
+            MAGIC, VERSION, settings.screen_w, settings.screen_h,
+            settings.enemy_w, settings.enemy_h, settings.ship_w,
+            settings.ship_h, settings.bullet_w, settings.bullet_h
+        )
+        self.clients    = 0
+        self.published  = 0
+        self.skipped    = 0
+        self.bytes_sent = 0
+        self._clients   = []  # [socket, pending bytearray, synced]
+        self._latest    = None
+        self._lock      = threading.Lock()
+        self._wake      = threading.Event()
+        self._closed    = False
+        self._thread    = threading.Thread(
+            target=self._run, name='spectators', daemon=True
+        )
+        self._thread.start()
+
+    def publish(self) -> None:
+        """
+        Hand the current state to the publisher thread (game thread).
+        """
+        if not self.clients:
+            return
+        state = capture(self.game)
+        with self._lock:
+            if self._latest is not None:
+                self.skipped += 1
+            self._latest = state
+        self.published += 1
+        self._wake.set()
+
+    def close(self) -> None:
+        """
+        Stop the publisher thread and disconnect everyone.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        for client in self._clients:
+            client[0].close()
+        self._clients.clear()
+        self.listener.close()
+
+    def _run(self) -> None:
+        """
+        Publisher loop: accept, encode the newest state, write what we can.
+        """
+        while not self._closed:
+            # Wake on a new state, or periodically to accept and drain
+            self._wake.wait(0.05)
+            self._wake.clear()
+            self._accept()
+            with self._lock:
+                state, self._latest = self._latest, None
+            if state is not None and self._clients:
+                self._queue(state)
+            self._flush()
+
+    def _accept(self) -> None:
+        """
+        Take every pending connection and greet it.
+        """
+        while True:
+            try:
+                sock, _ = self.listener.accept()
+            except (BlockingIOError, OSError):
+                return
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._clients.append([sock, bytearray(self.hello), False])
+            self.clients = len(self._clients)
+
+    def _queue(self, state: tuple) -> None:
+        """
+        Encode state once and queue it for every client that can use it.
+        """
+        resync = any(not synced for _, _, synced in self._clients)
+        message, keyframe = self.encoder.encode(state, keyframe=resync)
+        for client in self._clients:
+            if keyframe or client[2]:
+                client[1] += message
+                client[2] = True
+
+    def _flush(self) -> None:
+        """
+        Write pending bytes without blocking; drop dead or hopelessly slow clients.
+        """
+        kept = []
+        for client in self._clients:
+            sock, pending, _ = client
+            try:
+                if pending:
+                    sent = sock.send(pending)
+                    del pending[:sent]
+                    self.bytes_sent += sent
+            except BlockingIOError:
+                pass
+            except OSError:
+                sock.close()
+                continue
+            if len(pending) > self.backlog:
+                sock.close()
+                continue
+            kept.append(client)
+        self._clients = kept
+        self.clients = len(kept)
+
+class SpectatorClient:
+    """
+    Connection to a SpectatorServer that keeps a decoded copy of the state.
+
+    Attributes:
+        hello (tuple): Unpacked HELLO fields (sizes start at index 2).
+        state (StateDecoder): Latest known game state.
+        messages (int), bytes (int): Messages and bytes received.
+    """
+    def __init__(self, host: str, port: int) -> None:
+        """
+        Connect and read the server's HELLO.
+        """
+        self.sock     = socket.create_connection((host, port))
+        self.state    = StateDecoder()
+        self.messages = 0
+        self.bytes    = 0
+        self._buffer  = bytearray()
+        self.hello    = HELLO.unpack(self._read_exactly(HELLO.size))
+        if self.hello[0] != MAGIC or self.hello[1] != VERSION:
+            raise ValueError("not an Alien Invasion spectator stream")
+
+    def _read_exactly(self, size: int) -> bytes:
+        """
+        Block until size bytes are buffered and return them.
+        """
+        while len(self._buffer) < size:
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                raise ConnectionError("spectator stream closed")
+            self._buffer += chunk
+            self.bytes += len(chunk)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def receive(self) -> None:
+        """
+        Block for the next message and apply it.
+        """
+        size, = LENGTH.unpack(self._read_exactly(LENGTH.size))
+        self.state.apply(self._read_exactly(size))
+        self.messages += 1
+
+    def poll(self, timeout: float = 0.0) -> int:
+        """
+        Apply every message that arrives within timeout; return how many.
+        """
+        count = 0
+        selector = selectors.DefaultSelector()
+        selector.register(self.sock, selectors.EVENT_READ)
+        while selector.select(timeout):
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                raise ConnectionError("spectator stream closed")
+            self._buffer += chunk
+            self.bytes += len(chunk)
+            timeout = 0.0
+            while len(self._buffer) >= LENGTH.size:
+                size, = LENGTH.unpack_from(self._buffer)
+                if len(self._buffer) < LENGTH.size + size:
+                    break
+                payload = bytes(self._buffer[LENGTH.size:LENGTH.size + size])
+                del self._buffer[:LENGTH.size + size]
+                self.state.apply(payload)
+                self.messages += 1
+                count += 1
+        selector.close()
+        return count
+
+    def close(self) -> None:
+        """
+        Disconnect.
+        """
+        self.sock.close()
+
+def view(host: str, port: int, frames: int = 0) -> SpectatorClient:
+    """
+    Show a spectator window until it is closed (or for frames frames).
+    """
+    client = SpectatorClient(host, port)
+    _, _, screen_w, screen_h, enemy_w, enemy_h, ship_w, ship_h, bullet_w, bullet_h = client.hello
+    settings = Settings()
+    pygame.init()
+    screen = pygame.display.set_mode((screen_w, screen_h))
+    pygame.display.set_caption(f"{settings.name} - spectating {host}:{port}")
+    assets = AssetCache(settings.asset_build_dir)
+    bg = assets.image(settings.bg_file, (screen_w, screen_h), opaque=True)
+    enemy = assets.image(settings.enemy_file, (enemy_w, enemy_h))
+    bullet = assets.image(settings.bullet_file, (bullet_w, bullet_h))
+    ships = {
+        'right': assets.image(settings.ship_file, (ship_w, ship_h), rotation=90),
+        'left': assets.image(settings.ship_file, (ship_w, ship_h), rotation=-90),
+    }
+    font = pygame.font.Font(str(settings.font_file), settings.HUD_font_size)
+    clock = pygame.time.Clock()
+
+    shown = 0
+    while not frames or shown < frames:
+        if any(event.type == pygame.QUIT for event in pygame.event.get()):
+            break
+        try:
+            client.poll(0.0)
+        except ConnectionError:
+            break
+        state = client.state
+        screen.blit(bg, (0, 0))
+        if state.synced:
+            living = np.flatnonzero(state.alive)
+            screen.blits(
+                [(enemy, (x, y)) for x, y in zip(state.xs[living].tolist(),
+                                                  state.ys[living].tolist())],
+                False
+            )
+            screen.blits([(bullet, tuple(p)) for p in state.bullets.tolist()], False)
+            ship = ships[state.side]
+            x = 0 if state.side == 'left' else screen_w - ship.get_width()
+            screen.blit(ship, (x, state.ship_y))
+            text = (f"Score {state.score:,}   Level {state.level}   "
+                    f"Lives {state.lives}" + ('' if state.active else '   (menu)'))
+        else:
+            text = 'Waiting for the next keyframe...'
+        screen.blit(font.render(text, True, settings.text_color), (20, 20))
+        pygame.display.flip()
+        clock.tick(settings.FPS)
+        shown += 1
+    client.close()
+    pygame.quit()
+    return client
+
+def main(argv=None) -> None:
+    """
+    Run the reference viewer and report what it received.
+    """
+    parser = argparse.ArgumentParser(description='Alien Invasion spectator viewer')
+    parser.add_argument('--host', default='127.0.0.1', help='game host')
+    parser.add_argument('--port', type=int, default=Settings().spectate_port,
+                        help='game spectator port')
+    parser.add_argument('--frames', type=int, default=0,
+                        help='stop after this many frames (0 = until closed)')
+    args = parser.parse_args(argv)
+    try:
+        client = view(args.host, args.port, args.frames)
+    except (ConnectionError, ValueError) as e:
+        print(f"Cannot spectate: {e}")
+        sys.exit(1)
+    print(f"{client.messages} messages, {client.bytes:,} bytes received")
+
+if __name__ == '__main__':
+    main()